@@ -0,0 +1,38 @@
+"""Compares generate_batch against calling minesweeper_with_adjacent_mines in a loop.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_batch
+"""
+import sys
+import time
+
+from src.batch import generate_batch
+from src.main_v2 import minesweeper_with_adjacent_mines
+
+CASES = [
+    ((9, 9), 2000),
+    ((16, 16), 2000),
+    ((16, 30), 1000),
+    ((100, 100), 100),
+]
+DENSITY = 0.2
+
+def boards_per_second(generate, n):
+    start = time.perf_counter()
+    generate(n)
+    return n / (time.perf_counter() - start)
+
+def loop_baseline(shape, n):
+    for _ in range(n):
+        minesweeper_with_adjacent_mines(list(shape))
+
+def main():
+    print(f"{'shape':>10} {'n':>6} {'loop boards/s':>15} {'batch boards/s':>15} {'speedup':>8}")
+    for shape, n in CASES:
+        loop_rate = boards_per_second(lambda count: loop_baseline(shape, count), n)
+        batch_rate = boards_per_second(lambda count: generate_batch(shape, count, DENSITY, seed=0), n)
+        label = f"{shape[0]}x{shape[1]}"
+        print(f"{label:>10} {n:>6} {loop_rate:>15.0f} {batch_rate:>15.0f} {batch_rate / loop_rate:>7.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
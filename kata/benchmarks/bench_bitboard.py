@@ -0,0 +1,44 @@
+"""Compares neighbour counting with tuples and a defaultdict (as in main_v2) against
+bit-sliced counting on a MineBitmap, for both the 4-way and the 8-way neighbourhood.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_bitboard
+"""
+import random
+import sys
+import time
+from collections import defaultdict
+
+from src.bitboard import MineBitmap, neighbour_planes
+from src.main_v2 import get_adjacent_positions, sample_positions
+
+CASES = [(100, 100), (500, 2000), (200, 10000)]
+DENSITY = 0.25
+
+def count_with_defaultdict(mines, rows, cols, include_diagonals):
+    counts = defaultdict(int)
+    for i, j in mines:
+        for ni, nj in get_adjacent_positions(i, j, rows, cols, include_diagonals=include_diagonals):
+            if (ni, nj) not in mines:
+                counts[(ni, nj)] += 1
+    return counts
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'shape':>11} {'mode':>5} {'defaultdict s':>14} {'bitboard s':>11} {'speedup':>8}")
+    for rows, cols in CASES:
+        mines = set(sample_positions(rows, cols, round(rows * cols * DENSITY), random.Random(0)))
+        bitmap = MineBitmap.from_positions(rows, cols, mines)
+        for include_diagonals in (False, True):
+            slow = timed(count_with_defaultdict, mines, rows, cols, include_diagonals)
+            fast = timed(neighbour_planes, bitmap, include_diagonals)
+            label = f"{rows}x{cols}"
+            mode = "8-way" if include_diagonals else "4-way"
+            print(f"{label:>11} {mode:>5} {slow:>14.3f} {fast:>11.4f} {slow / fast:>7.0f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
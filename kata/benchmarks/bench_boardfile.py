@@ -0,0 +1,59 @@
+"""Compares loading a JSONL dump with memory-mapping a packed board file, for 200,000 16x30 boards.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_boardfile
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.boardfile import BoardFile, PackedBoardWriter
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.streaming import JsonlWriter, read_jsonl
+
+ROWS, COLS = 16, 30
+COUNT = 200_000
+DISTINCT = 1000
+PICKS = 1000
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def write_packed(path, boards, with_counts):
+    with PackedBoardWriter(path, ROWS, COLS, with_counts=with_counts) as writer:
+        writer.write_all(boards)
+
+def main():
+    rng = random.Random(0)
+    grids = [minesweeper_with_adjacent_mines([ROWS, COLS], rng=rng, num_mines=99) for _ in range(DISTINCT)]
+    boards = [grids[k % DISTINCT] for k in range(COUNT)]
+    picks = [rng.randrange(COUNT) for _ in range(PICKS)]
+    with tempfile.TemporaryDirectory() as directory:
+        jsonl = os.path.join(directory, "boards.jsonl")
+        with JsonlWriter(jsonl) as writer:
+            writer.write_all(boards)
+        loaded, seconds = timed(lambda: list(read_jsonl(jsonl)))
+        print(f"{'jsonl':>16}: {os.path.getsize(jsonl) / 2**20:7.1f} MiB, full load {seconds:7.3f}s")
+        del loaded
+
+        for with_counts in (True, False):
+            path = os.path.join(directory, f"boards-{with_counts}.mswp")
+            _, write_seconds = timed(lambda: write_packed(path, boards, with_counts))
+            board_file, open_seconds = timed(lambda: BoardFile(path))
+            _, view_seconds = timed(lambda: [board_file[k] for k in picks])
+            _, list_seconds = timed(lambda: [board_file[k].to_lists() for k in picks])
+            assert board_file[picks[0]].to_lists() == boards[picks[0]]
+            board_file.close()
+            label = "packed+counts" if with_counts else "packed bitmap"
+            print(
+                f"{label:>16}: {os.path.getsize(path) / 2**20:7.1f} MiB, open {open_seconds * 1e3:6.2f}ms, "
+                f"{PICKS} views {view_seconds * 1e3:6.2f}ms, {PICKS} to_lists {list_seconds * 1e3:7.2f}ms "
+                f"(write {write_seconds:.2f}s)"
+            )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
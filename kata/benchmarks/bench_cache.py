@@ -0,0 +1,52 @@
+"""Measures board latency with and without BoardCache for skewed traffic: most requests ask for
+a few hot configurations and the rest for cold ones. Requests are spaced out by THINK_TIME, as
+if the caller did other work, which gives the refill thread time to top up.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_cache
+"""
+import random
+import statistics
+import sys
+import time
+
+from src.cache import BoardCache
+from src.main_v2 import counting_generator
+
+HOT = [([16, 30], 99, 8), ([16, 16], 40, 8), ([9, 9], 10, 8), ([30, 30], 180, 4)]
+REQUESTS = 2000
+COLD_FRACTION = 0.1
+THINK_TIME = 0.001
+
+def workload(seed=0):
+    rng = random.Random(seed)
+    for _ in range(REQUESTS):
+        if rng.random() < COLD_FRACTION:
+            rows, cols = rng.randint(5, 40), rng.randint(5, 40)
+            yield [rows, cols], rows * cols // 6, rng.choice((4, 8))
+        else:
+            yield rng.choice(HOT)
+
+def latencies(get):
+    result = []
+    for gridSize, num_mines, neighbourhood in workload():
+        start = time.perf_counter()
+        get(gridSize, num_mines, neighbourhood)
+        result.append(time.perf_counter() - start)
+        time.sleep(THINK_TIME)
+    return sorted(result)
+
+def report(label, values):
+    p50, p99 = statistics.median(values), values[int(0.99 * len(values))]
+    print(f"{label:>8}: p50 {p50 * 1e3:6.3f}ms  p99 {p99 * 1e3:6.3f}ms  mean {statistics.fmean(values) * 1e3:6.3f}ms")
+
+def main():
+    report("inline", latencies(lambda gridSize, num_mines, n: counting_generator(n)(gridSize, num_mines=num_mines)))
+    with BoardCache(reservoir_size=16, memory_cap=4 << 20, max_keys=32) as cache:
+        for gridSize, num_mines, neighbourhood in HOT:
+            cache.warm(gridSize, num_mines, neighbourhood)
+        report("cached", latencies(cache.get))
+        print(f"   stats: {cache.stats()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Measures interpreter startup and per-board cost of the run.sh style `python -c` snippet, a
+single `python -m src.cli` invocation, and batch mode producing many boards in one process.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_cli
+"""
+import os
+import subprocess
+import sys
+import time
+
+INVOCATIONS = 20
+BATCH_JOBS = 10_000
+
+SNIPPET = """from src.main_v2 import minesweeper_with_adjacent_mines
+def print_grid(grid):
+    for row in grid:
+        print(' '.join(str(cell) for cell in row))
+grid = minesweeper_with_adjacent_mines([10, 6])
+print('Grid:')
+print_grid(grid)
+"""
+
+def run(argv, stdin=None):
+    env = dict(os.environ, PYTHONPATH=".")
+    start = time.perf_counter()
+    subprocess.run(argv, input=stdin, env=env, check=True, stdout=subprocess.DEVNULL, text=True)
+    return time.perf_counter() - start
+
+def per_invocation(argv):
+    return sum(run(argv) for _ in range(INVOCATIONS)) / INVOCATIONS
+
+def main():
+    bare = per_invocation([sys.executable, "-c", "pass"])
+    snippet = per_invocation([sys.executable, "-c", SNIPPET])
+    cli = per_invocation([sys.executable, "-m", "src.cli", "adjacent_grid", "10x6"])
+    help_only = per_invocation([sys.executable, "-m", "src.cli", "--help"])
+    batch = run([sys.executable, "-m", "src.cli", "batch"], "adjacent_grid 10x6\n" * BATCH_JOBS)
+    print(f"{'bare interpreter':>26}: {bare * 1e3:7.1f} ms")
+    print(f"{'run.sh python -c snippet':>26}: {snippet * 1e3:7.1f} ms per board")
+    print(f"{'python -m src.cli --help':>26}: {help_only * 1e3:7.1f} ms")
+    print(f"{'python -m src.cli':>26}: {cli * 1e3:7.1f} ms per board")
+    print(f"{'batch':>26}: {batch / BATCH_JOBS * 1e3:7.3f} ms per board ({BATCH_JOBS} boards in {batch:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
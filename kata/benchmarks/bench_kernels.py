@@ -0,0 +1,41 @@
+"""Measures the one-pass kernel engine (kernel_counts) against counting mine by mine
+(sparse_kernel_counts), for the built-in kernels, a wrapping kernel and a custom one.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_kernels
+"""
+import random
+import sys
+import time
+
+from src.board import MINE
+from src.kernels import KNIGHT, MOORE, ORTHOGONAL, Kernel, kernel_counts, sparse_kernel_counts
+from src.main_v2 import mines_for_density, sample_indices
+
+SHAPES = [(16, 30, 200), (100, 100, 50), (1000, 1000, 2)]
+DENSITIES = [0.05, 0.2]
+KERNELS = [ORTHOGONAL, MOORE, MOORE.wrapped(), KNIGHT, Kernel([(0, 2), (0, -2), (2, 0), (-2, 0)], name="two-step")]
+
+def seconds_per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    print(f"{'shape':>9} {'density':>7} {'kernel':>16} {'per mine ms':>11} {'one pass ms':>11} {'speedup':>8}")
+    for rows, cols, repeat in SHAPES:
+        for density in DENSITIES:
+            mines = sample_indices(rows * cols, mines_for_density(rows * cols, density), random.Random(0))
+            cells = bytearray(rows * cols)
+            for index in mines:
+                cells[index] = MINE
+            for kernel in KERNELS:
+                per_mine = seconds_per_call(lambda: sparse_kernel_counts(mines, rows, cols, kernel), repeat)
+                one_pass = seconds_per_call(lambda: kernel_counts(cells, rows, cols, kernel), repeat)
+                label = f"{rows}x{cols}"
+                name = kernel.name + (" wrap" if kernel.wrap else "")
+                print(f"{label:>9} {density:>7} {name:>16} {per_mine * 1e3:>11.3f} {one_pass * 1e3:>11.3f} {per_mine / one_pass:>7.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Times minesweeper_nd on 200x200x200 boards, phase by phase, and measures the peak memory each
+case adds to a fresh process. For comparison it also times stacking 200 independent 200x200 boards
+from minesweeper_with_adjacent_mines, which is faster to write but misses the mines on the layers
+above and below.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_nd
+"""
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.instrumentation import instrument
+from src.main_v2 import mines_for_density, minesweeper_nd, minesweeper_with_adjacent_mines
+
+SHAPE = (200, 200, 200)
+# (label, kernel, wrap, density, as_board)
+CASES = [
+    ("moore 26", "moore", False, 0.05, True),
+    ("moore 26", "moore", False, 0.2, True),
+    ("orthogonal 6", "orthogonal", False, 0.2, True),
+    ("moore 26 wrap", "moore", True, 0.2, True),
+    ("moore 26 lists", "moore", False, 0.2, False),
+]
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_case(kernel, wrap, density, as_board):
+    """Runs in a fresh worker process so the peak RSS belongs to this case alone."""
+    before = peak_rss_mb()
+    num_mines = mines_for_density(SHAPE[0] * SHAPE[1] * SHAPE[2], density)
+    with instrument() as stats:
+        start = time.perf_counter()
+        minesweeper_nd(SHAPE, kernel, wrap=wrap, as_board=as_board, rng=random.Random(0), num_mines=num_mines)
+        seconds = time.perf_counter() - start
+    return seconds, stats.summary()["minesweeper_nd"]["phases"], peak_rss_mb() - before
+
+def run_stacked(density):
+    before = peak_rss_mb()
+    rng = random.Random(0)
+    layers, rows, cols = SHAPE
+    start = time.perf_counter()
+    for _ in range(layers):
+        minesweeper_with_adjacent_mines([rows, cols], as_board=True, rng=rng, num_mines=mines_for_density(rows * cols, density))
+    return time.perf_counter() - start, peak_rss_mb() - before
+
+def in_fresh_process(function, *args):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(function, *args).result()
+
+def main():
+    print(f"shape {'x'.join(map(str, SHAPE))}")
+    print(f"{'case':>16} {'density':>7} {'total s':>8} {'sample':>7} {'place':>7} {'count':>7} {'convert':>8} {'peak MB':>8}")
+    for label, kernel, wrap, density, as_board in CASES:
+        seconds, phases, peak = in_fresh_process(run_case, kernel, wrap, density, as_board)
+        print(f"{label:>16} {density:>7} {seconds:>8.2f} {phases['sample']:>7.2f} {phases['place']:>7.2f} "
+              f"{phases['count']:>7.2f} {phases['convert']:>8.2f} {peak:>8.0f}")
+    for density in (0.05, 0.2):
+        seconds, peak = in_fresh_process(run_stacked, density)
+        print(f"{'stacked 2D':>16} {density:>7} {seconds:>8.2f} {'':>7} {'':>7} {'':>7} {'':>8} {peak:>8.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Measures solver throughput with and without the cached neighbour tables, and the memory the
+cache uses for the shapes solved. The generators number boards with the kernel engine and do not
+use the tables, so boards are generated up front.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_neighbours
+"""
+import random
+import sys
+import time
+
+from src import neighbours
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.solver import solve
+
+SHAPES = [([9, 9], 10, 5000), ([16, 16], 40, 2000), ([16, 30], 99, 1000), ([100, 100], 2000, 100)]
+
+def boards_per_second(grids):
+    start = time.perf_counter()
+    for grid in grids:
+        solve(grid)
+    return len(grids) / (time.perf_counter() - start)
+
+def main():
+    print(f"{'shape':>9} {'uncached/s':>11} {'cached/s':>9} {'speedup':>8}")
+    max_table_cells = neighbours.MAX_TABLE_CELLS
+    for grid_size, num_mines, boards in SHAPES:
+        rng = random.Random(0)
+        grids = [minesweeper_with_adjacent_mines(grid_size, rng=rng, num_mines=num_mines) for _ in range(boards)]
+        neighbours.MAX_TABLE_CELLS = 0
+        neighbours.NEIGHBOUR_CACHE.clear()
+        uncached = boards_per_second(grids)
+        neighbours.MAX_TABLE_CELLS = max_table_cells
+        cached = boards_per_second(grids)
+        label = f"{grid_size[0]}x{grid_size[1]}"
+        print(f"{label:>9} {uncached:>11.0f} {cached:>9.0f} {cached / uncached:>7.2f}x")
+    print(f"cache: {neighbours.NEIGHBOUR_CACHE.stats()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
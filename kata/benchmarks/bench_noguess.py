@@ -0,0 +1,26 @@
+"""Tracks no-guess generation throughput in boards/second at beginner, intermediate and expert
+densities, with the repairs and rejections it needed.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_noguess
+"""
+import random
+import sys
+import time
+
+from src.noguess import NoGuessGenerator
+
+LEVELS = [("beginner", [9, 9], 10, 100), ("intermediate", [16, 16], 40, 30), ("expert", [16, 30], 99, 20)]
+
+def main():
+    print(f"{'level':>12} {'boards':>7} {'boards/s':>9} {'repairs/board':>14} {'rejections':>11}")
+    for name, grid_size, num_mines, boards in LEVELS:
+        generator = NoGuessGenerator(grid_size, num_mines, rng=random.Random(0))
+        start = time.perf_counter()
+        for _ in range(boards):
+            generator.generate(as_board=True)
+        rate = boards / (time.perf_counter() - start)
+        print(f"{name:>12} {boards:>7} {rate:>9.1f} {generator.repairs / boards:>14.1f} {generator.rejections:>11}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""Measures how generate_parallel scales with the number of worker processes.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_parallel
+"""
+import os
+import sys
+import time
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.parallel import generate_parallel
+
+GRID_SIZE = [100, 100]
+BOARDS = 400
+CHUNK_SIZE = 16
+
+def worker_counts():
+    counts, workers = [], 1
+    while workers < (os.cpu_count() or 1):
+        counts.append(workers)
+        workers *= 2
+    return counts + [os.cpu_count() or 1]
+
+def main():
+    print(f"{GRID_SIZE[0]}x{GRID_SIZE[1]}, {BOARDS} boards, chunk size {CHUNK_SIZE}")
+    print(f"{'workers':>8} {'boards/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts():
+        start = time.perf_counter()
+        generate_parallel(GRID_SIZE, BOARDS, minesweeper_with_adjacent_mines, master_seed=0,
+                          workers=workers, chunk_size=CHUNK_SIZE, as_board=True)
+        rate = BOARDS / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>10.0f} {rate / baseline:>7.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
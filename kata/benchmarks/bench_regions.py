@@ -0,0 +1,43 @@
+"""Compares the cost of precomputing a RegionIndex at generation time with the per-click cost of
+a RegionIndex lookup and of a RevealEngine fill.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_regions
+"""
+import random
+import sys
+import time
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.regions import RegionIndex
+from src.reveal import RevealEngine
+
+GRID_SIZE = [2000, 2000]
+MINE_COUNTS = [400, 40000, 200000]
+CLICKS = 20
+
+def main():
+    rows, cols = GRID_SIZE
+    print(f"{'mines':>8} {'regions':>8} {'precompute s':>13} {'lookup us':>10} {'fill us':>10}")
+    for num_mines in MINE_COUNTS:
+        rng = random.Random(0)
+        board = minesweeper_with_adjacent_mines(GRID_SIZE, as_board=True, rng=rng, num_mines=num_mines)
+        start = time.perf_counter()
+        index = RegionIndex(board)
+        precompute = time.perf_counter() - start
+        engine = RevealEngine(board)
+        clicks = [divmod(position, cols) for position in range(rows * cols) if board.cells[position] == 0]
+        clicks = rng.sample(clicks, min(CLICKS, len(clicks)))
+
+        start = time.perf_counter()
+        for i, j in clicks:
+            index.reveal_indices(i, j)
+        lookup = (time.perf_counter() - start) / len(clicks)
+        start = time.perf_counter()
+        for i, j in clicks:
+            engine.reveal_spans(i, j)
+        fill = (time.perf_counter() - start) / len(clicks)
+        print(f"{num_mines:>8} {len(index):>8} {precompute:>13.2f} {lookup * 1e6:>10.1f} {fill * 1e6:>10.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
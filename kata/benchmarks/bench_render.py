@@ -0,0 +1,45 @@
+"""Compares the per-row print loop of run.sh and the tests with the bulk renderer, writing to
+os.devnull, for list-of-lists grids and Boards.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_render
+"""
+import os
+import random
+import sys
+import time
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.render import write_grid
+
+SIZES = [(100, 100), (1000, 1000), (4000, 4000)]
+VIEWPORT = (1000, 1000, 50, 120)
+
+def print_loop(grid, file):
+    for row in grid:
+        print(" ".join(str(cell) for cell in row), file=file)
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def main():
+    rng = random.Random(0)
+    print(f"{'size':>10} {'print loop':>11} {'render lists':>13} {'render Board':>13} {'viewport':>9}")
+    with open(os.devnull, "w") as devnull:
+        for rows, cols in SIZES:
+            board = minesweeper_with_adjacent_mines([rows, cols], as_board=True, rng=rng, num_mines=rows * cols // 5)
+            grid = board.to_lists()
+            loop = timed(lambda: print_loop(grid, devnull))
+            lists = timed(lambda: write_grid(grid, devnull))
+            packed = timed(lambda: write_grid(board, devnull))
+            viewport = timed(lambda: write_grid(board, devnull, VIEWPORT))
+            label = f"{rows}x{cols}"
+            print(
+                f"{label:>10} {loop:>10.3f}s {lists:>12.3f}s {packed:>12.3f}s {viewport * 1e3:>7.2f}ms"
+                f"   ({loop / lists:.1f}x / {loop / packed:.0f}x)"
+            )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Times RevealEngine on 4000x4000 boards with huge empty regions. The first board is also
+revealed with a per-cell breadth-first search in Python for comparison.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_reveal
+"""
+import random
+import sys
+import time
+from collections import deque
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.reveal import RevealEngine
+
+GRID_SIZE = [4000, 4000]
+MINE_COUNTS = [100, 10000, 50000]
+# Latency budget for one reveal on the board above; the benchmark exits non-zero if exceeded.
+BUDGET_SECONDS = 2.0
+
+def reveal_breadth_first(cells, rows, cols, index):
+    seen = bytearray(rows * cols)
+    seen[index] = 1
+    queue = deque([index])
+    while queue:
+        current = queue.popleft()
+        if cells[current]:
+            continue
+        i, j = divmod(current, cols)
+        for ni in (i - 1, i, i + 1):
+            for nj in (j - 1, j, j + 1):
+                if 0 <= ni < rows and 0 <= nj < cols and not seen[ni * cols + nj]:
+                    seen[ni * cols + nj] = 1
+                    queue.append(ni * cols + nj)
+    return seen
+
+def main():
+    rows, cols = GRID_SIZE
+    print(f"{'mines':>8} {'revealed':>10} {'scanline s':>11} {'bfs s':>8}")
+    over_budget = False
+    for num_mines in MINE_COUNTS:
+        grid = minesweeper_with_adjacent_mines(GRID_SIZE, as_board=True, rng=random.Random(0), num_mines=num_mines)
+        engine = RevealEngine(grid)
+        index = engine.cells.find(0)
+        start = time.perf_counter()
+        spans = engine.reveal_spans(*divmod(index, cols))
+        scanline = time.perf_counter() - start
+        if num_mines == MINE_COUNTS[0]:
+            start = time.perf_counter()
+            reveal_breadth_first(engine.cells, rows, cols, index)
+            breadth_first = f"{time.perf_counter() - start:>8.2f}"
+        else:
+            breadth_first = f"{'-':>8}"
+        revealed = sum(stop - begin for begin, stop in spans)
+        print(f"{num_mines:>8} {revealed:>10} {scanline:>11.3f} {breadth_first}")
+        over_budget |= scanline > BUDGET_SECONDS
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
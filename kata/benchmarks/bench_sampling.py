@@ -0,0 +1,52 @@
+"""Compares mine placement by sampling the full generate_positions list (before)
+with sampling flat indices through sample_positions (after), in time and peak memory.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_sampling
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from src.main_v2 import generate_positions, mines_for_density, sample_positions
+
+CASES = [
+    (1000, 1000, 0.001),
+    (1000, 1000, 0.25),
+    (3000, 3000, 0.0005),
+    (10000, 10000, 0.00005),
+]
+# generate_positions at 10000x10000 would need ~100M tuples, so "before" is skipped above this area.
+MAX_BEFORE_AREA = 3000 * 3000
+
+def before(rows, cols, k):
+    return random.sample(generate_positions(rows, cols), k)
+
+def after(rows, cols, k):
+    return sample_positions(rows, cols, k)
+
+def measure(place, rows, cols, k):
+    tracemalloc.start()
+    start = time.perf_counter()
+    place(rows, cols, k)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+def main():
+    print(f"{'shape':>12} {'mines':>8} {'before s':>9} {'before MiB':>11} {'after s':>9} {'after MiB':>10}")
+    for rows, cols, density in CASES:
+        k = max(1, mines_for_density(rows * cols, density))
+        if rows * cols <= MAX_BEFORE_AREA:
+            before_time, before_peak = measure(before, rows, cols, k)
+            before_cells = f"{before_time:>9.3f} {before_peak:>11.1f}"
+        else:
+            before_cells = f"{'-':>9} {'-':>11}"
+        after_time, after_peak = measure(after, rows, cols, k)
+        label = f"{rows}x{cols}"
+        print(f"{label:>12} {k:>8} {before_cells} {after_time:>9.3f} {after_peak:>10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Measures request latency of the board server on localhost against generating each board inline.
+Clients request boards at a steady rate below the refill rate, so they are served from the pool.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_server
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from src.main_v2 import mines_for_density, minesweeper_with_adjacent_mines
+from src.server import STREAM_LIMIT, BoardServer
+
+CASES = [("16x30", 0.2), ("100x100", 0.2), ("300x300", 0.15)]
+CLIENTS = 4
+REQUESTS = 25
+
+def inline_latencies(size, density):
+    rows, cols = (int(part) for part in size.split("x"))
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        minesweeper_with_adjacent_mines([rows, cols], as_board=True, num_mines=mines_for_density(rows * cols, density))
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+async def client(host, port, size, density, interval):
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    for _ in range(REQUESTS):
+        writer.write(f"GET {size} {density} 8\n".encode())
+        await writer.drain()
+        await reader.readline()
+        await asyncio.sleep(interval)
+    writer.close()
+    await writer.wait_closed()
+
+async def served_stats(size, density, interval):
+    rows, cols = (int(part) for part in size.split("x"))
+    server = BoardServer(pool_size=CLIENTS * REQUESTS, workers=2)
+    await server.prefill((rows, cols, density, 8))
+    host, port = await server.start()
+    await asyncio.gather(*(client(host, port, size, density, interval) for _ in range(CLIENTS)))
+    stats = server.stats()
+    await server.close()
+    return stats
+
+def main():
+    print(f"{'size':>8} {'inline p50':>11} {'inline p99':>11} {'served p50':>11} {'served p99':>11} {'hit rate':>9}")
+    for size, density in CASES:
+        inline = inline_latencies(size, density)
+        p50, p99 = statistics.median(inline), inline[int(0.99 * len(inline))]
+        stats = asyncio.run(served_stats(size, density, p50))
+        pool = next(iter(stats["pools"].values()))
+        hit_rate = pool["hits"] / (pool["hits"] + pool["misses"])
+        print(
+            f"{size:>8} {p50 * 1e3:>9.2f}ms {p99 * 1e3:>9.2f}ms "
+            f"{stats['p50_ms']:>9.2f}ms {stats['p99_ms']:>9.2f}ms {hit_rate:>9.0%}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
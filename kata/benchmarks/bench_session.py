@@ -0,0 +1,44 @@
+"""Measures GameSession moves per second (reveal, flag, chord, undo) on large boards.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_session
+"""
+import random
+import sys
+import time
+
+from src.board import MINE
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.session import GameSession
+
+CASES = [([500, 500], 40000), ([2000, 2000], 700000)]
+MOVES = 20000
+
+def main():
+    print(f"{'shape':>10} {'mines':>8} {'moves':>7} {'moves/s':>10}")
+    for grid_size, num_mines in CASES:
+        rng = random.Random(0)
+        board = minesweeper_with_adjacent_mines(grid_size, as_board=True, rng=rng, num_mines=num_mines)
+        session = GameSession(board)
+        rows, cols = grid_size
+        safe = [index for index in range(rows * cols) if board.cells[index] not in (0, MINE)]
+        moves = 0
+        start = time.perf_counter()
+        for index in rng.sample(safe, MOVES):
+            i, j = divmod(index, cols)
+            kind = rng.random()
+            if kind < 0.6:
+                session.reveal(i, j)
+            elif kind < 0.8:
+                session.flag(i, j)
+            elif kind < 0.9:
+                session.chord(i, j)
+            else:
+                session.undo()
+            moves += 1
+        elapsed = time.perf_counter() - start
+        label = f"{rows}x{cols}"
+        print(f"{label:>10} {num_mines:>8} {moves:>7} {moves / elapsed:>10.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
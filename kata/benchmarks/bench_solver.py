@@ -0,0 +1,31 @@
+"""Reports solve time and deduction steps for the frontier-indexed solver at beginner,
+intermediate and expert sizes, in both neighbourhood modes.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_solver
+"""
+import random
+import sys
+
+from src.main_v2 import minesweeper_with_numbers, minesweeper_with_adjacent_mines
+from src.solver import solve
+
+LEVELS = [("beginner", [9, 9], 10), ("intermediate", [16, 16], 40), ("expert", [16, 30], 99), ("huge", [200, 200], 4000)]
+BOARDS = 50
+
+def main():
+    print(f"{'level':>12} {'mode':>5} {'solved':>7} {'median ms':>10} {'median steps':>13}")
+    for name, grid_size, num_mines in LEVELS:
+        for neighbourhood, generate in ((4, minesweeper_with_numbers), (8, minesweeper_with_adjacent_mines)):
+            rng = random.Random(0)
+            results = []
+            for _ in range(BOARDS):
+                grid = generate(grid_size, as_board=True, rng=rng, num_mines=num_mines)
+                results.append(solve(grid, neighbourhood))
+            seconds = sorted(result.seconds for result in results)[BOARDS // 2]
+            steps = sorted(result.steps for result in results)[BOARDS // 2]
+            solved = sum(result.solved for result in results)
+            print(f"{name:>12} {neighbourhood:>4}w {solved:>4}/{BOARDS} {seconds * 1000:>10.2f} {steps:>13}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Times the public functions of main_v1.py and main_v2.py, plus verify_batch from verify.py, over a
+matrix of grid sizes and mine densities, writes the results as JSON and optionally checks them
+against a stored baseline. minesweeper_nd numbers a (2, rows, cols) board, the sparse case is
+minesweeper_with_kernel(sparse=True) returning a SparseBoard, and verify_batch checks 4 boards.
+
+Every run reseeds the global random module with the same seed, so both versions see the same
+draws. Each case is timed --repeat times and the median and minimum are reported; peak memory
+comes from one extra tracemalloc run so tracing does not skew the timings. Functions that pick
+their own mine count (v1 has no way to pass one) run once per size with density "default".
+
+Before each timed call a fixed pure-Python reference workload is timed too, and its minimum is
+stored with the case. The regression gate compares each case's minimum relative to its own
+reference against the same ratio in a baseline recorded on the same machine, so the machine
+getting faster or slower between (or during) runs cancels out. Timings from another machine or
+Python still say nothing about this one, so no baseline is committed: make bench_baseline
+records one locally.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_suite [--full] [--output FILE] [--compare BASELINE]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from src import main_v1, main_v2, verify
+
+MODULES = {"v1": main_v1, "v2": main_v2, "verify": verify}
+
+SIZES = [(5, 3), (12, 6), (100, 100), (1000, 1000)]
+FULL_SIZES = SIZES + [(4000, 4000)]
+DENSITIES = [0.05, 0.2]
+SEED = 1234
+REPEAT = 7
+# Cases faster than this in the baseline are reported but not gated: at a few milliseconds, timer
+# resolution, caches and the scheduler make run-to-run differences larger than any threshold.
+MIN_SECONDS = 0.01
+
+def mine_list(rows, cols, density):
+    return [list(divmod(index, cols)) for index in random.sample(range(rows * cols), num_mines(rows, cols, density))]
+
+def num_mines(rows, cols, density):
+    return max(1, main_v2.mines_for_density(rows * cols, density))
+
+def boards(rows, cols, density, n=4):
+    return [main_v2.minesweeper_with_adjacent_mines([rows, cols], as_board=True, num_mines=num_mines(rows, cols, density)) for _ in range(n)]
+
+# (version, function name, builds (args, kwargs) from rows, cols, density; None if the density is not settable)
+CASES = [
+    ("v1", "minesweeper_basic", lambda r, c, d: (([r, c], mine_list(r, c, d)), {})),
+    ("v1", "minesweeper_random", None),
+    ("v1", "minesweeper_random_complete", None),
+    ("v1", "minesweeper_with_numbers", lambda r, c, d: (([r, c], mine_list(r, c, d)), {})),
+    ("v1", "minesweeper_with_adjacent_mines", None),
+    ("v2", "new_grid", None),
+    ("v2", "sample_positions", lambda r, c, d: ((r, c, num_mines(r, c, d)), {})),
+    ("v2", "minesweeper_basic", lambda r, c, d: (([r, c], mine_list(r, c, d)), {})),
+    ("v2", "minesweeper_random", None),
+    ("v2", "minesweeper_random_revised", None),
+    ("v2", "minesweeper_with_numbers", lambda r, c, d: (([r, c], mine_list(r, c, d)), {})),
+    ("v2", "minesweeper_with_adjacent_mines", lambda r, c, d: (([r, c],), {"num_mines": num_mines(r, c, d)})),
+    ("v2", "minesweeper_with_kernel", lambda r, c, d: (([r, c],), {"sparse": True, "num_mines": num_mines(r, c, d)})),
+    ("v2", "minesweeper_nd", lambda r, c, d: (((2, r, c),), {"num_mines": 2 * num_mines(r, c, d)})),
+    ("v2", "minesweeper_from_id", lambda r, c, d: (([r, c], d, 7), {})),
+    ("verify", "verify_batch", lambda r, c, d: ((boards(r, c, d),), {})),
+]
+
+def default_arguments(name, rows, cols):
+    if name == "new_grid":
+        return (rows, cols), {}
+    if name == "minesweeper_random":
+        return ([rows, cols],), {"multiple_mines": True}
+    return ([rows, cols],), {}
+
+def case_key(case):
+    return f"{case['version']}.{case['function']}/{case['size']}/{case['density']}"
+
+def reference_workload():
+    """Fixed work that touches no repo code: builds a 500x500 list-of-lists grid and scans it."""
+    grid = [["." for _ in range(500)] for _ in range(500)]
+    return sum(cell == "*" for row in grid for cell in row)
+
+def timed(function, *args, **kwargs):
+    """Returns the seconds one call takes. Like timeit, the cyclic collector is kept out of the
+    call: when it runs depends on everything allocated before, which is noise, not function."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def run_case(function, build, seed, repeat):
+    """Returns (median seconds, min seconds, min reference seconds, peak traced bytes) of calling
+    function(*build()), timing the reference workload right before every call."""
+    times, reference = [], []
+    for _ in range(repeat):
+        random.seed(seed)
+        args, kwargs = build()
+        reference.append(timed(reference_workload))
+        times.append(timed(function, *args, **kwargs))
+    random.seed(seed)
+    args, kwargs = build()
+    tracemalloc.start()
+    function(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), min(times), min(reference), peak
+
+def run_suite(sizes, densities=DENSITIES, seed=SEED, repeat=REPEAT, log=print):
+    results = []
+    for rows, cols in sizes:
+        for version, name, builder in CASES:
+            function = getattr(MODULES[version], name)
+            if builder is None:
+                variants = [("default", lambda: default_arguments(name, rows, cols))]
+            else:
+                variants = [(density, lambda density=density: builder(rows, cols, density)) for density in densities]
+            for density, build in variants:
+                median, fastest, reference, peak = run_case(function, build, seed, repeat)
+                case = {
+                    "version": version,
+                    "function": name,
+                    "size": f"{rows}x{cols}",
+                    "density": density,
+                    "median_s": median,
+                    "min_s": fastest,
+                    "reference_s": reference,
+                    "peak_bytes": peak,
+                    "repeat": repeat,
+                }
+                results.append(case)
+                log(f"{case_key(case):<60} {median * 1000:>12.3f} ms {peak / 1024:>12.0f} KiB")
+    return results
+
+def compare(results, baseline, threshold, min_seconds=MIN_SECONDS):
+    """Returns (key, old, new, ratio) for the cases whose fastest run is more than threshold (a fraction)
+    slower than in the baseline. old and new are minimum seconds; ratio compares them after dividing
+    each by the reference time of its own run. Cases faster than min_seconds in the baseline, or
+    missing from it, are skipped."""
+    previous = {case_key(case): case for case in baseline["results"]}
+    regressions = []
+    for case in results:
+        old = previous.get(case_key(case))
+        if old is None or old["min_s"] < min_seconds:
+            continue
+        ratio = (case["min_s"] / case["reference_s"]) / (old["min_s"] / old["reference_s"])
+        if ratio > 1 + threshold:
+            regressions.append((case_key(case), old["min_s"], case["min_s"], ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="include 4000x4000 (slow for main_v1)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="fail if a case regressed against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown as a fraction (default: 0.25)")
+    parser.add_argument("--min-seconds", type=float, default=MIN_SECONDS, help="skip gating cases faster than this")
+    args = parser.parse_args(argv)
+    if args.compare and not os.path.exists(args.compare):
+        parser.error(f"no baseline at {args.compare}; record one on this machine with make bench_baseline")
+
+    results = run_suite(FULL_SIZES if args.full else SIZES, seed=args.seed, repeat=args.repeat)
+    if args.output:
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=1)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if (baseline["python"], baseline["machine"]) != (platform.python_version(), platform.machine()):
+            print(f"Note: {args.compare} was recorded with Python {baseline['python']} on {baseline['machine']}; "
+                  "record a fresh baseline with make bench_baseline for meaningful ratios")
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        for key, old, new, ratio in regressions:
+            print(f"REGRESSION {key}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms ({ratio:.2f}x after normalising to the reference)")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
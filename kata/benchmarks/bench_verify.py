@@ -0,0 +1,81 @@
+"""Measures board verification throughput: the cell-by-cell checks of the test helpers
+(count_in_grid, is_adjacent_to_mine-style neighbour loops) against verify_batch, for list-of-lists
+grids, Boards and NumPy batches, and verify_file streaming JSONL and packed files.
+
+Run with: PYTHONPATH=. python -m benchmarks.bench_verify
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.boardfile import PackedBoardWriter
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.neighbours import DIRECTIONS, DIAGONAL_DIRECTIONS
+from src.streaming import writer_for
+from src.verify import verify_batch, verify_file
+
+SHAPE = [16, 30]
+NUM_MINES = 99
+BOARDS = 20000
+
+def verify_cell_by_cell(grids, num_mines):
+    """Returns the indices of the boards failing the checks the test helpers do, one cell at a time."""
+    bad = []
+    for index, grid in enumerate(grids):
+        rows, cols = len(grid), len(grid[0])
+        ok = sum(row.count("*") for row in grid) == num_mines
+        for i in range(rows):
+            for j in range(cols):
+                if grid[i][j] == "*":
+                    continue
+                count = sum(
+                    1 for di, dj in DIRECTIONS + DIAGONAL_DIRECTIONS
+                    if 0 <= i + di < rows and 0 <= j + dj < cols and grid[i + di][j + dj] == "*"
+                )
+                ok = ok and grid[i][j] == (str(count) if count else ".")
+        if not ok:
+            bad.append(index)
+    return bad
+
+def rate(function, count):
+    start = time.perf_counter()
+    result = function()
+    return count / (time.perf_counter() - start), result
+
+def main():
+    rng = random.Random(0)
+    boards = [minesweeper_with_adjacent_mines(SHAPE, as_board=True, rng=rng, num_mines=NUM_MINES) for _ in range(BOARDS)]
+    grids = [board.to_lists() for board in boards]
+    grids[123][0][0] = "*" if grids[123][0][0] != "*" else "."
+    print(f"{BOARDS} boards of {SHAPE[0]}x{SHAPE[1]}, {NUM_MINES} mines")
+
+    sample = grids[:1000]
+    slow, bad = rate(lambda: verify_cell_by_cell(sample, NUM_MINES), len(sample))
+    print(f"{'cell by cell (lists)':>24}: {slow:>9.0f} boards/s  offending {bad}")
+    for label, batch in (("verify_batch (lists)", grids), ("verify_batch (Boards)", boards)):
+        fast, report = rate(lambda: verify_batch(batch, num_mines=NUM_MINES), len(batch))
+        print(f"{label:>24}: {fast:>9.0f} boards/s  offending {report.indices}  {fast / slow:.0f}x")
+    try:
+        from src.batch import generate_batch
+        cells = generate_batch(tuple(SHAPE), BOARDS, NUM_MINES / (SHAPE[0] * SHAPE[1]), seed=0)
+        fast, report = rate(lambda: verify_batch(cells, num_mines=NUM_MINES), BOARDS)
+        print(f"{'verify_batch (NumPy)':>24}: {fast:>9.0f} boards/s  offending {report.indices}  {fast / slow:.0f}x")
+    except ImportError:
+        print(f"{'verify_batch (NumPy)':>24}: skipped, numpy is not installed")
+
+    with tempfile.TemporaryDirectory() as directory:
+        jsonl = os.path.join(directory, "boards.jsonl")
+        packed = os.path.join(directory, "boards.mswp")
+        with writer_for(jsonl) as writer:
+            writer.write_all(grids)
+        with PackedBoardWriter(packed, *SHAPE) as writer:
+            writer.write_all(grids)
+        for label, path in (("verify_file (JSONL)", jsonl), ("verify_file (packed)", packed)):
+            fast, report = rate(lambda: verify_file(path, num_mines=NUM_MINES), BOARDS)
+            print(f"{label:>24}: {fast:>9.0f} boards/s  offending {report.indices}  {fast / slow:.0f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,30 +13,19 @@ function print_header() {
     echo -e "\n${BLUE}=== $1 ===${NC}\n"
 }
 
-# Print grid helper function
-function print_python_grid() {
-    echo "from src.main_v2 import $1"
-    echo "def print_grid(grid):"
-    echo "    for row in grid:"
-    echo "        print(' '.join(str(cell) for cell in row))"
-    echo ""
-    echo "grid = $1($2)"
-    echo "print('Grid:')"
-    echo "print_grid(grid)"
-}
-
 # Install dependencies
 function install() {
     print_header "Installing Dependencies"
     python -m pip install --upgrade pip
     python -m pip install pytest
+    python -m pip install numpy
     python -m pip install --editable "$THIS_DIR/[dev]"
 }
 
 # Run all tests
 function run_tests() {
     print_header "Running All Tests"
-    python -m pytest tests/test_kata_v2.py -v -s
+    python -m pytest tests -v -s
 }
 
 # Run basic tests
@@ -83,41 +72,78 @@ function run_basic_grid() {
     grid_size=${1:-"10x6"}
     mines=${2:-"[[0,0],[1,1]]"}
     print_header "Running Basic Grid (Size: $grid_size, Mines: $mines)"
-    rows=${grid_size%x*}
-    cols=${grid_size#*x}
-    PYTHONPATH=. python -c "$(print_python_grid "minesweeper_basic" "[$rows, $cols], $mines")"
+    PYTHONPATH=. python -m src.cli basic_grid "$grid_size" "$mines"
 }
 
 function run_random_grid() {
     grid_size=${1:-"10x6"}
     print_header "Running Random Grid (Size: $grid_size)"
-    rows=${grid_size%x*}
-    cols=${grid_size#*x}
-    PYTHONPATH=. python -c "$(print_python_grid "minesweeper_random" "[$rows, $cols]")"
+    PYTHONPATH=. python -m src.cli random_grid "$grid_size"
 }
 
 function run_random_grid_revised() {
     grid_size=${1:-"10x6"}
     print_header "Running Random Grid (Revised) (Size: $grid_size)"
-    rows=${grid_size%x*}
-    cols=${grid_size#*x}
-    PYTHONPATH=. python -c "$(print_python_grid "minesweeper_random_revised" "[$rows, $cols]")"
+    PYTHONPATH=. python -m src.cli random_grid_revised "$grid_size"
 }
 
 function run_numbers_grid() {
     grid_size=${1:-"10x6"}
     print_header "Running Numbers Grid (Size: $grid_size)"
-    rows=${grid_size%x*}
-    cols=${grid_size#*x}
-    PYTHONPATH=. python -c "$(print_python_grid "minesweeper_with_numbers" "[$rows, $cols]")"
+    PYTHONPATH=. python -m src.cli numbers_grid "$grid_size"
 }
 
 function run_adjacent_grid() {
     grid_size=${1:-"10x6"}
     print_header "Running Adjacent Grid (Size: $grid_size)"
-    rows=${grid_size%x*}
-    cols=${grid_size#*x}
-    PYTHONPATH=. python -c "$(print_python_grid "minesweeper_with_adjacent_mines" "[$rows, $cols]")"
+    PYTHONPATH=. python -m src.cli adjacent_grid "$grid_size"
+}
+
+# Stream many boards from one function into a .jsonl or binary file
+function run_stream_grid() {
+    function_name=${1:-"minesweeper_with_adjacent_mines"}
+    grid_size=${2:-"10x6"}
+    count=${3:-"1000"}
+    output=${4:-"boards.jsonl"}
+    print_header "Streaming $count Boards (Function: $function_name, Size: $grid_size, Output: $output)"
+    PYTHONPATH=. python -m src.cli stream_grid "$function_name" "$grid_size" "$count" "$output"
+}
+
+# Run generation jobs (FUNCTION ROWSxCOLS [MINES] per line) from a file or stdin in one process
+function run_batch() {
+    jobs=${1:-"-"}
+    print_header "Running Batch Jobs: $jobs"
+    PYTHONPATH=. python -m src.cli batch "$jobs"
+}
+
+# Check every board of a .jsonl, binary or packed file against the 4-way or 8-way rule
+function run_verify() {
+    file=${1:-"boards.jsonl"}
+    neighbourhood=${2:-"8"}
+    print_header "Verifying Boards: $file (Neighbourhood: $neighbourhood)"
+    PYTHONPATH=. python -m src.cli verify "$file" --neighbourhood "$neighbourhood"
+}
+
+# Run a benchmark script from benchmarks/
+function run_benchmark() {
+    name=${1:-"batch"}
+    print_header "Running Benchmark: $name"
+    PYTHONPATH=. python -m "benchmarks.bench_$name"
+}
+
+# Record the v1/v2 benchmark suite results as the regression baseline
+function run_bench_baseline() {
+    baseline=${1:-"benchmarks/baseline.json"}
+    print_header "Recording Benchmark Baseline: $baseline"
+    PYTHONPATH=. python -m benchmarks.bench_suite --output "$baseline"
+}
+
+# Run the v1/v2 benchmark suite and fail if a case is slower than the baseline by more than the threshold
+function run_bench_regress() {
+    baseline=${1:-"benchmarks/baseline.json"}
+    threshold=${2:-"0.25"}
+    print_header "Checking Benchmarks Against $baseline (Threshold: $threshold)"
+    PYTHONPATH=. python -m benchmarks.bench_suite --output benchmarks/results.json --compare "$baseline" --threshold "$threshold"
 }
 
 # Clean generated files
@@ -157,6 +183,19 @@ function print_help() {
     echo "  random_grid_revised [ROWSxCOLS] - Create random grid with revised functions (default: 10x6)"
     echo "  numbers_grid [ROWSxCOLS]        - Create grid with numbers (default: 10x6)"
     echo "  adjacent_grid [ROWSxCOLS]       - Create grid with adjacent mines (default: 10x6)"
+    echo "  stream_grid [FUNCTION] [ROWSxCOLS] [COUNT] [OUTPUT]"
+    echo "                                  - Stream boards to a .jsonl or binary file"
+    echo "                                    (default: minesweeper_with_adjacent_mines 10x6 1000 boards.jsonl)"
+    echo "  batch [FILE]                    - Run FUNCTION ROWSxCOLS [MINES] jobs from FILE in one process"
+    echo "                                    (default: stdin)"
+    echo "  verify [FILE] [NEIGHBOURHOOD]   - Check every board of a .jsonl, binary or packed file"
+    echo "                                    (default: boards.jsonl 8)"
+    echo ""
+    echo "Benchmark Commands:"
+    echo "  bench [NAME]                - Run benchmarks/bench_NAME.py (default: batch)"
+    echo "  bench_baseline [FILE]       - Record the v1/v2 suite as a local baseline (default: benchmarks/baseline.json)"
+    echo "  bench_regress [FILE] [THRESHOLD]"
+    echo "                              - Fail if a case regressed past THRESHOLD against FILE (default: 0.25)"
     echo ""
     echo "Utility Commands:"
     echo "  clean                       - Clean generated files"
@@ -207,6 +246,24 @@ case "$1" in
     "adjacent_grid")
         run_adjacent_grid "$2"
         ;;
+    "stream_grid")
+        run_stream_grid "$2" "$3" "$4" "$5"
+        ;;
+    "batch")
+        run_batch "$2"
+        ;;
+    "verify")
+        run_verify "$2" "$3"
+        ;;
+    "bench")
+        run_benchmark "$2"
+        ;;
+    "bench_baseline")
+        run_bench_baseline "$2"
+        ;;
+    "bench_regress")
+        run_bench_regress "$2" "$3"
+        ;;
     "clean")
         clean
         ;;
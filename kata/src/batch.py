@@ -0,0 +1,36 @@
+from src.main_v2 import mines_for_density
+from src.vectorized import count_adjacent, encode_cells, np, require_numpy
+
+NEIGHBOURHOODS = {4: False, 8: True}
+
+def place_mines_batch(shape, n, num_mines, rng):
+    """Places exactly num_mines mines on each of n boards at once and returns an (n, rows, cols) bool array.
+    Each board ranks random keys per cell and takes the num_mines smallest, so there is no per-board Python loop."""
+    rows, cols = shape
+    total_squares = rows * cols
+    mine_array = np.zeros((n, total_squares), dtype=bool)
+    if num_mines >= total_squares:
+        mine_array[:] = True
+    elif num_mines > 0:
+        keys = rng.random((n, total_squares), dtype=np.float32)
+        picks = np.argpartition(keys, num_mines - 1, axis=1)[:, :num_mines]
+        np.put_along_axis(mine_array, picks, True, axis=1)
+    return mine_array.reshape(n, rows, cols)
+
+def generate_batch(shape, n, density, neighbourhood=8, seed=None):
+    """Generates n boards of the given (rows, cols) shape in one vectorized pass.
+    Every board gets mines_for_density(rows * cols, density) mines; counts use the 4-way (minesweeper_with_numbers)
+    or 8-way (minesweeper_with_adjacent_mines) neighbourhood. Returns an (n, rows, cols) uint8 array
+    with the cell codes used by Board (0 empty, 1-8 counts, 255 mine)."""
+    require_numpy()
+    if neighbourhood not in NEIGHBOURHOODS:
+        raise ValueError(f"neighbourhood must be 4 or 8, got {neighbourhood}")
+    if not 0 <= density <= 1:
+        raise ValueError(f"density must be between 0 and 1, got {density}")
+
+    rows, cols = shape
+    rng = np.random.default_rng(seed)
+    num_mines = mines_for_density(rows * cols, density)
+    mine_array = place_mines_batch(shape, n, num_mines, rng)
+    counts = count_adjacent(mine_array, include_diagonals=NEIGHBOURHOODS[neighbourhood])
+    return encode_cells(mine_array, counts)
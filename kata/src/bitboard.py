@@ -0,0 +1,120 @@
+import random
+
+from src.main_v2 import new_grid, sample_indices
+
+# Number of count bit-planes: enough for the 8 neighbours of the Moore neighbourhood.
+PLANES = 4
+
+class MineBitmap:
+    """Mine layer stored as one Python int per row, with bit j set when column j holds a mine."""
+    __slots__ = ("rows", "cols", "bits")
+
+    def __init__(self, rows, cols, bits=None):
+        self.rows = rows
+        self.cols = cols
+        self.bits = bits if bits is not None else [0] * rows
+
+    @classmethod
+    def from_positions(cls, rows, cols, mines):
+        bitmap = cls(rows, cols)
+        for i, j in mines:
+            bitmap.bits[i] |= 1 << j
+        return bitmap
+
+    @classmethod
+    def from_indices(cls, rows, cols, indices):
+        """Builds the bitmap straight from flat cell indices, as returned by sample_indices."""
+        bitmap = cls(rows, cols)
+        for index in indices:
+            i, j = divmod(index, cols)
+            bitmap.bits[i] |= 1 << j
+        return bitmap
+
+    def __contains__(self, position):
+        i, j = position
+        return bool(self.bits[i] >> j & 1)
+
+    def count(self):
+        return sum(bin(row).count("1") for row in self.bits)
+
+    def positions(self):
+        """Yields the (row, col) of every mine."""
+        for i, row in enumerate(self.bits):
+            yield from ((i, j) for j in iter_bits(row))
+
+def iter_bits(x):
+    """Yields the indices of the set bits of x, lowest first."""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+def add_plane(counter, plane):
+    """Adds a one-bit-per-cell plane into a bit-sliced counter (list of PLANES ints) with a ripple-carry adder."""
+    carry = plane
+    for k in range(PLANES):
+        if not carry:
+            break
+        counter[k], carry = counter[k] ^ carry, counter[k] & carry
+
+def neighbour_planes(bitmap, include_diagonals=True):
+    """Counts the neighbouring mines of every cell with shift-and-add on whole rows at once.
+    Returns one bit-sliced counter per row: a list of PLANES ints where bit j of plane k is bit k of
+    the count for column j."""
+    rows, mask = bitmap.rows, (1 << bitmap.cols) - 1
+    bits = [0] + bitmap.bits + [0]
+    counters = []
+    for i in range(rows):
+        above, row, below = bits[i], bits[i + 1], bits[i + 2]
+        counter = [0] * PLANES
+        # (x << 1) moves column j - 1 onto column j, (x >> 1) moves column j + 1 onto column j.
+        planes = [above, below, (row << 1) & mask, row >> 1]
+        if include_diagonals:
+            planes += [(above << 1) & mask, above >> 1, (below << 1) & mask, below >> 1]
+        for plane in planes:
+            add_plane(counter, plane)
+        counters.append(counter)
+    return counters
+
+def count_at(counter, j):
+    """Reads the count of column j from a row's bit-sliced counter."""
+    return sum(((plane >> j) & 1) << k for k, plane in enumerate(counter))
+
+def bitmap_to_grid(bitmap, counters, as_board=False):
+    """Writes mines and non-zero counts into a new grid, visiting only the set bits of each row."""
+    grid = new_grid(bitmap.rows, bitmap.cols, as_board)
+    for i, (mines, counter) in enumerate(zip(bitmap.bits, counters)):
+        row = grid[i]
+        for j in iter_bits(mines):
+            row[j] = "*"
+        nonzero = 0
+        for plane in counter:
+            nonzero |= plane
+        for j in iter_bits(nonzero & ~mines):
+            row[j] = str(count_at(counter, j))
+    return grid
+
+def minesweeper_with_numbers(gridSize=[], mines=[], as_board=False, rng=random):
+    """Bitboard version of main_v2.minesweeper_with_numbers, counting mines in the 4 orthogonal directions."""
+    if not gridSize:
+        return new_grid(0, 0, as_board)
+
+    rows, cols = gridSize
+    if mines:
+        bitmap = MineBitmap.from_positions(rows, cols, mines)
+    else:
+        total_squares = rows * cols
+        num_mines = rng.randint(1, total_squares // 4)
+        bitmap = MineBitmap.from_indices(rows, cols, sample_indices(total_squares, num_mines, rng))
+    return bitmap_to_grid(bitmap, neighbour_planes(bitmap, include_diagonals=False), as_board)
+
+def minesweeper_with_adjacent_mines(gridSize=[], as_board=False, rng=random):
+    """Bitboard version of main_v2.minesweeper_with_adjacent_mines, counting mines in all 8 directions."""
+    if not gridSize:
+        return new_grid(0, 0, as_board)
+
+    rows, cols = gridSize
+    total_squares = rows * cols
+    num_mines = rng.randint(1, total_squares // 4)
+    bitmap = MineBitmap.from_indices(rows, cols, sample_indices(total_squares, num_mines, rng))
+    return bitmap_to_grid(bitmap, neighbour_planes(bitmap, include_diagonals=True), as_board)
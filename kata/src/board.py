@@ -0,0 +1,197 @@
+from math import prod
+
+EMPTY = 0
+# Cell code used for mines; 0 is an empty cell and 1..254 are neighbour counts.
+MINE = 255
+
+SYMBOLS = ["."] + [str(count) for count in range(1, MINE)] + ["*"]
+CODES = {symbol: code for code, symbol in enumerate(SYMBOLS)}
+
+# Maps single-character cell codes to their ASCII symbol; SINGLE_CHAR_CODES lists those codes.
+SINGLE_CHAR_CODES = bytes(code for code in range(256) if len(SYMBOLS[code]) == 1)
+TEXT_CODES = bytes(ord(SYMBOLS[code]) if len(SYMBOLS[code]) == 1 else ord("?") for code in range(256))
+
+class RowView:
+    """Mutable view of one board row that reads and writes cells as the usual '.', '*' and digit strings."""
+    __slots__ = ("board", "offset")
+
+    def __init__(self, board, offset):
+        self.board = board
+        self.offset = offset
+
+    def __len__(self):
+        return self.board.cols
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [SYMBOLS[code] for code in self.codes()[j]]
+        if j < 0:
+            j += self.board.cols
+        if not 0 <= j < self.board.cols:
+            raise IndexError("board column index out of range")
+        return SYMBOLS[self.board.cells[self.offset + j]]
+
+    def __setitem__(self, j, symbol):
+        if j < 0:
+            j += self.board.cols
+        if not 0 <= j < self.board.cols:
+            raise IndexError("board column index out of range")
+        self.board.cells[self.offset + j] = CODES[symbol]
+
+    def __iter__(self):
+        return (SYMBOLS[code] for code in self.codes())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def codes(self):
+        """Returns a zero-copy memoryview of this row's cell codes."""
+        return memoryview(self.board.cells)[self.offset:self.offset + self.board.cols]
+
+    def count(self, symbol):
+        return self.codes().tobytes().count(CODES[symbol])
+
+class Board:
+    """Minesweeper grid stored as one byte per cell in a single contiguous bytearray.
+    Indexing a row gives a RowView, so board[i][j] reads and writes like the list-of-lists grids."""
+    __slots__ = ("rows", "cols", "cells")
+
+    def __init__(self, rows, cols, cells=None):
+        if cells is None:
+            cells = bytearray(rows * cols)
+        elif len(cells) != rows * cols:
+            raise ValueError(f"Expected {rows * cols} cells for a {rows}x{cols} board, got {len(cells)}")
+        self.rows = rows
+        self.cols = cols
+        self.cells = cells
+
+    @classmethod
+    def from_lists(cls, grid):
+        """Builds a Board from a list-of-lists grid of cell strings."""
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        return cls(rows, cols, bytearray(CODES[symbol] for row in grid for symbol in row))
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, i):
+        if isinstance(i, tuple):
+            i, j = i
+            return self[i][j]
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("board row index out of range")
+        return RowView(self, i * self.cols)
+
+    def __setitem__(self, position, symbol):
+        i, j = position
+        self[i][j] = symbol
+
+    def __iter__(self):
+        return (RowView(self, i * self.cols) for i in range(self.rows))
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return (self.rows, self.cols, self.cells) == (other.rows, other.cols, other.cells)
+        return self.to_lists() == other
+
+    def __repr__(self):
+        return f"Board({self.rows}, {self.cols})"
+
+    def count(self, symbol):
+        """Counts the cells holding the given symbol."""
+        return self.cells.count(CODES[symbol])
+
+    def to_lists(self):
+        """Converts the board back to the list-of-lists of strings returned by main_v2.
+        When every cell is a single character, the rows are split out of one translated string."""
+        cols = self.cols
+        if not self.cells.translate(None, SINGLE_CHAR_CODES):
+            text = self.cells.translate(TEXT_CODES).decode("ascii")
+            return [list(text[i * cols:(i + 1) * cols]) for i in range(self.rows)]
+        return [
+            [SYMBOLS[code] for code in self.cells[i * cols:(i + 1) * cols]]
+            for i in range(self.rows)
+        ]
+
+class BoardND:
+    """Minesweeper board of any number of dimensions, stored like Board as one byte per cell in a
+    single bytearray, row-major over shape (the last axis varies fastest). Cells are read and written
+    with a full position, board[i, j, k]."""
+    __slots__ = ("shape", "cells")
+
+    def __init__(self, shape, cells=None):
+        shape = tuple(shape)
+        size = prod(shape) if shape else 0
+        if cells is None:
+            cells = bytearray(size)
+        elif len(cells) != size:
+            raise ValueError(f"Expected {size} cells for a {'x'.join(map(str, shape))} board, got {len(cells)}")
+        self.shape = shape
+        self.cells = cells
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def index(self, position):
+        """Returns the flat index of a position; negative coordinates count from the end of their axis."""
+        if len(position) != len(self.shape):
+            raise IndexError(f"expected {len(self.shape)} coordinates, got {len(position)}")
+        index = 0
+        for coordinate, size in zip(position, self.shape):
+            if coordinate < 0:
+                coordinate += size
+            if not 0 <= coordinate < size:
+                raise IndexError("board index out of range")
+            index = index * size + coordinate
+        return index
+
+    def __len__(self):
+        return self.shape[0] if self.shape else 0
+
+    def __getitem__(self, position):
+        return SYMBOLS[self.cells[self.index(position)]]
+
+    def __setitem__(self, position, symbol):
+        self.cells[self.index(position)] = CODES[symbol]
+
+    def __eq__(self, other):
+        if isinstance(other, BoardND):
+            return (self.shape, self.cells) == (other.shape, other.cells)
+        return self.to_lists() == other
+
+    def __repr__(self):
+        return f"BoardND({self.shape})"
+
+    def count(self, symbol):
+        """Counts the cells holding the given symbol."""
+        return self.cells.count(CODES[symbol])
+
+    def layer(self, k):
+        """Returns a copy of the slice at index k of the first axis: a Board for 3D boards, a BoardND
+        with one dimension less otherwise."""
+        if k < 0:
+            k += self.shape[0]
+        if not 0 <= k < self.shape[0]:
+            raise IndexError("board layer index out of range")
+        size = len(self.cells) // self.shape[0]
+        cells = self.cells[k * size:(k + 1) * size]
+        if self.ndim == 3:
+            return Board(self.shape[1], self.shape[2], cells)
+        return BoardND(self.shape[1:], cells)
+
+    def to_lists(self):
+        """Converts the board to nested lists of strings, one level per dimension."""
+        if not self.cells.translate(None, SINGLE_CHAR_CODES):
+            nested = list(self.cells.translate(TEXT_CODES).decode("ascii"))
+        else:
+            nested = [SYMBOLS[code] for code in self.cells]
+        for size in reversed(self.shape[1:]):
+            nested = [nested[start:start + size] for start in range(0, len(nested), size)]
+        return nested
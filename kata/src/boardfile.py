@@ -0,0 +1,163 @@
+import mmap
+import struct
+
+from src.board import MINE, Board
+from src.kernels import MOORE, ORTHOGONAL, kernel_counts
+from src.streaming import BoardWriter, to_board
+
+PACKED_MAGIC = b"MSWP"
+PACKED_VERSION = 1
+HAS_COUNTS = 1
+# File header: magic, version, flags, neighbourhood, padding, rows, cols (uint32), board count (uint64).
+PACKED_HEADER = struct.Struct("<4sBBBxIIQ")
+COUNT_OFFSET = PACKED_HEADER.size - 8
+
+# Maps cell codes to the ASCII bit of the mine bitmap, and bitmap bits back to cell codes.
+MINE_BITS = bytes(ord("1") if code == MINE else ord("0") for code in range(256))
+BITS_TO_MINES = bytes.maketrans(b"01", bytes([0, MINE]))
+
+def bitmap_size(rows, cols):
+    return (rows * cols + 7) // 8
+
+def pack_mines(cells):
+    """Packs the mines of a cell-code buffer into a little-endian bitmap, bit k set when cell k is a mine."""
+    if not cells:
+        return b""
+    return int(cells.translate(MINE_BITS)[::-1], 2).to_bytes(bitmap_size(1, len(cells)), "little")
+
+def unpack_mines(bits, size):
+    """Returns a cell-code bytearray with MINE where the bitmap has a bit set and 0 elsewhere."""
+    if not size:
+        return bytearray()
+    return bytearray(format(int.from_bytes(bits, "little"), f"0{size}b")[::-1].encode().translate(BITS_TO_MINES))
+
+def fill_counts(cells, rows, cols, include_diagonals=True):
+    """Writes the neighbour counts around the mines of cells in place."""
+    cells[:] = kernel_counts(cells, rows, cols, MOORE if include_diagonals else ORTHOGONAL)
+    return cells
+
+class PackedBoardWriter(BoardWriter):
+    """Writes boards of one shape as fixed-size records after a PACKED_HEADER: a mine bitmap of
+    ceil(rows * cols / 8) bytes, then, with with_counts=True, one Board cell code per cell.
+    Without the counts plane a record is 8x smaller and counts are recomputed on read.
+    The board count in the header is filled in on close."""
+
+    def __init__(self, path, rows, cols, neighbourhood=8, with_counts=True, buffer_size=1 << 20):
+        if neighbourhood not in (4, 8):
+            raise ValueError(f"neighbourhood must be 4 or 8, got {neighbourhood}")
+        self.rows, self.cols = rows, cols
+        self.neighbourhood = neighbourhood
+        self.with_counts = with_counts
+        super().__init__(path, buffer_size)
+
+    def write_header(self):
+        flags = HAS_COUNTS if self.with_counts else 0
+        self.buffer += PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, flags, self.neighbourhood, self.rows, self.cols, 0)
+
+    def encode(self, grid):
+        board = to_board(grid)
+        if (board.rows, board.cols) != (self.rows, self.cols):
+            raise ValueError(f"Expected a {self.rows}x{self.cols} board, got {board.rows}x{board.cols}")
+        record = pack_mines(board.cells)
+        return record + board.cells if self.with_counts else record
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.seek(COUNT_OFFSET)
+            self.file.write(struct.pack("<Q", self.count))
+            self.file.close()
+
+class BoardView:
+    """Zero-copy view of one record of a BoardFile. mine_bits and counts are memoryview slices of
+    the mapped file; nothing is decoded until a cell or a conversion is asked for."""
+    __slots__ = ("file", "index", "mine_bits", "counts")
+
+    def __init__(self, file, index, mine_bits, counts):
+        self.file = file
+        self.index = index
+        self.mine_bits = mine_bits
+        self.counts = counts
+
+    @property
+    def rows(self):
+        return self.file.rows
+
+    @property
+    def cols(self):
+        return self.file.cols
+
+    def is_mine(self, i, j):
+        index = i * self.file.cols + j
+        return bool(self.mine_bits[index >> 3] >> (index & 7) & 1)
+
+    def mine_count(self):
+        return bin(int.from_bytes(self.mine_bits, "little")).count("1")
+
+    def cells(self):
+        """Returns the cell codes: the stored counts plane as is, or a bytearray rebuilt from the bitmap."""
+        if self.counts is not None:
+            return self.counts
+        rows, cols = self.file.rows, self.file.cols
+        return fill_counts(unpack_mines(self.mine_bits, rows * cols), rows, cols, self.file.neighbourhood == 8)
+
+    def to_board(self):
+        return Board(self.file.rows, self.file.cols, bytearray(self.cells()))
+
+    def to_lists(self):
+        """Returns the list-of-lists grid main_v2.py would have returned for this board."""
+        return self.to_board().to_lists()
+
+class BoardFile:
+    """Memory-maps a file written by PackedBoardWriter. Opening only parses the header; indexing
+    returns BoardViews over the mapped records, so millions of boards are available without
+    reading or parsing the file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mmap)
+        if len(self.buffer) < PACKED_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a version {PACKED_VERSION} packed board file")
+        magic, version, flags, self.neighbourhood, self.rows, self.cols, self.count = PACKED_HEADER.unpack_from(self.buffer)
+        if magic != PACKED_MAGIC or version != PACKED_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {PACKED_VERSION} packed board file")
+        self.has_counts = bool(flags & HAS_COUNTS)
+        self.bits_size = bitmap_size(self.rows, self.cols)
+        self.record_size = self.bits_size + (self.rows * self.cols if self.has_counts else 0)
+        if PACKED_HEADER.size + self.count * self.record_size > len(self.buffer):
+            self.close()
+            raise ValueError(f"{path} is truncated: expected {self.count} boards")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.count
+        if not 0 <= k < self.count:
+            raise IndexError("board index out of range")
+        start = PACKED_HEADER.size + k * self.record_size
+        bits_end = start + self.bits_size
+        counts = self.buffer[bits_end:start + self.record_size] if self.has_counts else None
+        return BoardView(self, k, self.buffer[start:bits_end], counts)
+
+    def __iter__(self):
+        return (self[k] for k in range(self.count))
+
+    def close(self):
+        """Releases the mapping. Views still alive keep it mapped until they are garbage collected."""
+        self.buffer.release()
+        try:
+            self.mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,207 @@
+import random
+import sys
+import threading
+from collections import OrderedDict, deque
+
+from src.main_v2 import counting_generator
+
+def board_nbytes(board):
+    """Approximate memory held by one cached Board."""
+    return sys.getsizeof(board) + sys.getsizeof(board.cells)
+
+class CacheEntry:
+    """Reservoir of fresh boards for one configuration."""
+    __slots__ = ("boards", "nbytes", "capped", "requests")
+
+    def __init__(self):
+        self.boards = deque()
+        self.nbytes = 0
+        self.requests = 0
+        # Set when the memory cap stopped a refill; cleared when the key is used again.
+        self.capped = False
+
+class BoardCache:
+    """In-process cache of pre-generated boards from minesweeper_with_numbers (neighbourhood 4)
+    and minesweeper_with_adjacent_mines (neighbourhood 8), keyed by (rows, cols, num_mines,
+    neighbourhood). Each key holds up to reservoir_size boards, stored as compact Boards. Every
+    board is handed out at most once.
+
+    A background thread refills the reservoirs, most recently used key first. Keys are kept in LRU
+    order. When a new board would push the total past memory_cap bytes, or there are more than
+    max_keys keys, the least recently used keys are evicted whole. A miss generates inline. A key
+    is only refilled once it has been asked for min_requests times (or warmed), so one-off
+    configurations do not fill the cache. A key whose boards fail to generate in the background is
+    dropped, and the failure is counted in stats() as errors and last_error."""
+
+    def __init__(self, reservoir_size=16, memory_cap=64 << 20, max_keys=64, min_requests=2, as_board=False, seed=None):
+        self.reservoir_size = reservoir_size
+        self.min_requests = min_requests
+        self.memory_cap = memory_cap
+        self.max_keys = max_keys
+        self.as_board = as_board
+        self.rng = random.Random(seed)
+        self.refill_rng = random.Random(None if seed is None else seed + 1)
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.evictions = 0
+        self.errors = 0
+        self.last_error = None
+        self.condition = threading.Condition()
+        self.idle = True
+        self.closed = False
+        self.thread = threading.Thread(target=self._refill_loop, name="board-cache-refill", daemon=True)
+        self.thread.start()
+
+    def key(self, gridSize, num_mines=None, neighbourhood=8):
+        counting_generator(neighbourhood)
+        rows, cols = gridSize
+        if rows <= 0 or cols <= 0:
+            raise ValueError(f"grid size must be positive, got {rows}x{cols}")
+        if num_mines is not None and not 0 <= num_mines <= rows * cols:
+            raise ValueError(f"num_mines must be between 0 and {rows * cols} for a {rows}x{cols} board, got {num_mines}")
+        return rows, cols, num_mines, neighbourhood
+
+    def _generate(self, key, rng):
+        rows, cols, num_mines, neighbourhood = key
+        return counting_generator(neighbourhood)([rows, cols], as_board=True, rng=rng, num_mines=num_mines)
+
+    def _touch(self, key):
+        """Returns the entry for key as the most recently used one, creating it if needed.
+        A capped key is uncapped: as the most recently used key its refills may now evict colder keys."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = CacheEntry()
+            while len(self.entries) > self.max_keys and self._evict_lru(keep=key):
+                pass
+        else:
+            self.entries.move_to_end(key)
+            entry.capped = False
+        return entry
+
+    def _evict_lru(self, keep):
+        """Evicts the least recently used key if it was used less recently than keep.
+        Returns False when keep is itself the least recently used key, so a cold key refilling
+        never pushes out a hotter one."""
+        key = next(iter(self.entries), keep)
+        if key == keep:
+            return False
+        self.nbytes -= self.entries.pop(key).nbytes
+        self.evictions += 1
+        return True
+
+    def get(self, gridSize, num_mines=None, neighbourhood=8):
+        """Returns a fresh board for the configuration, from the reservoir if one is ready."""
+        key = self.key(gridSize, num_mines, neighbourhood)
+        with self.condition:
+            entry = self._touch(key)
+            entry.requests += 1
+            board = None
+            if entry.boards:
+                board = entry.boards.popleft()
+                size = board_nbytes(board)
+                entry.nbytes -= size
+                self.nbytes -= size
+                self.hits += 1
+            else:
+                self.misses += 1
+            self.idle = False
+            self.condition.notify_all()
+        if board is None:
+            board = self._generate(key, self.rng)
+        return board if self.as_board else board.to_lists()
+
+    def warm(self, gridSize, num_mines=None, neighbourhood=8, timeout=None):
+        """Registers the configuration and waits until the refill thread has nothing left to do."""
+        with self.condition:
+            entry = self._touch(self.key(gridSize, num_mines, neighbourhood))
+            entry.requests = max(entry.requests, self.min_requests)
+            self.idle = False
+            self.condition.notify_all()
+        return self.wait_idle(timeout)
+
+    def wait_idle(self, timeout=None):
+        """Waits until every reservoir is full or capped; returns False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.idle, timeout)
+
+    def _next_key(self):
+        for key in reversed(self.entries):
+            entry = self.entries[key]
+            if entry.requests >= self.min_requests and len(entry.boards) < self.reservoir_size and not entry.capped:
+                return key
+        return None
+
+    def _store(self, key, board):
+        entry = self.entries.get(key)
+        if entry is None:
+            return
+        size = board_nbytes(board)
+        while self.nbytes + size > self.memory_cap:
+            if not self._evict_lru(keep=key):
+                entry.capped = True
+                return
+        entry.boards.append(board)
+        entry.nbytes += size
+        self.nbytes += size
+        self.refills += 1
+
+    def _refill_loop(self):
+        while True:
+            with self.condition:
+                key = self._next_key()
+                while key is None and not self.closed:
+                    self.idle = True
+                    self.condition.notify_all()
+                    self.condition.wait()
+                    key = self._next_key()
+                if self.closed:
+                    return
+            try:
+                board = self._generate(key, self.refill_rng)
+            except Exception as error:
+                with self.condition:
+                    self._drop(key, error)
+                continue
+            with self.condition:
+                self._store(key, board)
+
+    def _drop(self, key, error):
+        """Forgets a key whose boards cannot be generated, so the refill thread moves on."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+        self.errors += 1
+        self.last_error = f"{key}: {error!r}"
+
+    def stats(self):
+        with self.condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refills": self.refills,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "last_error": self.last_error,
+                "keys": len(self.entries),
+                "boards": sum(len(entry.boards) for entry in self.entries.values()),
+                "bytes": self.nbytes,
+                "memory_cap": self.memory_cap,
+            }
+
+    def close(self):
+        """Stops the refill thread and drops every cached board."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+        self.entries.clear()
+        self.nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,270 @@
+"""Command line interface over main_v2.py with the same subcommands as run.sh, plus a batch mode
+that runs many generation jobs in one process.
+
+Run with: PYTHONPATH=. python -m src.cli COMMAND [ARGS]
+
+Only argparse and sys are imported up front; the generators, the renderer, the writers, pytest
+and the benchmarks are imported by the commands that need them, so a single invocation pays only
+for what it uses.
+"""
+import argparse
+import sys
+
+# Subcommand and batch job names for the main_v2.py generators.
+GENERATORS = {
+    "basic_grid": "minesweeper_basic",
+    "random_grid": "minesweeper_random",
+    "random_grid_revised": "minesweeper_random_revised",
+    "numbers_grid": "minesweeper_with_numbers",
+    "adjacent_grid": "minesweeper_with_adjacent_mines",
+}
+
+# Test subcommands: pytest -k filters over tests/test_kata_v2.py, as in run.sh.
+TEST_FILTERS = {
+    "basic": "test_empty_grid or test_no_mines or test_add_mine",
+    "random": "test_mine_placement or test_multiple_mine_placement",
+    "numbers": "test_calculate_adjacent_mine_numbers or test_multiple_mines_with_numbers or test_random_multiple_mines_with_numbers",
+}
+
+# Test subcommands that call test functions directly with a grid size, and their default sizes.
+SIZED_TESTS = {
+    "ones": ("5x3", ["test_single_one_adjacent_to_mine", "test_multiple_ones_adjacent_to_mine"]),
+    "revised": ("12x6", ["test_multiple_mines_with_multiple_ones"]),
+    "adjacent": ("12x6", ["test_minesweeper_with_adjacent_mines"]),
+}
+
+def parse_size(text):
+    """Parses ROWSxCOLS into [rows, cols]."""
+    try:
+        rows, cols = text.lower().split("x")
+        return [int(rows), int(cols)]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"grid size must look like ROWSxCOLS, got {text!r}")
+
+def parse_mines(text):
+    """Parses a JSON list of [row, col] pairs."""
+    import json
+    try:
+        mines = json.loads(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"mines must be a JSON list like [[0,0],[1,1]], got {text!r}")
+    if not isinstance(mines, list):
+        raise argparse.ArgumentTypeError(f"mines must be a JSON list like [[0,0],[1,1]], got {text!r}")
+    return mines
+
+def generator(name):
+    """Returns the main_v2.py generator for a subcommand name or a minesweeper_* function name."""
+    from src import main_v2
+    function_name = GENERATORS.get(name, name)
+    if not function_name.startswith("minesweeper_") or not hasattr(main_v2, function_name):
+        raise ValueError(f"Unknown generator: {name}")
+    return getattr(main_v2, function_name)
+
+def print_grid(grid, out):
+    from src.render import write_grid
+    out.write("Grid:\n")
+    write_grid(grid, out)
+
+def run_grid(args, out):
+    function = generator(args.command)
+    if args.command == "basic_grid":
+        grid = function(args.size, args.mines)
+    else:
+        grid = function(args.size)
+    print_grid(grid, out)
+    return 0
+
+def run_stream(args, out):
+    from src.streaming import stream_boards, writer_for
+    with writer_for(args.output) as writer:
+        written = writer.write_all(stream_boards(generator(args.function), args.size, args.count))
+    out.write(f"Wrote {written} boards to {args.output}\n")
+    return 0
+
+def run_bench(args, out):
+    import importlib
+    return importlib.import_module(f"benchmarks.bench_{args.name}").main()
+
+def run_tests(args, out):
+    import pytest
+    if args.command == "test":
+        return pytest.main(["tests", "-v", "-s"])
+    return pytest.main(["tests/test_kata_v2.py", "-v", "-s", "-k", TEST_FILTERS[args.command]])
+
+def run_sized_tests(args, out):
+    import importlib
+    module = importlib.import_module("tests.test_kata_v2")
+    default_size, names = SIZED_TESTS[args.command]
+    for name in names:
+        getattr(module, name)(args.size or default_size)
+    return 0
+
+def parse_job(line):
+    """Parses one batch job into (function name, [rows, cols], kwargs).
+    A job is either a JSON object {"function": ..., "size": "ROWSxCOLS", "mines": ...} or the
+    whitespace-separated fields FUNCTION ROWSxCOLS [MINES]. MINES is a JSON list of positions or
+    a mine count (passed as num_mines, for the counting generators); run_batch rejects a form the
+    generator does not take."""
+    import json
+    if line.startswith("{"):
+        job = json.loads(line)
+        function, size, mines = job["function"], job["size"], job.get("mines")
+    else:
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            raise ValueError(f"Expected FUNCTION ROWSxCOLS [MINES], got {line!r}")
+        function, size = fields[:2]
+        mines = json.loads(fields[2]) if len(fields) == 3 else None
+    kwargs = {}
+    if isinstance(mines, int):
+        kwargs["num_mines"] = mines
+    elif mines:
+        kwargs["mines"] = mines
+    return function, parse_size(size) if isinstance(size, str) else list(size), kwargs
+
+# How a batch job's MINES field reaches the generator, and what to call it in usage errors.
+MINE_ARGUMENTS = {"mines": "a mine list", "num_mines": "a mine count"}
+
+# The MINES forms each generator uses; generators not listed take none. minesweeper_random has a
+# mines parameter but ignores it, so it is not listed as taking a mine list.
+MINE_FORMS = {
+    "minesweeper_basic": ("mines",),
+    "minesweeper_with_numbers": ("mines", "num_mines"),
+    "minesweeper_with_adjacent_mines": ("num_mines",),
+    "minesweeper_with_kernel": ("mines", "num_mines"),
+    "minesweeper_nd": ("mines", "num_mines"),
+}
+
+def check_job(name, function, kwargs):
+    """Raises ValueError with the accepted MINES forms when a job passes mines its generator does not take."""
+    forms = MINE_FORMS.get(function.__name__, ())
+    for key in kwargs:
+        if key not in forms:
+            accepted = " or ".join(MINE_ARGUMENTS[key] for key in MINE_ARGUMENTS if key in forms)
+            usage = f"{name} ROWSxCOLS [MINES] with MINES {accepted}" if accepted else f"{name} ROWSxCOLS"
+            raise ValueError(f"{name} does not take {MINE_ARGUMENTS[key]}; usage: {usage}")
+
+def run_batch(args, out):
+    """Runs every job of the input in this process, printing the grids or writing them to --output."""
+    import random
+    rng = random.Random(args.seed) if args.seed is not None else random
+    source = sys.stdin if args.jobs == "-" else open(args.jobs)
+    writer = None
+    if args.output:
+        from src.streaming import writer_for
+        writer = writer_for(args.output)
+    count = 0
+    try:
+        for line_number, line in enumerate(source, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                name, size, kwargs = parse_job(line)
+                function = generator(name)
+                check_job(name, function, kwargs)
+                if function.__name__ != "minesweeper_basic":
+                    kwargs["rng"] = rng
+                grid = function(size, **kwargs)
+            except (ValueError, TypeError, KeyError, argparse.ArgumentTypeError) as error:
+                raise SystemExit(f"{args.jobs}:{line_number}: {error}")
+            if writer is not None:
+                writer.write(grid)
+            else:
+                print_grid(grid, out)
+            count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if writer is not None:
+            writer.close()
+    if writer is not None:
+        out.write(f"Wrote {count} boards to {args.output}\n")
+    return 0
+
+def run_serve(args, out):
+    import asyncio
+    from src.server import parse_key, serve
+    prefill = [parse_key(*config.split(":")) for config in args.prefill]
+    try:
+        asyncio.run(serve(args.host, args.port, prefill, pool_size=args.pool_size, workers=args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def run_verify(args, out):
+    """Verifies every board of a file; exits with status 1 when any board fails."""
+    from src.verify import verify_file
+    report = verify_file(args.file, args.batch_size, neighbourhood=args.neighbourhood, num_mines=args.mines,
+                         min_density=args.min_density, max_density=args.max_density)
+    out.write(f"Checked {report.checked} boards, {len(report.failures)} failed\n")
+    for reason, count in sorted(report.reasons().items()):
+        out.write(f"  {reason}: {count}\n")
+    for index in report.indices[:args.show]:
+        out.write(f"  board {index}: {', '.join(report.failures[index])}\n")
+    return 0 if report.ok else 1
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Minesweeper grid generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name in GENERATORS:
+        command = commands.add_parser(name, help=f"Create a grid with {GENERATORS[name]}")
+        command.add_argument("size", nargs="?", type=parse_size, default="10x6", help="ROWSxCOLS (default: 10x6)")
+        if name == "basic_grid":
+            command.add_argument("mines", nargs="?", type=parse_mines, default="[[0,0],[1,1]]")
+        command.set_defaults(run=run_grid)
+
+    command = commands.add_parser("stream_grid", help="Stream boards to a .jsonl or binary file")
+    command.add_argument("function", nargs="?", default="minesweeper_with_adjacent_mines")
+    command.add_argument("size", nargs="?", type=parse_size, default="10x6")
+    command.add_argument("count", nargs="?", type=int, default=1000)
+    command.add_argument("output", nargs="?", default="boards.jsonl")
+    command.set_defaults(run=run_stream)
+
+    command = commands.add_parser("batch", help="Run many generation jobs from a file or stdin in one process")
+    command.add_argument("jobs", nargs="?", default="-", help="job file, one job per line (default: stdin)")
+    command.add_argument("--output", help="write the boards to a .jsonl or binary file instead of printing them")
+    command.add_argument("--seed", type=int, help="seed a random.Random shared by all jobs")
+    command.set_defaults(run=run_batch)
+
+    command = commands.add_parser("serve", help="Serve boards from prefilled pools over a line protocol")
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8765)
+    command.add_argument("--pool-size", type=int, default=32)
+    command.add_argument("--workers", type=int, default=1, help="refill tasks per pool")
+    command.add_argument("--prefill", nargs="*", default=[], metavar="ROWSxCOLS:DENSITY:NEIGHBOURHOOD")
+    command.set_defaults(run=run_serve)
+
+    command = commands.add_parser("verify", help="Check every board of a .jsonl, binary or packed file")
+    command.add_argument("file")
+    command.add_argument("--neighbourhood", type=int, default=8, choices=[4, 8])
+    command.add_argument("--mines", type=int, help="expected mine count of every board")
+    command.add_argument("--min-density", type=float)
+    command.add_argument("--max-density", type=float)
+    command.add_argument("--batch-size", type=int, default=4096, help="boards checked per pass")
+    command.add_argument("--show", type=int, default=20, help="offending boards to list")
+    command.set_defaults(run=run_verify)
+
+    command = commands.add_parser("bench", help="Run benchmarks/bench_NAME.py")
+    command.add_argument("name", nargs="?", default="batch")
+    command.set_defaults(run=run_bench)
+
+    commands.add_parser("test", help="Run all tests").set_defaults(run=run_tests)
+    for name in TEST_FILTERS:
+        commands.add_parser(name, help=f"Run the {name} tests").set_defaults(run=run_tests)
+    for name, (default_size, _) in SIZED_TESTS.items():
+        command = commands.add_parser(name, help=f"Run the {name} tests (default: {default_size})")
+        command.add_argument("size", nargs="?")
+        command.set_defaults(run=run_sized_tests)
+    return parser
+
+def main(argv=None, out=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.run(args, out or sys.stdout)
+    except ValueError as error:
+        raise SystemExit(f"error: {error}")
+
+if __name__ == "__main__":
+    sys.exit(main())
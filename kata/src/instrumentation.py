@@ -0,0 +1,112 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Instrumentation collecting for the current thread or task; None (the default) means off.
+_ACTIVE = ContextVar("instrumentation", default=None)
+
+class Probe:
+    """Phase timings and counters for one generator call.
+    lap(phase, *built, touched=0, lookups=0) charges the time since the previous lap to phase, so a
+    generator calls it once at the end of each phase, passing the objects the phase built, the cells
+    it touched and the neighbours it looked up; finish takes the same arguments for the last phase.
+    Counters: cells_touched (cells allocated or written), neighbour_lookups (neighbour cells
+    examined) and allocations (the lists, sets, dicts and cell buffers in the objects passed to lap:
+    a list-of-lists grid is rows + 1 and a Board is one; temporaries a phase does not keep are not
+    counted). Peak bytes come from the benchmark suite's tracemalloc runs."""
+    __slots__ = ("instrumentation", "function", "phases", "counters", "_last")
+
+    def __init__(self, instrumentation, function):
+        self.instrumentation = instrumentation
+        self.function = function
+        self.phases = {}
+        self.counters = defaultdict(int)
+        self._last = time.perf_counter()
+
+    def lap(self, phase, *built, touched=0, lookups=0):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+        counters = self.counters
+        counters["cells_touched"] += touched
+        counters["neighbour_lookups"] += lookups
+        counters["allocations"] += sum(map(containers, built))
+
+    def finish(self, phase=None, *built, touched=0, lookups=0):
+        """Ends the last phase like lap, if one is given, and hands the finished call to the
+        instrumentation, which totals it and runs the callback."""
+        if phase is not None:
+            self.lap(phase, *built, touched=touched, lookups=lookups)
+        self.instrumentation.record(self)
+
+class NullProbe:
+    """The probe generators get when instrumentation is off: lap and finish do nothing. It is
+    falsy, for the one count that costs a pass over the board to compute."""
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def lap(self, phase, *built, touched=0, lookups=0):
+        pass
+
+    def finish(self, phase=None, *built, touched=0, lookups=0):
+        pass
+
+NULL_PROBE = NullProbe()
+
+def containers(obj):
+    """Helper function to count the containers in obj: one for a flat container or cell buffer,
+    plus the inner lists of a nested list grid."""
+    if isinstance(obj, list) and obj and isinstance(obj[0], list):
+        return 1 + sum(map(containers, obj))
+    return 1
+
+class Instrumentation:
+    """Totals of phase times and counters over all instrumented calls, per function."""
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.calls = defaultdict(int)
+        self.phases = defaultdict(lambda: defaultdict(float))
+        self.counters = defaultdict(lambda: defaultdict(int))
+
+    def record(self, probe):
+        self.calls[probe.function] += 1
+        for phase, seconds in probe.phases.items():
+            self.phases[probe.function][phase] += seconds
+        for counter, n in probe.counters.items():
+            self.counters[probe.function][counter] += n
+        if self.callback is not None:
+            self.callback(probe)
+
+    def summary(self):
+        """Returns the totals as plain nested dicts keyed by function name."""
+        return {
+            function: {
+                "calls": calls,
+                "phases": dict(self.phases[function]),
+                "counters": dict(self.counters[function]),
+            }
+            for function, calls in self.calls.items()
+        }
+
+@contextmanager
+def instrument(callback=None):
+    """Turns instrumentation on for the minesweeper_* generators inside the block and yields the
+    Instrumentation collecting their totals. callback, if given, is called with each finished Probe."""
+    instrumentation = Instrumentation(callback)
+    token = _ACTIVE.set(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        _ACTIVE.reset(token)
+
+def start_probe(function):
+    """Returns a Probe for one call of function when instrumentation is on, else NULL_PROBE.
+    The cost when off is one context variable lookup per call plus a no-op call per phase."""
+    instrumentation = _ACTIVE.get()
+    if instrumentation is None:
+        return NULL_PROBE
+    return Probe(instrumentation, function)
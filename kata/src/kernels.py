@@ -0,0 +1,195 @@
+from collections import defaultdict
+from itertools import product
+
+from src.board import MINE
+from src.neighbours import DIRECTIONS, DIAGONAL_DIRECTIONS
+
+KNIGHT_MOVES = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+
+# Maps cell codes to one byte lane per cell: 1 for a mine, 0 for anything else.
+MINE_LANES = bytes(1 if code == MINE else 0 for code in range(256))
+
+class Kernel:
+    """Neighbourhood a cell counts mines over: the (di, dj) offsets it looks at (one coordinate per
+    axis on N-dimensional boards), optionally wrapping around the edges of the board (a torus).
+    A cell's number is how many of its offsets land on a mine; on a torus smaller than the kernel,
+    an offset reaching the same cell twice counts it twice."""
+    __slots__ = ("name", "offsets", "wrap")
+
+    def __init__(self, offsets, wrap=False, name="custom"):
+        offsets = tuple(tuple(int(d) for d in offset) for offset in offsets)
+        if not offsets:
+            raise ValueError("a kernel needs at least one offset")
+        if len({len(offset) for offset in offsets}) != 1 or not offsets[0]:
+            raise ValueError("kernel offsets must all have the same, non-zero number of coordinates")
+        if not all(any(offset) for offset in offsets):
+            raise ValueError("a cell is not its own neighbour: the zero offset is not a kernel offset")
+        if len(set(offsets)) != len(offsets):
+            raise ValueError(f"kernel offsets must be distinct, got {list(offsets)}")
+        if len(offsets) >= MINE:
+            raise ValueError(f"kernels are limited to {MINE - 1} offsets so counts fit a cell code")
+        self.name = name
+        self.offsets = offsets
+        self.wrap = bool(wrap)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __eq__(self, other):
+        return isinstance(other, Kernel) and (set(self.offsets), self.wrap) == (set(other.offsets), other.wrap)
+
+    def __hash__(self):
+        return hash((frozenset(self.offsets), self.wrap))
+
+    def __repr__(self):
+        return f"Kernel({self.name}, {len(self.offsets)} offsets{', wrap' if self.wrap else ''})"
+
+    @property
+    def ndim(self):
+        return len(self.offsets[0])
+
+    @property
+    def reach(self):
+        """Returns the largest distance of an offset along each axis, e.g. (rows, cols) in 2D."""
+        return tuple(max(abs(offset[axis]) for offset in self.offsets) for axis in range(self.ndim))
+
+    def wrapped(self, wrap=True):
+        """Returns this kernel with wrap-around edges switched on (or off)."""
+        return Kernel(self.offsets, wrap, self.name)
+
+ORTHOGONAL = Kernel(DIRECTIONS, name="orthogonal")
+MOORE = Kernel(DIRECTIONS + DIAGONAL_DIRECTIONS, name="moore")
+KNIGHT = Kernel(KNIGHT_MOVES, name="knight")
+
+# Kernels by name, and by the neighbourhood sizes used across the repo (4 and 8).
+KERNELS = {4: ORTHOGONAL, 8: MOORE, "orthogonal": ORTHOGONAL, "moore": MOORE, "knight": KNIGHT}
+
+def orthogonal_kernel(ndim):
+    """Returns the 2 * ndim neighbours one step along a single axis."""
+    offsets = []
+    for axis in range(ndim):
+        for step in (-1, 1):
+            offsets.append(tuple(step if k == axis else 0 for k in range(ndim)))
+    return Kernel(offsets, name="orthogonal")
+
+def moore_kernel(ndim):
+    """Returns the 3 ** ndim - 1 neighbours at most one step along every axis."""
+    return Kernel([offset for offset in product((-1, 0, 1), repeat=ndim) if any(offset)], name="moore")
+
+def get_kernel(kernel=8, wrap=None, ndim=2):
+    """Resolves a Kernel, a KERNELS key (4, 8, "orthogonal", "moore", "knight") or a list of (di, dj)
+    offsets into a Kernel. wrap, if given, overrides the kernel's own wrap-around setting.
+    For other numbers of dimensions, "orthogonal" or 2 * ndim gives orthogonal_kernel(ndim) and
+    "moore" or 3 ** ndim - 1 gives moore_kernel(ndim)."""
+    if not isinstance(kernel, Kernel):
+        if isinstance(kernel, (int, str)):
+            if ndim == 2 and kernel in KERNELS:
+                kernel = KERNELS[kernel]
+            elif kernel in ("orthogonal", 2 * ndim):
+                kernel = orthogonal_kernel(ndim)
+            elif kernel in ("moore", 3 ** ndim - 1):
+                kernel = moore_kernel(ndim)
+            else:
+                raise ValueError(f"Unknown kernel for {ndim} dimensions: {kernel!r}")
+        else:
+            kernel = Kernel(kernel)
+    if kernel.ndim != ndim:
+        raise ValueError(f"a {kernel.ndim}-dimensional kernel cannot number a {ndim}-dimensional board")
+    if wrap is not None and bool(wrap) != kernel.wrap:
+        kernel = kernel.wrapped(wrap)
+    return kernel
+
+def wrap_row(row, pad, item=1):
+    """Returns row with pad items of item bytes each copied cyclically onto each side (pad may exceed
+    the row length)."""
+    size = len(row) // item
+    repeated = row * (2 * pad // size + 3)
+    start = (size - pad % size) * item
+    return repeated[start:start + (size + 2 * pad) * item]
+
+def pad_lanes(lanes, shape, kernel):
+    """Lays out a lane buffer of the given shape inside a border of kernel.reach cells on every axis:
+    zeros, or the cells on the opposite edge for a wrapping kernel. Axes are padded last first, each
+    with one slice per block of the axes before it. Returns the padded bytes."""
+    padded = bytes(lanes)
+    item = 1
+    for size, reach in reversed(list(zip(shape, kernel.reach))):
+        block = size * item
+        if reach:
+            blocks = [padded[start:start + block] for start in range(0, len(padded), block)]
+            if kernel.wrap:
+                padded = b"".join(wrap_row(part, reach, item) for part in blocks)
+            else:
+                border = bytes(reach * item)
+                padded = border + (border * 2).join(blocks) + border
+        item *= size + 2 * reach
+    return padded
+
+def unpad_lanes(padded, shape, reach):
+    """Cuts the inner shape back out of a buffer padded by pad_lanes, first axis first."""
+    padded_shape = [size + 2 * r for size, r in zip(shape, reach)]
+    item = len(padded)
+    blocks = [padded]
+    for axis, (size, r) in enumerate(zip(shape, reach)):
+        item //= padded_shape[axis]
+        if r:
+            blocks = [part[r * item:(r + size) * item] for part in blocks]
+        if axis + 1 < len(shape) and reach[axis + 1:] != (0,) * (len(shape) - axis - 1):
+            blocks = [part[start:start + item] for part in blocks for start in range(0, len(part), item)]
+        else:
+            break
+    return bytearray(b"".join(blocks))
+
+def kernel_counts_nd(cells, shape, kernel=8):
+    """Numbers a whole board of any number of dimensions in one pass: returns a new bytearray of
+    cell codes (row-major over shape) with MINE where cells has a mine and the kernel count of mines
+    everywhere else.
+
+    The padded mine layer is read as one Python int with a byte per cell, so moving every cell by an
+    offset is a single shift of that int, and the counts are the sum of one shifted copy per offset.
+    Counts stay below 255, so no byte carries into the next; OR-ing in 255 at every mine restores the
+    mines. All the per-cell work happens inside int arithmetic, with no Python loop over cells."""
+    shape = tuple(shape)
+    if not all(shape):
+        return bytearray()
+    kernel = get_kernel(kernel, ndim=len(shape))
+    reach = kernel.reach
+    padded = pad_lanes(cells.translate(MINE_LANES), shape, kernel)
+    strides = [1] * len(shape)
+    for axis in range(len(shape) - 1, 0, -1):
+        strides[axis - 1] = strides[axis] * (shape[axis] + 2 * reach[axis])
+    field = int.from_bytes(padded, "little")
+    total = 0
+    for offset in kernel.offsets:
+        shift = 8 * sum(d * stride for d, stride in zip(offset, strides))
+        total += field >> shift if shift >= 0 else field << -shift
+    total |= field * MINE
+    counts = total.to_bytes(max(len(padded), (total.bit_length() + 7) // 8), "little")[:len(padded)]
+    return unpad_lanes(counts, shape, reach)
+
+def kernel_counts(cells, rows, cols, kernel=MOORE):
+    """Numbers a whole 2D board in one pass with kernel_counts_nd."""
+    return kernel_counts_nd(cells, (rows, cols), kernel)
+
+def sparse_kernel_counts(mine_indices, rows, cols, kernel=MOORE):
+    """Counts mines per neighbouring cell by visiting only the mines, for boards too large to lay out
+    densely. Returns {flat index: count} for the non-mine cells with a non-zero count."""
+    kernel = get_kernel(kernel)
+    mine_indices = set(mine_indices)
+    counts = defaultdict(int)
+    for index in mine_indices:
+        i, j = divmod(index, cols)
+        # The cell at (i - di, j - dj) sees this mine through offset (di, dj).
+        for di, dj in kernel.offsets:
+            ni, nj = i - di, j - dj
+            if kernel.wrap:
+                ni, nj = ni % rows, nj % cols
+            elif not (0 <= ni < rows and 0 <= nj < cols):
+                continue
+            neighbour = ni * cols + nj
+            if neighbour not in mine_indices:
+                counts[neighbour] += 1
+    return counts
@@ -1,150 +1,287 @@
 import random
-from collections import defaultdict
+
+from src.board import MINE, Board, BoardND
+from src.instrumentation import NULL_PROBE, start_probe
+from src.kernels import MOORE, ORTHOGONAL, get_kernel, kernel_counts, kernel_counts_nd, sparse_kernel_counts
+from src.neighbours import DIRECTIONS, DIAGONAL_DIRECTIONS
+from src.prng import CounterRNG, hash_key
 
 def generate_positions(rows, cols):
     """Helper function to generate all positions in the grid."""
     return [(i, j) for i in range(rows) for j in range(cols)]
 
+def sample_indices(total, k, rng=random):
+    """Helper function to pick k distinct flat cell indices out of range(total).
+    Sampling from a range never materializes the cells: random.sample keeps a set of picks (O(k))
+    for sparse boards and only copies the population (O(total) ints) when k is a large fraction of it.
+    The picks are the same ones random.sample(generate_positions(...), k) would make for the same seed."""
+    return rng.sample(range(total), k)
+
+def mines_for_density(total_cells, density):
+    """Helper function to turn a mine density into a mine count, rounding to the nearest integer so
+    float error (100 * 0.29 is 28.999...) does not drop a mine. Every density-based API uses it."""
+    return round(total_cells * density)
+
+def sample_positions(rows, cols, k, rng=random):
+    """Helper function to pick k distinct random (row, col) positions, decoding flat indices."""
+    return [divmod(index, cols) for index in sample_indices(rows * cols, k, rng)]
+
 def get_adjacent_positions(i, j, rows, cols, include_diagonals=True):
     """Helper function to get valid adjacent positions."""
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    if include_diagonals:
-        directions += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    directions = DIRECTIONS + DIAGONAL_DIRECTIONS if include_diagonals else DIRECTIONS
     return [
         (i + di, j + dj)
         for di, dj in directions
         if 0 <= i + di < rows and 0 <= j + dj < cols
     ]
 
-def minesweeper_basic(gridSize=[], mines=[]):
+def new_grid(rows, cols, as_board=False, sparse=False, probe=NULL_PROBE):
+    """Helper function to create an empty grid: a list of lists, a compact Board or a SparseBoard."""
+    if sparse:
+        from src.sparse import SparseBoard
+        grid = SparseBoard(rows, cols)
+    elif as_board:
+        grid = Board(rows, cols)
+    else:
+        grid = [["." for _ in range(cols)] for _ in range(rows)]
+    probe.lap("allocate", grid, touched=0 if sparse else rows * cols)
+    return grid
+
+def minesweeper_basic(gridSize=[], mines=[], as_board=False):
     if not gridSize:
-        return []
+        return new_grid(0, 0, as_board)
+    probe = start_probe("minesweeper_basic")
     rows, cols = gridSize
-    grid = [["." for _ in range(cols)] for _ in range(rows)]
+    grid = new_grid(rows, cols, as_board, probe=probe)
     
     for row, col in mines:
         grid[row][col] = "*"
-        
+    
+    probe.finish("place", touched=len(mines))
     return grid
 
-def minesweeper_random(gridSize=[], mines=[], ones=0, multiple_mines=False, multiple_ones=False):
+def minesweeper_random(gridSize=[], mines=[], ones=0, multiple_mines=False, multiple_ones=False, as_board=False, rng=random):
     """Handles single/multiple mine placement with optional adjacent '1's.
     Developed to support basic random placement, then extended for multiple mines and '1's placement cases."""
     if not gridSize:
-        return []
+        return new_grid(0, 0, as_board)
     
+    probe = start_probe("minesweeper_random")
     rows, cols = gridSize
-    grid = [["." for _ in range(cols)] for _ in range(rows)]
-    positions = generate_positions(rows, cols)
+    grid = new_grid(rows, cols, as_board, probe=probe)
+    total_squares = rows * cols
     
     if multiple_mines:
-        total_squares = rows * cols
         max_mines = min(total_squares - 1, total_squares // 2)
-        num_mines = random.randint(2, max_mines)
-        mine_positions = random.sample(positions, num_mines)
+        num_mines = rng.randint(2, max_mines)
+        mine_positions = sample_positions(rows, cols, num_mines, rng)
+        probe.lap("sample", mine_positions)
         for pos in mine_positions:
             grid[pos[0]][pos[1]] = "*"
+        probe.lap("place", touched=num_mines)
     else:
-        mine_pos = random.choice(positions)
+        mine_pos = divmod(rng.choice(range(total_squares)), cols)
         grid[mine_pos[0]][mine_pos[1]] = "*"
+        probe.lap("place", touched=1)
         
         if ones > 0 or multiple_ones:
             adjacent_positions = get_adjacent_positions(mine_pos[0], mine_pos[1], rows, cols, include_diagonals=False)
+            probe.lap("neighbours", adjacent_positions, lookups=len(adjacent_positions))
             
             if adjacent_positions:
                 if multiple_ones:
-                    num_ones = random.randint(1, len(adjacent_positions))
-                    one_positions = random.sample(adjacent_positions, num_ones)
+                    num_ones = rng.randint(1, len(adjacent_positions))
+                    one_positions = rng.sample(adjacent_positions, num_ones)
                     for pos in one_positions:
                         grid[pos[0]][pos[1]] = "1"
                 else:
-                    one_pos = random.choice(adjacent_positions)
+                    num_ones = 1
+                    one_pos = rng.choice(adjacent_positions)
                     grid[one_pos[0]][one_pos[1]] = "1"
+                probe.lap("convert", touched=num_ones)
     
+    probe.finish()
     return grid
 
-def minesweeper_random_revised(gridSize=[]):
+def minesweeper_random_revised(gridSize=[], as_board=False, rng=random):
     """Creates a grid with multiple mines and multiple adjacent '1's in one pass.
     Consolidates the multiple mines and multiple '1's placement into a more efficient implementation."""
     if not gridSize:
-        return []
+        return new_grid(0, 0, as_board)
     
+    probe = start_probe("minesweeper_random_revised")
     rows, cols = gridSize
-    grid = [["." for _ in range(cols)] for _ in range(rows)]
+    grid = new_grid(rows, cols, as_board, probe=probe)
     
     total_squares = rows * cols
     max_mines = min(total_squares - 1, total_squares // 2)
-    num_mines = random.randint(1, max_mines)
-    positions = generate_positions(rows, cols)
-    mine_positions = set(random.sample(positions, num_mines))
+    num_mines = rng.randint(1, max_mines)
+    mine_positions = set(sample_positions(rows, cols, num_mines, rng))
+    probe.lap("sample", mine_positions)
     
     for pos in mine_positions:
         grid[pos[0]][pos[1]] = "*"
+    probe.lap("place", touched=num_mines)
     
     possible_one_positions = set()
+    lookups = 0
     for mi, mj in mine_positions:
         adjacent_positions = get_adjacent_positions(mi, mj, rows, cols, include_diagonals=False)
+        lookups += len(adjacent_positions)
         possible_one_positions.update(
             (ni, nj) for ni, nj in adjacent_positions if grid[ni][nj] == "."
         )
+    probe.lap("neighbours", possible_one_positions, lookups=lookups)
     
     if possible_one_positions:
-        num_ones = random.randint(1, len(possible_one_positions))
-        one_positions = random.sample(list(possible_one_positions), num_ones)
+        num_ones = rng.randint(1, len(possible_one_positions))
+        one_positions = rng.sample(list(possible_one_positions), num_ones)
         for pos in one_positions:
             grid[pos[0]][pos[1]] = "1"
+        probe.lap("convert", touched=num_ones)
     
+    probe.finish()
     return grid
 
-def minesweeper_with_numbers(gridSize=[], mines=[]):
-    """Places mines at specified positions (or randomly if none provided) and marks each adjacent cell with number of mines next to it, excluding diagonals."""
+def minesweeper_with_kernel(gridSize=[], kernel=8, mines=[], wrap=None, as_board=False, rng=random, sparse=False, num_mines=None, with_regions=False, probe_name="minesweeper_with_kernel"):
+    """Places mines at specified positions (or randomly if none provided) and marks every other cell with the number of mines its kernel sees.
+    kernel is a Kernel, 4, 8, "knight" or a list of offsets; with_regions=True (Moore kernel only) returns (grid, RegionIndex)."""
+    kernel = get_kernel(kernel, wrap)
+    if with_regions and kernel != MOORE:
+        raise ValueError("with_regions needs the Moore kernel without wrap-around")
     if not gridSize:
-        return []
+        grid = new_grid(0, 0, as_board, sparse)
+        if with_regions:
+            from src.regions import RegionIndex
+            return grid, RegionIndex(grid)
+        return grid
     
+    probe = start_probe(probe_name)
     rows, cols = gridSize
-    grid = [["." for _ in range(cols)] for _ in range(rows)]
+    grid = new_grid(rows, cols, not sparse, sparse, probe)
     
-    if not mines:
+    if mines:
+        mines = set(map(tuple, mines))
+        mine_indices = [(row % rows) * cols + col % cols for row, col in mines]
+        probe.lap("sample", mines, mine_indices)
+    else:
         total_squares = rows * cols
-        num_mines = random.randint(1, total_squares // 4)
-        mines = set(random.sample(generate_positions(rows, cols), num_mines))
+        if num_mines is None:
+            num_mines = rng.randint(1, total_squares // 4)
+        mine_indices = sample_indices(total_squares, num_mines, rng)
+        probe.lap("sample", mine_indices)
     
-    for row, col in mines:
-        grid[row][col] = "*"
-    
-    adjacent_mine_counts = defaultdict(int)
-    for row, col in mines:
-        for ni, nj in get_adjacent_positions(row, col, rows, cols, include_diagonals=False):
-            if (ni, nj) not in mines:
-                adjacent_mine_counts[(ni, nj)] += 1
+    if mines:
+        for row, col in mines:
+            grid[row][col] = "*"
+    elif sparse:
+        for index in mine_indices:
+            grid[index // cols][index % cols] = "*"
+    else:
+        cells = grid.cells
+        for index in mine_indices:
+            cells[index] = MINE
+    probe.lap("place", touched=len(mine_indices))
     
-    for (i, j), count in adjacent_mine_counts.items():
-        grid[i][j] = str(count)
+    if sparse:
+        adjacent_mine_counts = sparse_kernel_counts(mine_indices, rows, cols, kernel)
+        probe.lap("count", adjacent_mine_counts, lookups=len(kernel) * len(mine_indices))
+        for index, count in adjacent_mine_counts.items():
+            grid[index // cols][index % cols] = str(count)
+        probe.lap("convert", touched=len(adjacent_mine_counts))
+    else:
+        grid.cells = kernel_counts(grid.cells, rows, cols, kernel)
+        probe.lap("count", grid.cells, lookups=len(kernel) * rows * cols)
+        numbers = rows * cols - grid.cells.count(0) - grid.cells.count(MINE) if probe else 0
+        if as_board:
+            probe.lap("convert", touched=numbers)
+        else:
+            grid = grid.to_lists()
+            probe.lap("convert", grid, touched=numbers)
     
+    if with_regions:
+        # Imported here so plain generation does not pay for the reveal engine and re.
+        from src.regions import RegionIndex
+        regions = RegionIndex(grid)
+        probe.finish("regions")
+        return grid, regions
+    probe.finish()
     return grid
 
-def minesweeper_with_adjacent_mines(gridSize=[]):
-    """Randomly places mines and marks each adjacent cell with count of neighboring mines, including diagonals."""
-    if not gridSize:
-        return []
-    
-    rows, cols = gridSize
-    grid = [["." for _ in range(cols)] for _ in range(rows)]
+def minesweeper_with_numbers(gridSize=[], mines=[], as_board=False, rng=random, sparse=False, num_mines=None):
+    """Places mines at specified positions (or randomly if none provided) and marks each adjacent cell with number of mines next to it, excluding diagonals.
+    With sparse=True the result is a SparseBoard, and num_mines fixes the random mine count (useful for huge, sparse boards).
+    Counts come from minesweeper_with_kernel with the orthogonal kernel."""
+    return minesweeper_with_kernel(gridSize, ORTHOGONAL, mines, as_board=as_board, rng=rng, sparse=sparse,
+                                   num_mines=num_mines, probe_name="minesweeper_with_numbers")
+
+def minesweeper_with_adjacent_mines(gridSize=[], as_board=False, rng=random, sparse=False, num_mines=None, with_regions=False):
+    """Randomly places mines and marks each adjacent cell with count of neighboring mines, including diagonals.
+    With sparse=True the result is a SparseBoard, and num_mines fixes the mine count (useful for huge, sparse boards).
+    With with_regions=True it returns (grid, RegionIndex) so reveals become lookups instead of flood fills.
+    Counts come from minesweeper_with_kernel with the Moore kernel."""
+    return minesweeper_with_kernel(gridSize, MOORE, as_board=as_board, rng=rng, sparse=sparse, num_mines=num_mines,
+                                   with_regions=with_regions, probe_name="minesweeper_with_adjacent_mines")
+
+def minesweeper_nd(shape=(), kernel="moore", mines=[], wrap=None, as_board=False, rng=random, num_mines=None):
+    """Generates a board with any number of dimensions, e.g. shape (layers, rows, cols) for 3D, numbered across layer boundaries.
+    kernel is "moore", "orthogonal", a neighbour count, a Kernel or a list of offsets; as_board=True returns a BoardND."""
+    if not shape:
+        return BoardND(()) if as_board else []
     
-    total_squares = rows * cols
-    num_mines = random.randint(1, total_squares // 4)
-    mine_positions = set(random.sample(generate_positions(rows, cols), num_mines))
+    shape = tuple(shape)
+    kernel = get_kernel(kernel, wrap, ndim=len(shape))
+    probe = start_probe("minesweeper_nd")
+    board = BoardND(shape)
+    total_cells = len(board.cells)
+    probe.lap("allocate", board, touched=total_cells)
     
-    for i, j in mine_positions:
-        grid[i][j] = "*"
+    if mines:
+        mine_indices = {board.index(tuple(position)) for position in mines}
+    else:
+        if num_mines is None:
+            num_mines = rng.randint(1, total_cells // 4)
+        mine_indices = sample_indices(total_cells, num_mines, rng)
+    probe.lap("sample", mine_indices)
     
-    adjacent_mine_counts = defaultdict(int)
-    for i, j in mine_positions:
-        for ni, nj in get_adjacent_positions(i, j, rows, cols, include_diagonals=True):
-            if (ni, nj) not in mine_positions:
-                adjacent_mine_counts[(ni, nj)] += 1
+    cells = board.cells
+    for index in mine_indices:
+        cells[index] = MINE
+    probe.lap("place", touched=len(mine_indices))
     
-    for (i, j), count in adjacent_mine_counts.items():
-        grid[i][j] = str(count)
+    board.cells = kernel_counts_nd(cells, shape, kernel)
+    probe.lap("count", board.cells, lookups=len(kernel) * total_cells)
     
-    return grid
\ No newline at end of file
+    numbers = total_cells - board.cells.count(0) - board.cells.count(MINE) if probe else 0
+    if as_board:
+        probe.finish("convert", touched=numbers)
+        return board
+    grid = board.to_lists()
+    probe.finish("convert", grid, touched=numbers)
+    return grid
+
+def counting_generator(neighbourhood=8):
+    """Helper function to pick the counting generator for a neighbourhood: 4 for minesweeper_with_numbers, 8 for minesweeper_with_adjacent_mines."""
+    if neighbourhood == 4:
+        return minesweeper_with_numbers
+    if neighbourhood == 8:
+        return minesweeper_with_adjacent_mines
+    raise ValueError(f"neighbourhood must be 4 or 8, got {neighbourhood}")
+
+def board_rng(gridSize, density, board_id, neighbourhood=8):
+    """Helper function to create the counter-based generator for one board id, plus its mine count.
+    The mine count is mines_for_density(rows * cols, density) and is hashed into the key instead of the float density."""
+    rows, cols = gridSize
+    num_mines = mines_for_density(rows * cols, density)
+    return CounterRNG(hash_key(rows, cols, num_mines, neighbourhood, board_id)), num_mines
+
+def minesweeper_from_id(gridSize=[], density=0.2, board_id=0, neighbourhood=8, as_board=False, sparse=False):
+    """Generates the board fully determined by (gridSize, density, neighbourhood, board_id).
+    Draws come from a CounterRNG keyed by those values instead of the global random state, so the
+    same id gives the same board on every machine and Python version and a stored board can be
+    replaced by its id. Regenerating costs the same as generating."""
+    generator = counting_generator(neighbourhood)
+    if not gridSize:
+        return new_grid(0, 0, as_board, sparse)
+    rng, num_mines = board_rng(gridSize, density, board_id, neighbourhood)
+    return generator(gridSize, as_board=as_board, rng=rng, sparse=sparse, num_mines=num_mines)
@@ -0,0 +1,106 @@
+from array import array
+from collections import OrderedDict
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+DIAGONAL_DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+# Shapes with more cells than this are not tabulated (the table would cost ~32 bytes per cell);
+# callers fall back to computing neighbours with bounds checks.
+MAX_TABLE_CELLS = 1 << 18
+
+class NeighbourTable:
+    """Precomputed neighbours of every cell of one board shape in CSR form: the flat indices of the
+    neighbours of cell k are indices[offsets[k]:offsets[k + 1]]."""
+    __slots__ = ("rows", "cols", "include_diagonals", "offsets", "indices")
+
+    def __init__(self, rows, cols, include_diagonals=True):
+        self.rows = rows
+        self.cols = cols
+        self.include_diagonals = include_diagonals
+        directions = DIRECTIONS + DIAGONAL_DIRECTIONS if include_diagonals else DIRECTIONS
+        self.offsets = array("i", [0])
+        self.indices = array("i")
+        for i in range(rows):
+            for j in range(cols):
+                self.indices.extend(
+                    (i + di) * cols + j + dj
+                    for di, dj in directions
+                    if 0 <= i + di < rows and 0 <= j + dj < cols
+                )
+                self.offsets.append(len(self.indices))
+
+    def neighbours(self, index):
+        """Returns the flat indices of the neighbours of the cell at flat index."""
+        return self.indices[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def nbytes(self):
+        return (len(self.offsets) + len(self.indices)) * self.indices.itemsize
+
+class NeighbourCache:
+    """LRU-bounded cache of NeighbourTables keyed by (rows, cols, include_diagonals), for code that
+    looks up the neighbours of one cell at a time (the solver, no-guess repairs and chording).
+    Whole-board counting goes through kernel_counts in src/kernels.py instead.
+    Safe to share between threads: a race can at worst build a table twice."""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, rows, cols, include_diagonals=True):
+        """Returns the table for the shape, or None when the shape is too large to tabulate."""
+        key = (rows, cols, include_diagonals)
+        table = self.tables.get(key)
+        if table is not None:
+            self.hits += 1
+            try:
+                self.tables.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread between the lookup and here; the table is still valid.
+                pass
+            return table
+        if rows * cols > MAX_TABLE_CELLS:
+            return None
+        self.misses += 1
+        table = self.tables[key] = NeighbourTable(rows, cols, include_diagonals)
+        while len(self.tables) > self.maxsize:
+            self.tables.popitem(last=False)
+        return table
+
+    def memory_bytes(self):
+        """Bytes used by the index arrays of all cached tables."""
+        return sum(table.nbytes for table in self.tables.values())
+
+    def stats(self):
+        return {
+            "tables": len(self.tables),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": self.memory_bytes(),
+        }
+
+    def clear(self):
+        self.tables.clear()
+        self.hits = self.misses = 0
+
+NEIGHBOUR_CACHE = NeighbourCache()
+
+def neighbour_table(rows, cols, include_diagonals=True):
+    """Returns the shared cached NeighbourTable for the shape, or None when it is too large."""
+    return NEIGHBOUR_CACHE.get(rows, cols, include_diagonals)
+
+def neighbour_indices(index, rows, cols, include_diagonals=True):
+    """Returns the flat indices of the neighbours of a cell, from the cached table when there is one."""
+    table = NEIGHBOUR_CACHE.get(rows, cols, include_diagonals)
+    if table is not None:
+        return table.neighbours(index)
+    i, j = divmod(index, cols)
+    directions = DIRECTIONS + DIAGONAL_DIRECTIONS if include_diagonals else DIRECTIONS
+    return [
+        (i + di) * cols + j + dj
+        for di, dj in directions
+        if 0 <= i + di < rows and 0 <= j + dj < cols
+    ]
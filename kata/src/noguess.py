@@ -0,0 +1,107 @@
+import random
+
+from src.board import MINE, Board
+from src.main_v2 import new_grid
+from src.neighbours import neighbour_indices
+from src.solver import UNKNOWN, Solver
+
+class NoGuessGenerator:
+    """Generates boards that the solver can finish from the first click without guessing.
+    The first click and its neighbours never hold mines. Each candidate is verified by solving it;
+    the solver stops as soon as it is stuck, and instead of placing all mines again the generator
+    moves one mine off the stuck frontier into the unexplored part of the board, updating only the
+    counts around the two cells, and solves the repaired board. Counters of attempts, repairs and
+    rejections are kept."""
+
+    def __init__(self, gridSize, num_mines, neighbourhood=8, rng=random, max_repairs=None, max_attempts=100):
+        self.rows, self.cols = gridSize
+        self.num_mines = num_mines
+        self.neighbourhood = neighbourhood
+        self.include_diagonals = neighbourhood == 8
+        self.rng = rng
+        self.max_repairs = max_repairs if max_repairs is not None else 4 * num_mines + 10
+        self.max_attempts = max_attempts
+        self.attempts = 0
+        self.repairs = 0
+        self.rejections = 0
+
+    def neighbours(self, index):
+        return neighbour_indices(index, self.rows, self.cols, self.include_diagonals)
+
+    def safe_zone(self, first_click):
+        index = first_click[0] * self.cols + first_click[1]
+        return {index, *self.neighbours(index)}
+
+    def place(self, safe_zone):
+        """Returns cell codes for a random board with no mines in safe_zone."""
+        allowed = [index for index in range(self.rows * self.cols) if index not in safe_zone]
+        if self.num_mines > len(allowed):
+            raise ValueError(f"{self.num_mines} mines do not fit outside the first-click safe zone")
+        cells = bytearray(self.rows * self.cols)
+        for mine in self.rng.sample(allowed, self.num_mines):
+            cells[mine] = MINE
+            for neighbour in self.neighbours(mine):
+                if cells[neighbour] != MINE:
+                    cells[neighbour] += 1
+        return cells
+
+    def move_mine(self, cells, source, target):
+        """Moves a mine from source to target, fixing only the counts of the cells around them."""
+        count = 0
+        for neighbour in self.neighbours(source):
+            if cells[neighbour] == MINE:
+                count += 1
+            else:
+                cells[neighbour] -= 1
+        cells[source] = count
+        for neighbour in self.neighbours(target):
+            if cells[neighbour] != MINE:
+                cells[neighbour] += 1
+        cells[target] = MINE
+
+    def repair(self, cells, solver, safe_zone):
+        """Picks a mine on the stuck frontier and an unknown cell away from it; returns False if there is none."""
+        frontier_mines = [cell for cell in solver.frontier if cells[cell] == MINE]
+        interior = [
+            index for index, state in enumerate(solver.state)
+            if state == UNKNOWN and cells[index] != MINE and index not in solver.frontier and index not in safe_zone
+        ]
+        if not frontier_mines or not interior:
+            return False
+        self.move_mine(cells, self.rng.choice(frontier_mines), self.rng.choice(interior))
+        return True
+
+    def generate(self, first_click=None, as_board=False):
+        """Returns a no-guess board whose first click at first_click (default: the centre) is safe."""
+        if first_click is None:
+            first_click = (self.rows // 2, self.cols // 2)
+        safe_zone = self.safe_zone(first_click)
+        for _ in range(self.max_attempts):
+            self.attempts += 1
+            cells = self.place(safe_zone)
+            for _ in range(self.max_repairs + 1):
+                solver = Solver(Board(self.rows, self.cols, cells), self.neighbourhood)
+                if solver.solve(first_click).solved:
+                    board = Board(self.rows, self.cols, cells)
+                    return board if as_board else board.to_lists()
+                if not self.repair(cells, solver, safe_zone):
+                    break
+                self.repairs += 1
+            self.rejections += 1
+        raise RuntimeError(f"No no-guess board found in {self.max_attempts} attempts")
+
+def minesweeper_no_guess(gridSize=[], num_mines=None, first_click=None, neighbourhood=8, as_board=False, rng=random):
+    """Generates a board that can be solved from first_click (default: the centre) without guessing.
+    num_mines defaults to a random count like minesweeper_with_adjacent_mines, capped so it fits
+    outside the first-click safe zone; the board has no mines when nothing fits there."""
+    if not gridSize:
+        return new_grid(0, 0, as_board)
+    rows, cols = gridSize
+    if first_click is None:
+        first_click = (rows // 2, cols // 2)
+    if num_mines is None:
+        index = first_click[0] * cols + first_click[1]
+        outside = rows * cols - 1 - len(neighbour_indices(index, rows, cols, neighbourhood == 8))
+        cap = min(rows * cols // 4, outside)
+        num_mines = rng.randint(1, cap) if cap > 0 else 0
+    return NoGuessGenerator(gridSize, num_mines, neighbourhood, rng).generate(first_click, as_board)
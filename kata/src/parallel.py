@@ -0,0 +1,44 @@
+import hashlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+
+def board_seed(master_seed, board_index):
+    """Derives the seed of one board from (master_seed, board_index), independent of which worker builds it."""
+    digest = hashlib.blake2b(f"{master_seed}:{board_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def generate_chunk(generator, gridSize, master_seed, start, stop, as_board=False):
+    """Builds boards start..stop-1, each from its own random.Random seeded by board_seed."""
+    return [
+        generator(gridSize, as_board=as_board, rng=random.Random(board_seed(master_seed, index)))
+        for index in range(start, stop)
+    ]
+
+def _generate_chunk(args):
+    return generate_chunk(*args)
+
+def iter_parallel(gridSize, n, generator=minesweeper_with_adjacent_mines, master_seed=0,
+                  workers=None, chunk_size=64, as_board=False):
+    """Yields n boards in board_index order, generated by a process pool in chunks of chunk_size boards.
+    generator is a module-level minesweeper_* function that takes as_board and rng, such as
+    minesweeper_with_numbers or minesweeper_with_adjacent_mines. The boards only depend on
+    master_seed, so the output is identical for any number of workers."""
+    chunks = [
+        (generator, gridSize, master_seed, start, min(start + chunk_size, n), as_board)
+        for start in range(0, n, chunk_size)
+    ]
+    if workers == 1:
+        for chunk in chunks:
+            yield from _generate_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for boards in pool.map(_generate_chunk, chunks):
+            yield from boards
+
+def generate_parallel(gridSize, n, generator=minesweeper_with_adjacent_mines, master_seed=0,
+                      workers=None, chunk_size=64, as_board=False):
+    """Returns a list of n boards generated in parallel; see iter_parallel."""
+    return list(iter_parallel(gridSize, n, generator, master_seed, workers, chunk_size, as_board))
@@ -0,0 +1,75 @@
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+def mix64(z):
+    """SplitMix64 finalizer: a bijective scramble of a 64-bit integer."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+def hash_key(*values):
+    """Folds non-negative integers into one 64-bit key, order-sensitively."""
+    key = 0
+    for value in values:
+        key = mix64((key + GOLDEN_GAMMA + value) & MASK64)
+    return key
+
+class CounterRNG:
+    """Counter-based generator: draw number n of stream key is mix64(key + (n + 1) * GOLDEN_GAMMA),
+    the same values SplitMix64 seeded with key produces in sequence. Any draw can be computed
+    directly with at(n), there is no hidden state beyond the counter, and only 64-bit integer
+    arithmetic is used, so results do not depend on the machine or Python version.
+    Provides the randint/sample/choice subset of random.Random that the generators use as rng."""
+    __slots__ = ("key", "counter")
+
+    def __init__(self, key, counter=0):
+        self.key = key & MASK64
+        self.counter = counter
+
+    def at(self, n):
+        return mix64((self.key + (n + 1) * GOLDEN_GAMMA) & MASK64)
+
+    def next64(self):
+        value = self.at(self.counter)
+        self.counter += 1
+        return value
+
+    def randbelow(self, n):
+        """Uniform integer in [0, n) by rejection, so there is no modulo bias."""
+        if n <= 0:
+            raise ValueError("randbelow() needs a positive bound")
+        limit = (1 << 64) - (1 << 64) % n
+        value = self.next64()
+        while value >= limit:
+            value = self.next64()
+        return value % n
+
+    def randrange(self, start, stop=None):
+        if stop is None:
+            start, stop = 0, start
+        return start + self.randbelow(stop - start)
+
+    def randint(self, a, b):
+        return a + self.randbelow(b - a + 1)
+
+    def random(self):
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
+
+    def sample(self, population, k):
+        """k distinct items of population, chosen with Floyd's algorithm in O(k) draws and memory,
+        returned in the order they were picked."""
+        n = len(population)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        picked = set()
+        order = []
+        for j in range(n - k, n):
+            t = self.randbelow(j + 1)
+            if t in picked:
+                t = j
+            picked.add(t)
+            order.append(t)
+        return [population[t] for t in order]
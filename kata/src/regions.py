@@ -0,0 +1,60 @@
+from array import array
+from re import Match
+
+from src.reveal import NOT_EMPTY, RevealEngine
+
+# Maps empty cells to 0 and every other cell code to 1.
+NOT_EMPTY_MASK = bytes([0] + [1] * 255)
+NO_REGION = -1
+
+class RegionIndex:
+    """Precomputed reveal results: a region id for every empty cell and, per region, the flat
+    indices of its empty cells plus the number cells bordering it. Clicking an empty cell is then a
+    lookup of a prebuilt list instead of a flood fill."""
+    __slots__ = ("rows", "cols", "region_of", "region_cells")
+
+    def __init__(self, grid):
+        engine = RevealEngine(grid)
+        self.rows, self.cols = engine.rows, engine.cols
+        cells, cols = engine.cells, engine.cols
+        self.region_of = array("i", [NO_REGION]) * len(cells)
+        self.region_cells = []
+
+        # Numbers and mines start out as seen, so each fill only walks the empty cells of one region.
+        seen = bytearray(cells.translate(NOT_EMPTY_MASK))
+        index = seen.find(0)
+        while index != -1:
+            region = len(self.region_cells)
+            spans = engine.reveal_spans(*divmod(index, cols), seen)
+            region_cells = array("i")
+            border = set()
+            for start, stop in spans:
+                self.region_of[start:stop] = array("i", [region]) * (stop - start)
+                region_cells.extend(range(start, stop))
+                row_start = start - start % cols
+                lo, hi = max(start - 1, row_start), min(stop + 1, row_start + cols)
+                for offset in (-cols, 0, cols):
+                    if 0 <= row_start + offset < len(cells):
+                        border.update(map(Match.start, NOT_EMPTY.finditer(cells, lo + offset, hi + offset)))
+            region_cells.extend(sorted(border))
+            self.region_cells.append(region_cells)
+            index = seen.find(0, index)
+
+    def region(self, i, j):
+        """Returns the region id of the cell at (i, j), or NO_REGION if it is not empty."""
+        return self.region_of[i * self.cols + j]
+
+    def reveal_indices(self, i, j):
+        """Returns the flat indices revealed by clicking (i, j) without any filling."""
+        index = i * self.cols + j
+        region = self.region_of[index]
+        if region == NO_REGION:
+            return array("i", [index])
+        return self.region_cells[region]
+
+    def reveal(self, i, j):
+        """Returns the set of (row, col) positions revealed by clicking (i, j)."""
+        return {divmod(index, self.cols) for index in self.reveal_indices(i, j)}
+
+    def __len__(self):
+        return len(self.region_cells)
@@ -0,0 +1,59 @@
+from src.board import SINGLE_CHAR_CODES, TEXT_CODES, Board
+
+def grid_shape(grid):
+    if hasattr(grid, "rows"):
+        return grid.rows, grid.cols
+    return len(grid), len(grid[0]) if grid else 0
+
+def clip_viewport(rows, cols, viewport):
+    """Returns (top, left, height, width) of viewport clipped to the board; the whole board if viewport is None."""
+    if viewport is None:
+        return 0, 0, rows, cols
+    top, left, height, width = viewport
+    top, left = max(0, min(top, rows)), max(0, min(left, cols))
+    return top, left, max(0, min(height, rows - top)), max(0, min(width, cols - left))
+
+def render_codes(codes, width):
+    """Renders rows of width single-character cell codes laid out back to back.
+    Each code becomes its symbol followed by a space, then the space after the last cell of each
+    row is overwritten with a newline, all with C-level slice assignments."""
+    out = bytearray(b" ") * (2 * len(codes))
+    out[0::2] = codes.translate(TEXT_CODES)
+    out[2 * width - 1::2 * width] = b"\n" * (len(codes) // width)
+    return out.decode("ascii")
+
+def iter_chunks(grid, viewport=None, chunk_cells=1 << 20):
+    """Yields the text of grid (or of the viewport (top, left, height, width)) in pieces of about
+    chunk_cells cells, one line per row with cells separated by spaces."""
+    rows, cols = grid_shape(grid)
+    top, left, height, width = clip_viewport(rows, cols, viewport)
+    if not height or not width:
+        return
+    step = max(1, chunk_cells // width)
+    for start in range(top, top + height, step):
+        stop = min(start + step, top + height)
+        if isinstance(grid, Board):
+            cells = grid.cells
+            if width == cols:
+                codes = bytes(cells[start * cols:stop * cols])
+            else:
+                codes = b"".join(cells[i * cols + left:i * cols + left + width] for i in range(start, stop))
+            # Counts of 10 or more (kernels with more than 9 offsets) have no single-character symbol;
+            # they need the general path.
+            if not codes.translate(None, SINGLE_CHAR_CODES):
+                yield render_codes(codes, width)
+                continue
+        yield "".join(" ".join(grid[i][left:left + width]) + "\n" for i in range(start, stop))
+
+def render(grid, viewport=None):
+    """Returns the whole text of grid (or of a viewport of it) built as one string."""
+    return "".join(iter_chunks(grid, viewport))
+
+def write_grid(grid, file, viewport=None, chunk_cells=1 << 20):
+    """Streams the text of grid (or of a viewport of it) to a file object in chunks, with one
+    write per chunk. Returns the number of characters written."""
+    written = 0
+    for chunk in iter_chunks(grid, viewport, chunk_cells):
+        file.write(chunk)
+        written += len(chunk)
+    return written
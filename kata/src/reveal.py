@@ -0,0 +1,101 @@
+import re
+
+from src.board import EMPTY, Board
+
+# Finds the next cell that is not empty; used to extend a run of empty cells at C speed.
+NOT_EMPTY = re.compile(rb"[^\x00]")
+EMPTY_CELL = re.compile(rb"\x00")
+
+def flat_cells(grid):
+    """Returns (rows, cols, cells) where cells holds one Board cell code per cell in row-major order."""
+    board = grid if isinstance(grid, Board) else Board.from_lists(grid)
+    return board.rows, board.cols, bytes(board.cells)
+
+def mark_unseen(seen, start, stop, spans):
+    """Sets the unseen cells of [start, stop) in seen and appends them to spans as maximal runs."""
+    position = seen.find(0, start, stop)
+    while position != -1:
+        match = NOT_EMPTY.search(seen, position, stop)
+        end = match.start() if match else stop
+        seen[position:end] = b"\x01" * (end - position)
+        spans.append((position, end))
+        position = seen.find(0, end, stop) if end < stop else -1
+
+class RevealEngine:
+    """Reveals cells on a finished grid, e.g. from minesweeper_with_adjacent_mines.
+    Clicking an empty cell opens its whole region of empty cells (8-connected) plus the number
+    cells bordering it, using an iterative scanline fill over flat indices; nothing recurses."""
+    __slots__ = ("rows", "cols", "cells", "reversed_cells")
+
+    def __init__(self, grid):
+        self.rows, self.cols, self.cells = flat_cells(grid)
+        self.reversed_cells = self.cells[::-1]
+
+    def _run_end(self, index, row_end):
+        match = NOT_EMPTY.search(self.cells, index, row_end)
+        return match.start() if match else row_end
+
+    def _run_start(self, index, row_start):
+        last = len(self.cells) - 1
+        match = NOT_EMPTY.search(self.reversed_cells, last - index, last - row_start + 1)
+        return last - match.start() + 1 if match else row_start
+
+    def reveal_spans(self, i, j, seen=None):
+        """Reveals the cell at (i, j) and returns the newly revealed cells as a list of flat
+        [start, stop) spans, each within one row. seen is an optional bytearray mask whose non-zero
+        cells are already revealed; they are skipped, and newly revealed cells are set to 1 in it."""
+        cols = self.cols
+        cells = self.cells
+        if seen is None:
+            seen = bytearray(len(cells))
+        index = i * cols + j
+        if seen[index]:
+            return []
+        if cells[index] != EMPTY:
+            seen[index] = 1
+            return [(index, index + 1)]
+
+        spans = []
+        # Each pending item is a flat [lo, hi) range of one row that borders a revealed empty run.
+        pending = [(index, index + 1)]
+        while pending:
+            lo, hi = pending.pop()
+            row_start = lo - lo % cols
+            row_end = row_start + cols
+            position = seen.find(0, lo, hi)
+            while position != -1:
+                if cells[position] != EMPTY:
+                    # A run of number cells: stop at the next seen or empty cell.
+                    match = NOT_EMPTY.search(seen, position, hi)
+                    stop = match.start() if match else hi
+                    match = EMPTY_CELL.search(cells, position, stop)
+                    stop = match.start() if match else stop
+                    seen[position:stop] = b"\x01" * (stop - position)
+                    spans.append((position, stop))
+                    position = seen.find(0, stop, hi) if stop < hi else -1
+                    continue
+                start = self._run_start(position, row_start)
+                stop = self._run_end(position, row_end)
+                # The run plus the number cells at either end of it; cells in it that are already
+                # revealed or flagged (e.g. a flag lifted after an earlier cascade) are left out.
+                border_start = max(start - 1, row_start)
+                border_stop = min(stop + 1, row_end)
+                mark_unseen(seen, border_start, border_stop, spans)
+                if row_start > 0:
+                    pending.append((border_start - cols, border_stop - cols))
+                if row_end < len(cells):
+                    pending.append((border_start + cols, border_stop + cols))
+                position = seen.find(0, border_stop, hi) if border_stop < hi else -1
+        return spans
+
+    def reveal(self, i, j, seen=None):
+        """Reveals the cell at (i, j) and returns the set of newly revealed (row, col) positions."""
+        return {
+            divmod(index, self.cols)
+            for start, stop in self.reveal_spans(i, j, seen)
+            for index in range(start, stop)
+        }
+
+def reveal(grid, i, j):
+    """Convenience wrapper: reveals (i, j) on grid and returns the set of revealed (row, col) positions."""
+    return RevealEngine(grid).reveal(i, j)
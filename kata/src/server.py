@@ -0,0 +1,254 @@
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.board import TEXT_CODES
+from src.main_v2 import counting_generator, mines_for_density
+
+# Line protocol, one request per line:
+#   GET ROWSxCOLS DENSITY NEIGHBOURHOOD  -> {"rows": ..., "cols": ..., "grid": ["*1.", ...]}
+#   STATS                                -> the BoardServer.stats() dict
+# Errors are answered with {"error": "..."} and the connection stays open.
+
+# Client read buffer limit: a board line is about one byte per cell plus JSON quoting per row.
+STREAM_LIMIT = 1 << 24
+
+class ServerBusy(Exception):
+    """Raised when a pool already has max_waiting requests waiting for a board."""
+
+def parse_key(size, density, neighbourhood):
+    """Parses the GET fields into a pool key (rows, cols, density, neighbourhood)."""
+    rows, cols = (int(part) for part in size.lower().split("x"))
+    density, neighbourhood = float(density), int(neighbourhood)
+    if rows <= 0 or cols <= 0:
+        raise ValueError(f"grid size must be positive, got {size}")
+    if not 0 <= density < 1:
+        raise ValueError(f"density must be in [0, 1), got {density}")
+    if neighbourhood not in (4, 8):
+        raise ValueError(f"neighbourhood must be 4 or 8, got {neighbourhood}")
+    return rows, cols, density, neighbourhood
+
+def encode_board(board):
+    """Encodes a Board as one JSON line in the JsonlWriter record format."""
+    text = board.cells.translate(TEXT_CODES).decode("ascii")
+    rows = [text[start:start + board.cols] for start in range(0, len(text), board.cols)]
+    record = {"rows": board.rows, "cols": board.cols, "grid": rows}
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+class BoardPool:
+    """Bounded queues of ready boards for one (rows, cols, density, neighbourhood) key.
+    Each of the workers refill tasks has its own rng and blocks while its queue is full, so
+    generation stops while nobody takes boards. By default all workers share one queue of size
+    boards and a request takes whichever board is ready first, so one slow worker never holds up
+    a request while others have boards. With ordered=True each worker gets its own queue of about
+    size / workers boards and requests take from them round-robin in arrival order: board n always
+    comes from worker n % workers, so with a seed the boards handed out do not depend on which
+    thread finishes first, at the cost of waiting on that worker when its share is empty."""
+
+    def __init__(self, key, size, seed=None, workers=1, ordered=False):
+        self.key = key
+        if ordered:
+            self.queues = [asyncio.Queue(maxsize=max(1, -(-size // workers))) for _ in range(workers)]
+        else:
+            self.queues = [asyncio.Queue(maxsize=max(1, size))]
+        # String seeds are hashed with SHA-512 by random.Random, so they do not depend on PYTHONHASHSEED.
+        self.rngs = [random.Random(None if seed is None else f"{seed}/{worker}") for worker in range(workers)]
+        self.turn = 0
+        # Set by a refill task when it fills the last queue.
+        self.filled = asyncio.Event()
+        self.waiting = 0
+        self.generated = 0
+        self.hits = 0
+        self.misses = 0
+        self.tasks = []
+
+    def generate(self, rng):
+        rows, cols, density, neighbourhood = self.key
+        return counting_generator(neighbourhood)([rows, cols], as_board=True, rng=rng, num_mines=mines_for_density(rows * cols, density))
+
+    def full(self):
+        return all(queue.full() for queue in self.queues)
+
+    def worker_queue(self, worker):
+        """Returns the queue the refill task of worker puts its boards into."""
+        return self.queues[worker % len(self.queues)]
+
+    def next_queue(self):
+        """Returns the queue the next request takes from and moves the round-robin turn on."""
+        queue = self.queues[self.turn]
+        self.turn = (self.turn + 1) % len(self.queues)
+        return queue
+
+    def stats(self):
+        return {
+            "ready": sum(queue.qsize() for queue in self.queues),
+            "waiting": self.waiting,
+            "generated": self.generated,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+class BoardServer:
+    """asyncio line-protocol server handing out boards from per-key pools of ready boards.
+    Each pool is topped up by `workers` background tasks that generate boards in a thread pool.
+    Backpressure:
+    - Full pools pause their refill tasks.
+    - A request finding no board ready waits for the next one, unless max_waiting requests are
+      already waiting, in which case it is answered with a busy error.
+    - Responses await the socket drain, so slow readers do not buffer unbounded output.
+    Request latency (line read to response written) is kept for the last latency_window requests,
+    and stats() reports its p50 and p99. ordered=True makes a seeded server hand out the same
+    boards in the same order on every run (see BoardPool)."""
+
+    def __init__(self, pool_size=32, workers=1, max_waiting=64, max_pools=16, max_cells=1 << 20,
+                 latency_window=10000, executor=None, seed=None, ordered=False):
+        self.pool_size = pool_size
+        self.workers = workers
+        self.max_waiting = max_waiting
+        self.max_pools = max_pools
+        self.max_cells = max_cells
+        self.latencies = deque(maxlen=latency_window)
+        self.executor = executor or ThreadPoolExecutor(max_workers=max(1, workers * max_pools))
+        self.seed = seed
+        self.ordered = ordered
+        self.pools = {}
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        self.server = None
+
+    def pool(self, key):
+        """Returns the pool for key, starting it (and its refill tasks) on first use."""
+        pool = self.pools.get(key)
+        if pool is not None:
+            return pool
+        if len(self.pools) >= self.max_pools:
+            raise ValueError(f"at most {self.max_pools} board configurations can be served")
+        if key[0] * key[1] > self.max_cells:
+            raise ValueError(f"boards are limited to {self.max_cells} cells")
+        seed = None if self.seed is None else f"{self.seed}/{key}"
+        pool = self.pools[key] = BoardPool(key, self.pool_size, seed, self.workers, self.ordered)
+        pool.tasks = [asyncio.create_task(self._refill(pool, worker)) for worker in range(self.workers)]
+        return pool
+
+    async def _refill(self, pool, worker):
+        loop = asyncio.get_running_loop()
+        rng, queue = pool.rngs[worker], pool.worker_queue(worker)
+        while True:
+            board = await loop.run_in_executor(self.executor, pool.generate, rng)
+            await queue.put(board)
+            pool.generated += 1
+            if pool.full():
+                pool.filled.set()
+
+    async def prefill(self, key):
+        """Starts the pool for key and waits until it is full."""
+        pool = self.pool(key)
+        while not pool.full():
+            pool.filled.clear()
+            await pool.filled.wait()
+
+    async def get_board(self, key):
+        """Takes a ready board for key, waiting for the next one if none is ready.
+        With ordered=True it takes from the next worker's share and waits if that share is empty."""
+        pool = self.pool(key)
+        queue = pool.next_queue()
+        if not queue.empty():
+            pool.hits += 1
+            return queue.get_nowait()
+        if pool.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise ServerBusy(f"{pool.waiting} requests are already waiting for {key}")
+        pool.misses += 1
+        pool.waiting += 1
+        try:
+            return await queue.get()
+        finally:
+            pool.waiting -= 1
+
+    async def respond(self, line):
+        fields = line.split()
+        if fields == ["STATS"]:
+            return (json.dumps(self.stats()) + "\n").encode()
+        if len(fields) != 4 or fields[0] != "GET":
+            raise ValueError("expected GET ROWSxCOLS DENSITY NEIGHBOURHOOD or STATS")
+        return encode_board(await self.get_board(parse_key(*fields[1:])))
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                start = time.perf_counter()
+                self.requests += 1
+                try:
+                    response = await self.respond(line.decode())
+                except (ValueError, ServerBusy) as error:
+                    self.errors += 1
+                    response = (json.dumps({"error": str(error)}) + "\n").encode()
+                writer.write(response)
+                await writer.drain()
+                self.latencies.append(time.perf_counter() - start)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Starts listening and returns the (host, port) actually bound; port 0 picks a free port."""
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        for pool in self.pools.values():
+            for task in pool.tasks:
+                task.cancel()
+            await asyncio.gather(*pool.tasks, return_exceptions=True)
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "p50_ms": None if not latencies else percentile(latencies, 0.50) * 1e3,
+            "p99_ms": None if not latencies else percentile(latencies, 0.99) * 1e3,
+            "pools": {"{}x{}/{}/{}".format(*key): pool.stats() for key, pool in self.pools.items()},
+        }
+
+async def fetch_board(host, port, size, density, neighbourhood=8):
+    """Opens a connection, requests one board and returns its list-of-lists grid."""
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    try:
+        writer.write(f"GET {size} {density} {neighbourhood}\n".encode())
+        await writer.drain()
+        record = json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    if "error" in record:
+        raise ValueError(record["error"])
+    return [list(row) for row in record["grid"]]
+
+async def serve(host="127.0.0.1", port=8765, prefill=(), **options):
+    """Runs a BoardServer until cancelled, warming the pools of the prefill keys first."""
+    server = BoardServer(**options)
+    for key in prefill:
+        await server.prefill(key)
+    bound = await server.start(host, port)
+    print(f"Serving boards on {bound[0]}:{bound[1]}", flush=True)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
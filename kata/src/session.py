@@ -0,0 +1,123 @@
+from src.board import MINE, SYMBOLS
+from src.neighbours import neighbour_indices
+from src.reveal import RevealEngine
+
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+HIDDEN = "#"
+FLAG = "F"
+
+class GameSession:
+    """Game state around a finished grid from minesweeper_with_adjacent_mines.
+    Supports reveal, flag, chord and undo. Every move only touches the cells it changes: the
+    revealed/flagged masks and the remaining-safe-cell counter are updated incrementally, and each
+    move returns the flat [start, stop) spans it changed so callers can re-render just those."""
+    __slots__ = ("engine", "rows", "cols", "seen", "flags", "safe_remaining", "flag_count", "status", "history")
+
+    def __init__(self, grid):
+        self.engine = RevealEngine(grid)
+        self.rows, self.cols = self.engine.rows, self.engine.cols
+        # seen is non-zero for revealed or flagged cells; flags marks the flagged ones.
+        self.seen = bytearray(self.rows * self.cols)
+        self.flags = bytearray(self.rows * self.cols)
+        self.safe_remaining = self.rows * self.cols - self.engine.cells.count(MINE)
+        self.flag_count = 0
+        self.status = PLAYING
+        self.history = []
+
+    def _index(self, i, j):
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"({i}, {j}) is outside the {self.rows}x{self.cols} board")
+        return i * self.cols + j
+
+    def is_revealed(self, i, j):
+        index = self._index(i, j)
+        return bool(self.seen[index]) and not self.flags[index]
+
+    def is_flagged(self, i, j):
+        return bool(self.flags[self._index(i, j)])
+
+    def cell(self, i, j):
+        """Returns what the player sees at (i, j): HIDDEN, FLAG or the grid symbol."""
+        index = self._index(i, j)
+        if self.flags[index]:
+            return FLAG
+        if not self.seen[index]:
+            return HIDDEN
+        return SYMBOLS[self.engine.cells[index]]
+
+    def _reveal(self, index, changes):
+        """Reveals one cell (cascading over empty regions) and appends the revealed spans to changes.
+        Flagged cells are marked in seen, so a cascade leaves them flagged and out of the spans."""
+        cells = self.engine.cells
+        for start, stop in self.engine.reveal_spans(*divmod(index, self.cols), self.seen):
+            changes.append((start, stop))
+            if cells[start] == MINE:
+                self.status = LOST
+            else:
+                self.safe_remaining -= stop - start
+        if self.status == PLAYING and self.safe_remaining == 0:
+            self.status = WON
+
+    def _record(self, kind, changes, status, safe_remaining):
+        self.history.append((kind, changes, status, safe_remaining))
+        return changes
+
+    def reveal(self, i, j):
+        """Reveals (i, j); hidden, unflagged cells only. Returns the changed spans."""
+        index = self._index(i, j)
+        if self.status != PLAYING or self.seen[index]:
+            return []
+        status, safe_remaining = self.status, self.safe_remaining
+        changes = []
+        self._reveal(index, changes)
+        return self._record("reveal", changes, status, safe_remaining)
+
+    def flag(self, i, j):
+        """Toggles a flag on a hidden cell. Returns the changed spans."""
+        index = self._index(i, j)
+        if self.status != PLAYING or (self.seen[index] and not self.flags[index]):
+            return []
+        self._toggle_flag(index)
+        return self._record("flag", [(index, index + 1)], self.status, self.safe_remaining)
+
+    def _toggle_flag(self, index):
+        self.flags[index] ^= 1
+        self.seen[index] ^= 1
+        self.flag_count += 1 if self.flags[index] else -1
+
+    def chord(self, i, j):
+        """On a revealed number whose flagged neighbours match it, reveals all its other hidden neighbours."""
+        index = self._index(i, j)
+        count = self.engine.cells[index]
+        if self.status != PLAYING or not self.seen[index] or self.flags[index] or count in (0, MINE):
+            return []
+        neighbours = neighbour_indices(index, self.rows, self.cols)
+        if sum(self.flags[neighbour] for neighbour in neighbours) != count:
+            return []
+        status, safe_remaining = self.status, self.safe_remaining
+        changes = []
+        for neighbour in neighbours:
+            if not self.seen[neighbour] and self.status != WON:
+                self._reveal(neighbour, changes)
+        if not changes:
+            return changes
+        return self._record("chord", changes, status, safe_remaining)
+
+    def undo(self):
+        """Reverts the last move and returns the spans it had changed (empty if there is nothing to undo)."""
+        if not self.history:
+            return []
+        kind, changes, self.status, self.safe_remaining = self.history.pop()
+        if kind == "flag":
+            self._toggle_flag(changes[0][0])
+        else:
+            for start, stop in changes:
+                self.seen[start:stop] = bytes(stop - start)
+        return changes
+
+    def render(self):
+        """Renders the player's view of the whole board, one string per row."""
+        return [" ".join(self.cell(i, j) for j in range(self.cols)) for i in range(self.rows)]
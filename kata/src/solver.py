@@ -0,0 +1,164 @@
+import time
+from collections import deque, namedtuple
+
+from src.board import EMPTY, MINE, Board
+from src.neighbours import neighbour_indices
+
+UNKNOWN = 0
+SAFE = 1
+FLAGGED = 2
+
+SolveResult = namedtuple("SolveResult", ["solved", "steps", "seconds", "revealed", "mines_found"])
+
+class Solver:
+    """Deduces a board without guessing, starting from one revealed cell.
+    Works on grids from minesweeper_with_numbers (neighbourhood=4) and minesweeper_with_adjacent_mines
+    (neighbourhood=8). Each revealed number is a constraint over its unknown neighbours. A frontier
+    index maps every unknown cell to the constraints that contain it, so when a cell becomes known
+    only those constraints go back on the worklist and are re-checked with the trivial and subset rules."""
+
+    def __init__(self, grid, neighbourhood=8):
+        if neighbourhood not in (4, 8):
+            raise ValueError(f"neighbourhood must be 4 or 8, got {neighbourhood}")
+        board = grid if isinstance(grid, Board) else Board.from_lists(grid)
+        self.rows, self.cols = board.rows, board.cols
+        self.cells = bytes(board.cells)
+        self.include_diagonals = neighbourhood == 8
+        self.total_mines = self.cells.count(MINE)
+        self.state = bytearray(len(self.cells))
+        self.unknown_count = len(self.cells)
+        self.revealed = 0
+        self.mines_found = 0
+        self.steps = 0
+        # constraint cell -> [unknown neighbour set, mines still to place among them]
+        self.constraints = {}
+        # unknown cell -> set of constraint cells that include it
+        self.frontier = {}
+        self.worklist = deque()
+        self.queued = set()
+
+    def neighbours(self, index):
+        return neighbour_indices(index, self.rows, self.cols, self.include_diagonals)
+
+    def _push(self, constraint):
+        if constraint not in self.queued:
+            self.queued.add(constraint)
+            self.worklist.append(constraint)
+
+    def reveal(self, index):
+        """Marks a cell as safe, turns its number into a constraint and re-queues the constraints it was part of."""
+        if self.state[index] != UNKNOWN:
+            return
+        if self.cells[index] == MINE:
+            raise ValueError(f"Cell {divmod(index, self.cols)} was deduced safe but holds a mine")
+        self.state[index] = SAFE
+        self.unknown_count -= 1
+        self.revealed += 1
+        for constraint in self.frontier.pop(index, ()):
+            self.constraints[constraint][0].discard(index)
+            self._push(constraint)
+
+        unknown, flagged = set(), 0
+        for neighbour in self.neighbours(index):
+            if self.state[neighbour] == UNKNOWN:
+                unknown.add(neighbour)
+            elif self.state[neighbour] == FLAGGED:
+                flagged += 1
+        self.constraints[index] = [unknown, self.cells[index] - flagged]
+        for neighbour in unknown:
+            self.frontier.setdefault(neighbour, set()).add(index)
+        self._push(index)
+
+    def flag(self, index):
+        """Marks a cell as a mine and re-queues the constraints it was part of."""
+        if self.state[index] != UNKNOWN:
+            return
+        self.state[index] = FLAGGED
+        self.unknown_count -= 1
+        self.mines_found += 1
+        for constraint in self.frontier.pop(index, ()):
+            entry = self.constraints[constraint]
+            entry[0].discard(index)
+            entry[1] -= 1
+            self._push(constraint)
+
+    def _settle(self, cells, mines):
+        self.steps += 1
+        for cell in list(cells):
+            if mines:
+                self.flag(cell)
+            else:
+                self.reveal(cell)
+
+    def _check(self, constraint):
+        """Applies the trivial rules, then the subset rule against constraints sharing a cell.
+        Returns True when something was deduced."""
+        unknown, remaining = self.constraints[constraint]
+        if not unknown:
+            del self.constraints[constraint]
+            return False
+        if remaining == 0:
+            self._settle(unknown, mines=False)
+            return True
+        if remaining == len(unknown):
+            self._settle(unknown, mines=True)
+            return True
+
+        others = set()
+        for cell in unknown:
+            others.update(self.frontier.get(cell, ()))
+        others.discard(constraint)
+        for other in others:
+            other_unknown, other_remaining = self.constraints[other]
+            if unknown < other_unknown:
+                small, small_remaining, large, large_remaining = unknown, remaining, other_unknown, other_remaining
+            elif other_unknown < unknown:
+                small, small_remaining, large, large_remaining = other_unknown, other_remaining, unknown, remaining
+            else:
+                continue
+            difference = large - small
+            mines = large_remaining - small_remaining
+            if mines == 0 or mines == len(difference):
+                self._settle(difference, mines=mines > 0)
+                return True
+        return False
+
+    def _check_mine_count(self):
+        """Uses the total mine count once local rules are stuck."""
+        unknown = [index for index, state in enumerate(self.state) if state == UNKNOWN]
+        left = self.total_mines - self.mines_found
+        if left == 0 or left == len(unknown):
+            self._settle(unknown, mines=left > 0)
+            return True
+        return False
+
+    def run(self):
+        """Processes the worklist until no rule applies. Returns True when every cell is known."""
+        while True:
+            while self.worklist:
+                constraint = self.worklist.popleft()
+                self.queued.discard(constraint)
+                if constraint in self.constraints and self._check(constraint):
+                    self._push(constraint)
+            if self.unknown_count == 0 or not self._check_mine_count():
+                return self.unknown_count == 0
+
+    def start_cell(self):
+        """Picks the first click: the first empty cell, else the first cell without a mine."""
+        index = self.cells.find(EMPTY)
+        if index == -1:
+            index = next((index for index, code in enumerate(self.cells) if code != MINE), -1)
+        return index
+
+    def solve(self, start=None):
+        """Reveals start (a (row, col) position, or start_cell()) and deduces as far as possible."""
+        began = time.perf_counter()
+        index = self.start_cell() if start is None else start[0] * self.cols + start[1]
+        if index != -1:
+            self.reveal(index)
+        solved = self.run()
+        return SolveResult(solved, self.steps, time.perf_counter() - began, self.revealed, self.mines_found)
+
+def solve(grid, neighbourhood=8, start=None):
+    """Convenience wrapper returning the SolveResult of solving grid from start."""
+    return Solver(grid, neighbourhood).solve(start)
@@ -0,0 +1,125 @@
+class SparseRowView:
+    """View of one sparse board row; missing cells read as '.'."""
+    __slots__ = ("board", "i")
+
+    def __init__(self, board, i):
+        self.board = board
+        self.i = i
+
+    def __len__(self):
+        return self.board.cols
+
+    def _position(self, j):
+        if j < 0:
+            j += self.board.cols
+        if not 0 <= j < self.board.cols:
+            raise IndexError("board column index out of range")
+        return (self.i, j)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self[k] for k in range(*j.indices(self.board.cols))]
+        return self.board.cell(self._position(j))
+
+    def __setitem__(self, j, symbol):
+        self.board.set_cell(self._position(j), symbol)
+
+    def __iter__(self):
+        return iter(self.board.row(self.i))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, symbol):
+        return self.board.row(self.i).count(symbol)
+
+class SparseBoard:
+    """Minesweeper grid that only stores the mine set and the non-zero number cells.
+    Memory grows with the number of mines rather than rows * cols; every other cell reads as '.'."""
+    __slots__ = ("rows", "cols", "mines", "numbers")
+
+    def __init__(self, rows, cols, mines=(), numbers=None):
+        self.rows = rows
+        self.cols = cols
+        self.mines = set(mines)
+        self.numbers = dict(numbers or {})
+
+    def cell(self, position):
+        """Returns the symbol at (row, col)."""
+        if position in self.mines:
+            return "*"
+        count = self.numbers.get(position)
+        return str(count) if count else "."
+
+    def set_cell(self, position, symbol):
+        self.mines.discard(position)
+        self.numbers.pop(position, None)
+        if symbol == "*":
+            self.mines.add(position)
+        elif symbol != ".":
+            self.numbers[position] = int(symbol)
+
+    def row(self, i):
+        """Materializes row i as a list of symbols."""
+        row = ["."] * self.cols
+        for (mi, mj) in self.mines:
+            if mi == i:
+                row[mj] = "*"
+        for (ni, nj), count in self.numbers.items():
+            if ni == i:
+                row[nj] = str(count)
+        return row
+
+    def iter_rows(self):
+        """Yields every row as a list of symbols, bucketing the stored cells by row once."""
+        by_row = {}
+        for (i, j) in self.mines:
+            by_row.setdefault(i, []).append((j, "*"))
+        for (i, j), count in self.numbers.items():
+            by_row.setdefault(i, []).append((j, str(count)))
+        for i in range(self.rows):
+            row = ["."] * self.cols
+            for j, symbol in by_row.get(i, ()):
+                row[j] = symbol
+            yield row
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, i):
+        if isinstance(i, tuple):
+            return self.cell(i)
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("board row index out of range")
+        return SparseRowView(self, i)
+
+    def __setitem__(self, position, symbol):
+        self.set_cell(tuple(position), symbol)
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def __eq__(self, other):
+        if isinstance(other, SparseBoard):
+            return (self.rows, self.cols, self.mines, self.numbers) == (other.rows, other.cols, other.mines, other.numbers)
+        return self.to_lists() == other
+
+    def __repr__(self):
+        return f"SparseBoard({self.rows}, {self.cols}, {len(self.mines)} mines)"
+
+    def count(self, symbol):
+        """Counts the cells holding the given symbol."""
+        if symbol == "*":
+            return len(self.mines)
+        if symbol == ".":
+            return self.rows * self.cols - len(self.mines) - len(self.numbers)
+        return sum(1 for count in self.numbers.values() if str(count) == symbol)
+
+    def to_lists(self):
+        """Converts the board to the list-of-lists of strings returned by main_v2 (dense, so small boards only)."""
+        return list(self.iter_rows())
@@ -0,0 +1,118 @@
+import itertools
+import json
+import struct
+
+from src.board import Board
+
+BINARY_MAGIC = b"MSWB"
+BINARY_VERSION = 1
+# Per-board record header: rows, cols as little-endian uint32, followed by rows * cols cell codes.
+RECORD_HEADER = struct.Struct("<II")
+
+def stream_boards(generator, gridSize, count=None, **kwargs):
+    """Lazily yields count boards (forever if count is None) from any minesweeper_* function.
+    Extra keyword arguments such as mines, as_board or rng are passed on to the generator."""
+    indices = itertools.count() if count is None else range(count)
+    for _ in indices:
+        yield generator(gridSize, **kwargs)
+
+def to_board(grid):
+    """Returns grid as a Board, converting list-of-lists grids."""
+    return grid if isinstance(grid, Board) else Board.from_lists(grid)
+
+class BoardWriter:
+    """Base class for writer stages: boards are encoded into an in-memory buffer that is written
+    to the file in one bulk write whenever it grows past buffer_size bytes."""
+
+    mode = "wb"
+
+    def __init__(self, path, buffer_size=1 << 20):
+        self.file = open(path, self.mode)
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.count = 0
+        self.write_header()
+
+    def write_header(self):
+        pass
+
+    def encode(self, grid):
+        raise NotImplementedError
+
+    def write(self, grid):
+        self.buffer += self.encode(grid)
+        self.count += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, boards):
+        """Consumes an iterable of boards, e.g. from stream_boards, and returns how many were written."""
+        for grid in boards:
+            self.write(grid)
+        return self.count
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class JsonlWriter(BoardWriter):
+    """Writes one JSON object per line: {"rows": ..., "cols": ..., "grid": ["*1.", ...]}.
+    A board with counts of 10 or more (kernels with more than 9 offsets) keeps each row as a list of
+    cells instead, ["*", "12", ...], since a joined row could not be split back into cells."""
+
+    def encode(self, grid):
+        rows = ["".join(row) for row in grid]
+        cols = len(grid[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            rows = [list(row) for row in grid]
+        record = {"rows": len(rows), "cols": cols, "grid": rows}
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+class BinaryWriter(BoardWriter):
+    """Writes a BINARY_MAGIC file header, then one record per board: RECORD_HEADER plus one byte per cell."""
+
+    def write_header(self):
+        self.buffer += BINARY_MAGIC + bytes([BINARY_VERSION])
+
+    def encode(self, grid):
+        board = to_board(grid)
+        return RECORD_HEADER.pack(board.rows, board.cols) + board.cells
+
+def read_jsonl(path):
+    """Lazily yields the list-of-lists grids stored in a JSONL file."""
+    with open(path) as file:
+        for line in file:
+            # list() splits a joined row into cells and copies a row stored as a list.
+            yield [list(row) for row in json.loads(line)["grid"]]
+
+def read_binary(path):
+    """Lazily yields the Boards stored in a binary file written by BinaryWriter."""
+    with open(path, "rb") as file:
+        header = file.read(len(BINARY_MAGIC) + 1)
+        if header[:len(BINARY_MAGIC)] != BINARY_MAGIC or header[-1] != BINARY_VERSION:
+            raise ValueError(f"{path} is not a version {BINARY_VERSION} board file")
+        while True:
+            record_header = file.read(RECORD_HEADER.size)
+            if not record_header:
+                return
+            rows, cols = RECORD_HEADER.unpack(record_header)
+            yield Board(rows, cols, bytearray(file.read(rows * cols)))
+
+def writer_for(path, buffer_size=1 << 20):
+    """Picks the writer from the file extension: .jsonl for JSON lines, anything else for binary."""
+    if str(path).endswith(".jsonl"):
+        return JsonlWriter(path, buffer_size)
+    return BinaryWriter(path, buffer_size)
@@ -0,0 +1,106 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, main_v2 keeps working without it
+    np = None
+
+from src.board import MINE, SYMBOLS, Board
+from src.kernels import MOORE, ORTHOGONAL, get_kernel
+from src.main_v2 import sample_indices
+
+def require_numpy():
+    """Raises a helpful error when the numpy backend is used without numpy installed."""
+    if np is None:
+        raise ImportError("The numpy backend needs numpy: python -m pip install numpy")
+
+def mines_to_array(rows, cols, mines):
+    """Builds a boolean (rows, cols) array that is True at every mine position."""
+    require_numpy()
+    mine_array = np.zeros((rows, cols), dtype=bool)
+    if len(mines):
+        mine_rows, mine_cols = zip(*mines)
+        mine_array[list(mine_rows), list(mine_cols)] = True
+    return mine_array
+
+def random_mine_array(rows, cols, num_mines, rng=random):
+    """Builds a (rows, cols) mine mask from num_mines sampled flat indices, without decoding positions."""
+    require_numpy()
+    mine_array = np.zeros(rows * cols, dtype=bool)
+    mine_array[sample_indices(rows * cols, num_mines, rng)] = True
+    return mine_array.reshape(rows, cols)
+
+def count_kernel(mine_array, kernel=8):
+    """Counts the mines each cell's kernel sees at once by summing shifted slices of a padded array.
+    The padding is zeros, or the opposite edges for a wrapping kernel.
+    Works on a single (rows, cols) mask or a stack of them, e.g. (n, rows, cols)."""
+    require_numpy()
+    kernel = get_kernel(kernel)
+    rows, cols = mine_array.shape[-2:]
+    reach_i, reach_j = kernel.reach
+    padding = [(0, 0)] * (mine_array.ndim - 2) + [(reach_i, reach_i), (reach_j, reach_j)]
+    padded = np.pad(mine_array.astype(np.uint8), padding, mode="wrap" if kernel.wrap else "constant")
+    counts = np.zeros(mine_array.shape, dtype=np.uint8)
+    for di, dj in kernel.offsets:
+        counts += padded[..., reach_i + di:reach_i + di + rows, reach_j + dj:reach_j + dj + cols]
+    return counts
+
+def count_adjacent(mine_array, include_diagonals=True):
+    """Counts the mines next to every cell: count_kernel with the Moore or orthogonal kernel."""
+    return count_kernel(mine_array, MOORE if include_diagonals else ORTHOGONAL)
+
+def encode_cells(mine_array, counts):
+    """Combines a mine mask and neighbour counts into one uint8 array with MINE at mine cells."""
+    cells = counts.copy()
+    cells[mine_array] = MINE
+    return cells
+
+def array_to_grid(cells):
+    """Converts a uint8 cell array into the list-of-lists of strings that main_v2 returns."""
+    require_numpy()
+    return np.array(SYMBOLS)[cells].tolist()
+
+def array_to_board(cells):
+    """Copies a 2D uint8 cell array into a compact Board, which uses the same cell codes."""
+    rows, cols = cells.shape
+    return Board(rows, cols, bytearray(cells.tobytes()))
+
+def board_to_array(board):
+    """Returns a zero-copy (rows, cols) uint8 array view of a Board's cells."""
+    require_numpy()
+    return np.frombuffer(board.cells, dtype=np.uint8).reshape(board.rows, board.cols)
+
+def _finish(cells, as_array, as_board):
+    if as_array:
+        return cells
+    if as_board:
+        return array_to_board(cells)
+    return array_to_grid(cells)
+
+def minesweeper_with_numbers(gridSize=[], mines=[], as_array=False, as_board=False, rng=random):
+    """NumPy version of main_v2.minesweeper_with_numbers, counting mines in the 4 orthogonal directions."""
+    if not gridSize:
+        return Board(0, 0) if as_board else []
+
+    rows, cols = gridSize
+    if len(mines):
+        mine_array = mines_to_array(rows, cols, mines)
+    else:
+        total_squares = rows * cols
+        num_mines = rng.randint(1, total_squares // 4)
+        mine_array = random_mine_array(rows, cols, num_mines, rng)
+
+    cells = encode_cells(mine_array, count_adjacent(mine_array, include_diagonals=False))
+    return _finish(cells, as_array, as_board)
+
+def minesweeper_with_adjacent_mines(gridSize=[], as_array=False, as_board=False, rng=random):
+    """NumPy version of main_v2.minesweeper_with_adjacent_mines, counting mines in all 8 directions."""
+    if not gridSize:
+        return Board(0, 0) if as_board else []
+
+    rows, cols = gridSize
+    total_squares = rows * cols
+    num_mines = rng.randint(1, total_squares // 4)
+    mine_array = random_mine_array(rows, cols, num_mines, rng)
+    cells = encode_cells(mine_array, count_adjacent(mine_array, include_diagonals=True))
+    return _finish(cells, as_array, as_board)
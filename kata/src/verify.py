@@ -0,0 +1,176 @@
+import json
+from collections import Counter
+from itertools import islice
+
+from src.board import CODES, MINE, Board
+from src.boardfile import PACKED_MAGIC, BoardFile, pack_mines
+from src.kernels import Kernel, get_kernel, kernel_counts_nd
+from src.streaming import read_binary
+
+# Maps board symbols to cell codes; VALID_SYMBOLS lists the symbols a single-character cell can hold.
+VALID_SYMBOLS = b".*123456789"
+SYMBOL_CODES = bytes.maketrans(VALID_SYMBOLS, bytes([0, MINE, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+
+class VerifyReport:
+    """Outcome of verifying a sequence of boards: how many were checked, and for every offending
+    board its index in the sequence and the checks it failed:
+    - "shape": empty board or rows of different lengths
+    - "symbols": a cell that is not '.', '*' or a single digit
+    - "mines": mine count differs from num_mines
+    - "density": mine density outside [min_density, max_density]
+    - "counts": a number cell does not match its neighbour count (or an empty cell has neighbours)
+    - "bitmap": a packed record whose mine bitmap disagrees with its counts plane"""
+    __slots__ = ("checked", "failures")
+
+    def __init__(self):
+        self.checked = 0
+        self.failures = {}
+
+    @property
+    def ok(self):
+        return not self.failures
+
+    @property
+    def indices(self):
+        """Returns the indices of the offending boards in ascending order."""
+        return sorted(self.failures)
+
+    def fail(self, index, reason):
+        self.failures.setdefault(index, []).append(reason)
+
+    def reasons(self):
+        """Returns how many boards failed each check."""
+        return Counter(reason for reasons in self.failures.values() for reason in reasons)
+
+    def __repr__(self):
+        return f"VerifyReport(checked={self.checked}, failed={len(self.failures)})"
+
+def grid_cells(grid):
+    """Returns (rows, cols, cell codes) of a Board, a BoardView, a 2D array or a list of rows
+    (lists of symbols or strings). Raises ValueError("shape") for empty or ragged boards and
+    ValueError("symbols") for cells that are not '.', '*' or a count. Boards whose cells are all
+    single characters are translated in one pass; counts of 10 or more (kernels with more than 9
+    offsets) take the per-cell CODES lookup."""
+    if isinstance(grid, Board):
+        rows, cols, cells = grid.rows, grid.cols, grid.cells
+    elif hasattr(grid, "mine_bits"):
+        rows, cols, cells = grid.rows, grid.cols, grid.cells()
+    elif hasattr(grid, "tobytes"):
+        rows, cols = grid.shape
+        cells = grid.astype("uint8").tobytes()
+    else:
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        if any(len(row) != cols for row in grid):
+            raise ValueError("shape")
+        try:
+            text = "".join(row if isinstance(row, str) else "".join(row) for row in grid).encode("ascii", "replace")
+        except TypeError:
+            text = b""
+        if len(text) == rows * cols and not text.translate(None, VALID_SYMBOLS):
+            cells = text.translate(SYMBOL_CODES)
+        else:
+            try:
+                cells = bytes(CODES[symbol] for row in grid for symbol in row)
+            except (KeyError, TypeError):
+                raise ValueError("symbols")
+    if not rows or not cols:
+        raise ValueError("shape")
+    return rows, cols, cells
+
+def layered(kernel):
+    """Returns kernel with a leading zero axis, so a stack of boards is numbered in one pass without
+    any board seeing its neighbours in the stack."""
+    return Kernel([(0,) + offset for offset in kernel.offsets], kernel.wrap, kernel.name)
+
+def check_mines(report, index, mines, size, num_mines, min_density, max_density):
+    if num_mines is not None and mines != num_mines:
+        report.fail(index, "mines")
+    density = mines / size
+    if (min_density is not None and density < min_density) or (max_density is not None and density > max_density):
+        report.fail(index, "density")
+
+def verify_stack(report, indices, shape, cells, kernel, num_mines, min_density, max_density):
+    """Checks the boards of one (rows, cols) shape laid out back to back in cells, numbering all of
+    them with a single kernel_counts_nd pass; indices are their positions for the report."""
+    rows, cols = shape
+    size = rows * cols
+    expected = kernel_counts_nd(cells, (len(indices), rows, cols), layered(kernel))
+    for k, index in enumerate(indices):
+        board = cells[k * size:(k + 1) * size]
+        if expected[k * size:(k + 1) * size] != board:
+            report.fail(index, "counts")
+        check_mines(report, index, board.count(MINE), size, num_mines, min_density, max_density)
+
+def verify_array(report, start, array, kernel, num_mines, min_density, max_density):
+    """Checks an (n, rows, cols) uint8 array of cell codes, e.g. from generate_batch, with NumPy."""
+    from src.vectorized import count_kernel, encode_cells
+    mine_array = array == MINE
+    expected = encode_cells(mine_array, count_kernel(mine_array, kernel))
+    for k in (expected != array).reshape(len(array), -1).any(axis=1).nonzero()[0]:
+        report.fail(start + int(k), "counts")
+    size = array.shape[1] * array.shape[2]
+    for k, mines in enumerate(mine_array.reshape(len(array), -1).sum(axis=1).tolist()):
+        check_mines(report, start + k, mines, size, num_mines, min_density, max_density)
+
+def verify_batch(boards, neighbourhood=8, num_mines=None, min_density=None, max_density=None, start=0, report=None):
+    """Verifies a batch of boards at once and returns a VerifyReport; indices start at start.
+    boards may be a list of Boards, BoardViews, 2D arrays or list-of-lists grids, mixed shapes
+    allowed, or an (n, rows, cols) array of cell codes. neighbourhood is 4, 8 or anything
+    get_kernel accepts. Boards are grouped by shape and each group is numbered in one pass."""
+    kernel = get_kernel(neighbourhood)
+    report = report if report is not None else VerifyReport()
+    if getattr(boards, "ndim", None) == 3:
+        report.checked += len(boards)
+        if len(boards) and boards.shape[1] and boards.shape[2]:
+            verify_array(report, start, boards, kernel, num_mines, min_density, max_density)
+        else:
+            for k in range(len(boards)):
+                report.fail(start + k, "shape")
+        return report
+    groups = {}
+    for k, grid in enumerate(boards):
+        report.checked += 1
+        try:
+            rows, cols, cells = grid_cells(grid)
+        except ValueError as error:
+            report.fail(start + k, str(error))
+            continue
+        if hasattr(grid, "mine_bits") and pack_mines(bytes(cells)) != grid.mine_bits:
+            report.fail(start + k, "bitmap")
+        groups.setdefault((rows, cols), []).append((start + k, cells))
+    for shape, members in groups.items():
+        indices = [index for index, _ in members]
+        cells = b"".join(cells for _, cells in members)
+        verify_stack(report, indices, shape, cells, kernel, num_mines, min_density, max_density)
+    return report
+
+def verify_stream(boards, batch_size=4096, **checks):
+    """Verifies an iterable of boards batch_size at a time, so memory stays bounded however many
+    boards there are. Takes the checks of verify_batch and returns one VerifyReport."""
+    report = VerifyReport()
+    boards = iter(boards)
+    while True:
+        batch = list(islice(boards, batch_size))
+        if not batch:
+            return report
+        verify_batch(batch, start=report.checked, report=report, **checks)
+
+def read_grids(path):
+    """Lazily yields the boards of a .jsonl, binary or packed board file, in the cheapest form to
+    verify: JSONL rows stay strings, binary records are Boards, packed records are BoardViews."""
+    with open(path, "rb") as file:
+        magic = file.read(len(PACKED_MAGIC))
+    if magic == PACKED_MAGIC:
+        with BoardFile(path) as boards:
+            yield from boards
+    elif str(path).endswith(".jsonl"):
+        with open(path) as file:
+            for line in file:
+                yield json.loads(line)["grid"]
+    else:
+        yield from read_binary(path)
+
+def verify_file(path, batch_size=4096, **checks):
+    """Streams the boards of a file through verify_stream and returns the VerifyReport."""
+    return verify_stream(read_grids(path), batch_size, **checks)
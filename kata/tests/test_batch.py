@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.batch import generate_batch
+from src.board import MINE
+from src.vectorized import array_to_grid, count_adjacent
+
+# Test the batch has the requested shape and mine count on every board
+def test_batch_shape_and_mine_count():
+    boards = generate_batch((16, 30), 50, 0.2, seed=1)
+    assert boards.shape == (50, 16, 30) and boards.dtype == np.uint8
+    assert ((boards == MINE).sum(axis=(1, 2)) == round(0.2 * 16 * 30)).all()
+
+# Test the boards in a batch are not all the same
+def test_batch_boards_differ():
+    boards = generate_batch((9, 9), 10, 0.12, seed=2)
+    assert len({board.tobytes() for board in boards}) > 1
+
+# Test counts match the single-board counting for both neighbourhoods
+@pytest.mark.parametrize("neighbourhood", [4, 8])
+def test_batch_counts(neighbourhood):
+    boards = generate_batch((12, 6), 20, 0.25, neighbourhood=neighbourhood, seed=3)
+    for board in boards:
+        mine_array = board == MINE
+        expected = count_adjacent(mine_array, include_diagonals=neighbourhood == 8)
+        assert (board[~mine_array] == expected[~mine_array]).all()
+        assert len(array_to_grid(board)) == 12
+
+# Test the same seed gives the same batch
+def test_batch_seed():
+    assert (generate_batch((8, 8), 5, 0.15, seed=4) == generate_batch((8, 8), 5, 0.15, seed=4)).all()
+
+# Test empty and full densities
+def test_batch_density_limits():
+    assert (generate_batch((3, 3), 2, 0.0) == 0).all()
+    assert (generate_batch((3, 3), 2, 1.0) == MINE).all()
+
+# Test invalid arguments are rejected
+def test_batch_invalid_arguments():
+    with pytest.raises(ValueError):
+        generate_batch((3, 3), 2, 0.1, neighbourhood=6)
+    with pytest.raises(ValueError):
+        generate_batch((3, 3), 2, 1.5)
@@ -0,0 +1,29 @@
+from benchmarks.bench_suite import compare
+
+def case(function, min_s, size="100x100", density=0.2, reference_s=0.010):
+    return {"version": "v2", "function": function, "size": size, "density": density,
+            "median_s": 2 * min_s, "min_s": min_s, "reference_s": reference_s}
+
+BASELINE = {"results": [case("minesweeper_basic", 0.020), case("minesweeper_with_numbers", 0.050), case("new_grid", 0.002)]}
+
+# Test only cases past the threshold are reported, with their fastest times and ratio
+def test_compare_reports_regressions():
+    results = [case("minesweeper_basic", 0.030), case("minesweeper_with_numbers", 0.060)]
+    assert compare(results, BASELINE, 0.25) == [("v2.minesweeper_basic/100x100/0.2", 0.020, 0.030, 1.5)]
+    assert compare(results, BASELINE, 0.5) == []
+
+# Test a machine that is slower as a whole is not a regression, while a slower case still is
+def test_compare_normalises_to_the_reference():
+    results = [case("minesweeper_basic", 0.030, reference_s=0.015), case("minesweeper_with_numbers", 0.100, reference_s=0.015)]
+    assert [key for key, *_ in compare(results, BASELINE, 0.25)] == ["v2.minesweeper_with_numbers/100x100/0.2"]
+
+# Test fast baseline cases and cases missing from the baseline are not gated
+def test_compare_skips_fast_and_new_cases():
+    results = [case("new_grid", 0.010), case("minesweeper_basic", 0.100, size="12x6")]
+    assert compare(results, BASELINE, 0.25) == []
+    assert [key for key, *_ in compare(results, BASELINE, 0.25, min_seconds=0.001)] == ["v2.new_grid/100x100/0.2"]
+
+# Test the gate looks at minimums, so a noisy median alone is not a regression
+def test_compare_uses_minimums():
+    noisy = dict(case("minesweeper_basic", 0.021), median_s=1.0)
+    assert compare([noisy], BASELINE, 0.25) == []
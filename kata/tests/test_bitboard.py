@@ -0,0 +1,46 @@
+import random
+
+from src import main_v2
+from src.bitboard import (
+    MineBitmap,
+    count_at,
+    minesweeper_with_numbers,
+    minesweeper_with_adjacent_mines,
+    neighbour_planes,
+)
+
+# Test the bitmap stores one bit per cell
+def test_bitmap():
+    bitmap = MineBitmap.from_positions(3, 5, [(0, 0), (2, 4)])
+    assert bitmap.bits == [0b1, 0, 0b10000]
+    assert (2, 4) in bitmap and (1, 1) not in bitmap
+    assert bitmap.count() == 2
+    assert sorted(bitmap.positions()) == [(0, 0), (2, 4)]
+
+# Test counts around a mine surrounded by mines reach 8
+def test_neighbour_planes_full_count():
+    bitmap = MineBitmap.from_positions(3, 3, [(i, j) for i in range(3) for j in range(3)])
+    counters = neighbour_planes(bitmap, include_diagonals=True)
+    assert count_at(counters[1], 1) == 8
+    assert count_at(counters[0], 0) == 3
+    counters = neighbour_planes(bitmap, include_diagonals=False)
+    assert count_at(counters[1], 1) == 4 and count_at(counters[0], 0) == 2
+
+# Test fixed mines match main_v2
+def test_numbers_with_fixed_mines_matches_main_v2():
+    mine_positions = [(3, 2), (3, 3), (3, 4), (0, 0), (11, 5)]
+    assert minesweeper_with_numbers([12, 6], mine_positions) == main_v2.minesweeper_with_numbers([12, 6], mine_positions)
+
+# Test random boards match main_v2 for the same seed
+def test_random_boards_match_main_v2():
+    for grid_size in ([2, 2], [5, 3], [12, 6], [30, 70]):
+        for seed in range(5):
+            expected = main_v2.minesweeper_with_numbers(grid_size, rng=random.Random(seed))
+            assert minesweeper_with_numbers(grid_size, rng=random.Random(seed)) == expected
+            expected = main_v2.minesweeper_with_adjacent_mines(grid_size, rng=random.Random(seed))
+            assert minesweeper_with_adjacent_mines(grid_size, rng=random.Random(seed)) == expected
+
+# Test the Board output
+def test_as_board():
+    board = minesweeper_with_adjacent_mines([12, 6], as_board=True, rng=random.Random(4))
+    assert board.to_lists() == main_v2.minesweeper_with_adjacent_mines([12, 6], rng=random.Random(4))
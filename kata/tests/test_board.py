@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from src.board import MINE, Board, BoardND
+from src.main_v2 import (
+    minesweeper_basic,
+    minesweeper_random,
+    minesweeper_random_revised,
+    minesweeper_with_numbers,
+    minesweeper_with_adjacent_mines,
+)
+
+# Test an empty board uses one byte per cell
+def test_new_board():
+    board = Board(3, 4)
+    assert len(board.cells) == 12
+    assert board.to_lists() == [["."] * 4 for _ in range(3)]
+
+# Test reading and writing cells through row views
+def test_row_views():
+    board = Board(2, 3)
+    board[0][1] = "*"
+    board[1, 2] = "3"
+    assert board[0][1] == "*" and board[1, 2] == "3"
+    assert board[1][-1] == "3"
+    assert board.cells[1] == MINE and board.cells[5] == 3
+    assert list(board[1].codes()) == [0, 0, 3]
+    assert " ".join(board[0]) == ". * ."
+    assert board[0].count("*") == 1 and board.count(".") == 4
+    with pytest.raises(IndexError):
+        board[2]
+
+# Test converting to and from lists
+def test_round_trip():
+    grid = [["*", "1", "."], ["2", "*", "8"]]
+    board = Board.from_lists(grid)
+    assert board.to_lists() == grid
+    assert board == grid
+    assert board == Board.from_lists(grid)
+
+# Test the wrong number of cells is rejected
+def test_wrong_cell_count():
+    with pytest.raises(ValueError):
+        Board(2, 2, bytearray(3))
+
+# Test every generator can return a Board matching its list output
+def test_generators_as_board():
+    generators = [
+        lambda as_board: minesweeper_basic([4, 5], [(0, 0), (3, 4)], as_board=as_board),
+        lambda as_board: minesweeper_random([5, 3], ones=1, as_board=as_board),
+        lambda as_board: minesweeper_random([5, 3], multiple_mines=True, as_board=as_board),
+        lambda as_board: minesweeper_random_revised([12, 6], as_board=as_board),
+        lambda as_board: minesweeper_with_numbers([12, 6], as_board=as_board),
+        lambda as_board: minesweeper_with_adjacent_mines([12, 6], as_board=as_board),
+    ]
+    for generate in generators:
+        random.seed(3)
+        expected = generate(False)
+        random.seed(3)
+        board = generate(True)
+        assert isinstance(board, Board)
+        assert board.to_lists() == expected
+
+# Test the empty grid case
+def test_empty_board():
+    board = minesweeper_basic([], [], as_board=True)
+    assert isinstance(board, Board) and board == []
+
+# Test N-dimensional boards index row-major, slice into layers and nest as lists
+def test_board_nd():
+    board = BoardND((2, 3, 4))
+    board[1, 2, 3] = "*"
+    board[0, -1, 0] = "2"
+    assert board.cells[23] == MINE and board.index((0, 2, 0)) == 8
+    assert board[1, 2, 3] == "*" and board.count("*") == 1
+    assert board.layer(1) == Board(3, 4, board.cells[12:])
+    nested = board.to_lists()
+    assert len(nested) == 2 and nested[1][2] == [".", ".", ".", "*"] and nested[0][2][0] == "2"
+    with pytest.raises(IndexError):
+        board[2, 0, 0]
+    with pytest.raises(ValueError):
+        BoardND((2, 2), bytearray(3))
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src.board import Board
+from src.boardfile import BoardFile, PackedBoardWriter, pack_mines, unpack_mines
+from src.main_v2 import minesweeper_with_adjacent_mines, minesweeper_with_numbers
+from src.streaming import stream_boards
+
+# Test the mine bitmap round-trips and uses one bit per cell
+def test_pack_unpack_mines():
+    board = Board.from_lists(minesweeper_with_adjacent_mines([7, 9], rng=random.Random(2)))
+    bits = pack_mines(board.cells)
+    assert len(bits) == 8
+    mines = unpack_mines(bits, 63)
+    assert [code == 255 for code in mines] == [code == 255 for code in board.cells]
+
+# Test boards read back from the mapped file equal the generated grids, with and without counts
+@pytest.mark.parametrize("with_counts", [True, False])
+def test_round_trip(tmp_path, with_counts):
+    grids = list(stream_boards(minesweeper_with_adjacent_mines, [6, 11], 40, rng=random.Random(5)))
+    path = tmp_path / "boards.mswp"
+    with PackedBoardWriter(path, 6, 11, with_counts=with_counts) as writer:
+        assert writer.write_all(grids) == 40
+    with BoardFile(path) as boards:
+        assert len(boards) == 40 and boards.has_counts == with_counts
+        assert [view.to_lists() for view in boards] == grids
+        view = boards[-1]
+        assert view.mine_count() == sum(row.count("*") for row in grids[-1])
+        assert [[view.is_mine(i, j) for j in range(11)] for i in range(6)] == [[cell == "*" for cell in row] for row in grids[-1]]
+
+# Test counts are recomputed with the stored neighbourhood
+def test_orthogonal_counts_recomputed(tmp_path):
+    grids = list(stream_boards(minesweeper_with_numbers, [5, 5], 10, rng=random.Random(8)))
+    path = tmp_path / "boards.mswp"
+    with PackedBoardWriter(path, 5, 5, neighbourhood=4, with_counts=False) as writer:
+        writer.write_all(grids)
+    with BoardFile(path) as boards:
+        assert [view.to_lists() for view in boards] == grids
+
+# Test views with a counts plane share memory with the mapping
+def test_views_are_zero_copy(tmp_path):
+    path = tmp_path / "boards.mswp"
+    with PackedBoardWriter(path, 3, 3) as writer:
+        writer.write([["*", "1", "."], ["1", "1", "."], [".", ".", "."]])
+    with BoardFile(path) as boards:
+        cells = boards[0].cells()
+        assert isinstance(cells, memoryview) and cells.obj is boards.buffer.obj
+        assert bytes(cells) == bytes([255, 1, 0, 1, 1, 0, 0, 0, 0])
+        del cells
+
+# Test mismatched shapes and foreign files are rejected
+def test_errors(tmp_path):
+    path = tmp_path / "boards.mswp"
+    with PackedBoardWriter(path, 3, 3) as writer:
+        with pytest.raises(ValueError):
+            writer.write(minesweeper_with_numbers([4, 4]))
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"MSWB\x01" + bytes(40))
+    with pytest.raises(ValueError):
+        BoardFile(other)
+    with BoardFile(path) as boards:
+        assert len(boards) == 0
+        with pytest.raises(IndexError):
+            boards[0]
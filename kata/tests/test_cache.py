@@ -0,0 +1,86 @@
+import pytest
+
+from src.cache import BoardCache, board_nbytes
+from src.board import Board
+
+# Test misses generate inline and a key asked for twice is then refilled in the background
+def test_miss_then_hits():
+    with BoardCache(reservoir_size=4, seed=1) as cache:
+        grid = cache.get([16, 30], 99)
+        assert len(grid) == 16 and sum(row.count("*") for row in grid) == 99
+        assert cache.wait_idle(timeout=10)
+        assert cache.stats()["boards"] == 0
+        cache.get([16, 30], 99)
+        assert cache.wait_idle(timeout=10)
+        assert cache.stats()["boards"] == 4
+        boards = [cache.get([16, 30], 99) for _ in range(4)]
+        stats = cache.stats()
+    assert stats["misses"] == 2 and stats["hits"] == 4 and stats["refills"] >= 4
+    assert all(sum(row.count("*") for row in board) == 99 for board in boards)
+
+# Test boards are handed out once and taken boards leave the reservoir
+def test_boards_handed_out_once():
+    with BoardCache(reservoir_size=3, as_board=True, seed=2) as cache:
+        assert cache.warm([9, 9], 10, neighbourhood=4, timeout=10)
+        ready = list(cache.entries[(9, 9, 10, 4)].boards)
+        taken = [cache.get([9, 9], 10, neighbourhood=4) for _ in range(3)]
+        assert all(isinstance(board, Board) for board in taken)
+        assert [id(board) for board in taken] == [id(board) for board in ready]
+        assert len({id(board) for board in taken}) == 3
+
+# Test cold keys are evicted by LRU under the memory cap
+def test_lru_eviction_under_memory_cap():
+    board_size = board_nbytes(Board(20, 20))
+    with BoardCache(reservoir_size=4, memory_cap=6 * board_size, seed=3) as cache:
+        assert cache.warm([20, 20], 40, timeout=10)
+        assert cache.warm([20, 20], 80, timeout=10)
+        stats = cache.stats()
+        assert stats["bytes"] <= 6 * board_size
+        assert stats["evictions"] == 1 and stats["keys"] == 1
+        assert list(cache.entries) == [(20, 20, 80, 8)]
+        assert len(cache.entries[(20, 20, 80, 8)].boards) == 4
+
+# Test a key that fails to generate is dropped while a good key keeps refilling
+def test_refill_error_drops_key(monkeypatch):
+    generate = BoardCache._generate
+
+    def failing_generate(cache, key, rng):
+        if key == (9, 9, 20, 8):
+            raise RuntimeError("generator failed")
+        return generate(cache, key, rng)
+    monkeypatch.setattr(BoardCache, "_generate", failing_generate)
+    with BoardCache(reservoir_size=2, seed=4) as cache:
+        with pytest.raises(ValueError):
+            cache.get([9, 9], 82)
+        with pytest.raises(ValueError):
+            cache.get([0, 9])
+        cache.get([9, 9], 10)
+        assert cache.warm([9, 9], 20, timeout=10)
+        cache.get([9, 9], 10)
+        assert cache.wait_idle(timeout=10)
+        stats = cache.stats()
+        assert stats["errors"] == 1 and "(9, 9, 20, 8)" in stats["last_error"] and "generator failed" in stats["last_error"]
+        assert list(cache.entries) == [(9, 9, 10, 8)]
+        assert len(cache.entries[(9, 9, 10, 8)].boards) == 2
+        assert cache.thread.is_alive()
+
+# Test a key capped while it was the least recently used one refills once it is used again
+def test_capped_key_refills_when_used_again():
+    board_size = board_nbytes(Board(20, 20))
+    with BoardCache(reservoir_size=4, memory_cap=4 * board_size, min_requests=2, seed=5) as cache:
+        assert cache.warm([20, 20], 40, timeout=10)
+        # Holding the lock keeps the refill thread from running until the key for 80 mines is no
+        # longer the most recently used one, so its first refill is capped.
+        with cache.condition:
+            cache.get([20, 20], 80)
+            cache.get([20, 20], 80)
+            cache.get([20, 20], 40)
+        assert cache.wait_idle(timeout=10)
+        assert cache.entries[(20, 20, 80, 8)].capped and not cache.entries[(20, 20, 80, 8)].boards
+        cache.get([20, 20], 80)
+        assert cache.wait_idle(timeout=10)
+        misses = cache.stats()["misses"]
+        for _ in range(4):
+            cache.get([20, 20], 80)
+        stats = cache.stats()
+    assert stats["misses"] == misses and stats["evictions"] == 1
@@ -0,0 +1,85 @@
+import io
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.cli import main, parse_job
+from src.streaming import read_jsonl
+
+def run(argv):
+    out = io.StringIO()
+    assert main(argv, out) == 0
+    return out.getvalue()
+
+# Test the grid subcommands print like run.sh
+def test_grid_commands():
+    assert run(["basic_grid", "2x3", "[[0,1]]"]) == "Grid:\n. * .\n. . .\n"
+    text = run(["numbers_grid", "4x5"])
+    assert text.startswith("Grid:\n") and len(text.splitlines()) == 5
+
+# Test batch jobs in both formats, with a seed making the output reproducible
+def test_batch(monkeypatch, tmp_path):
+    jobs = tmp_path / "jobs.txt"
+    jobs.write_text(
+        "# comment\n"
+        "numbers_grid 3x3 [[0,0]]\n"
+        "minesweeper_with_adjacent_mines 4x4 3\n"
+        '{"function": "random_grid_revised", "size": "3x3"}\n'
+    )
+    first = run(["batch", str(jobs), "--seed", "3"])
+    assert first.count("Grid:") == 3
+    assert first.startswith("Grid:\n* 1 .\n1 . .\n. . .\n")
+    assert run(["batch", str(jobs), "--seed", "3"]) == first
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("adjacent_grid 5x5\n" * 4))
+    output = tmp_path / "boards.jsonl"
+    assert run(["batch", "--output", str(output)]) == f"Wrote 4 boards to {output}\n"
+    assert len(list(read_jsonl(output))) == 4
+
+# Test the batch example from the readme runs as written
+def test_readme_batch_example(monkeypatch):
+    readme = (Path(__file__).parent.parent / "readme.md").read_text()
+    jobs = re.search(r"printf '(.*)' \| make batch", readme).group(1).replace("\\n", "\n")
+    monkeypatch.setattr(sys, "stdin", io.StringIO(jobs))
+    text = run(["batch", "--seed", "1"])
+    assert text.count("Grid:") == jobs.count("\n")
+    assert text.startswith("Grid:\n* 1 .")
+
+# Test verify reports clean files and exits with 1 listing the offending boards
+def test_verify(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("numbers_grid 5x5\n" * 3))
+    output = tmp_path / "boards.jsonl"
+    run(["batch", "--output", str(output), "--seed", "1"])
+    assert run(["verify", str(output), "--neighbourhood", "4"]) == "Checked 3 boards, 0 failed\n"
+    output.write_text(output.read_text().replace("1", "3", 1))
+    out = io.StringIO()
+    assert main(["verify", str(output), "--neighbourhood", "4"], out) == 1
+    assert out.getvalue() == "Checked 3 boards, 1 failed\n  counts: 1\n  board 0: counts\n"
+
+# Test job parsing and bad jobs
+def test_parse_job_errors(tmp_path):
+    assert parse_job("numbers_grid 2x2 [[1,1]]") == ("numbers_grid", [2, 2], {"mines": [[1, 1]]})
+    assert parse_job('{"function": "adjacent_grid", "size": [3, 4], "mines": 2}') == ("adjacent_grid", [3, 4], {"num_mines": 2})
+    jobs = tmp_path / "jobs.txt"
+    jobs.write_text("adjacent_grid 3x3\nnot_a_generator 3x3\n")
+    with pytest.raises(SystemExit, match=":2: Unknown generator"):
+        run(["batch", str(jobs)])
+    jobs.write_text("adjacent_grid 3x3 2\nadjacent_grid 9x9 [[0,0]]\n")
+    with pytest.raises(SystemExit, match=":2: adjacent_grid does not take a mine list; usage: adjacent_grid ROWSxCOLS \\[MINES\\] with MINES a mine count"):
+        run(["batch", str(jobs)])
+    jobs.write_text("random_grid_revised 3x3 2\n")
+    with pytest.raises(SystemExit, match="does not take a mine count; usage: random_grid_revised ROWSxCOLS$"):
+        run(["batch", str(jobs)])
+    # minesweeper_random has a mines parameter that it ignores, so a mine list is still rejected.
+    jobs.write_text("random_grid 4x4 [[0,0]]\n")
+    with pytest.raises(SystemExit, match="random_grid does not take a mine list; usage: random_grid ROWSxCOLS$"):
+        run(["batch", str(jobs)])
+
+# Test a single invocation does not import the heavy modules it does not use
+def test_lazy_imports():
+    code = "import sys; from src.cli import main; main(['adjacent_grid', '3x3']); print(sorted(m for m in ('numpy', 'json', 'src.streaming', 'pytest') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == "[]"
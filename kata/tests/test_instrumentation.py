@@ -0,0 +1,63 @@
+import random
+
+from src.instrumentation import instrument, start_probe
+from src.main_v2 import minesweeper_basic, minesweeper_random, minesweeper_nd, minesweeper_with_adjacent_mines, minesweeper_with_numbers
+
+# Test instrumentation is off outside the context manager
+def test_off_by_default():
+    assert not start_probe("minesweeper_basic")
+    with instrument():
+        assert start_probe("minesweeper_basic")
+    assert not start_probe("minesweeper_basic")
+
+# Test phases and counters of one adjacent-mines board
+def test_adjacent_mines_phases_and_counters():
+    with instrument() as stats:
+        grid = minesweeper_with_adjacent_mines([9, 9], rng=random.Random(3), num_mines=10)
+    summary = stats.summary()["minesweeper_with_adjacent_mines"]
+    numbers = sum(cell not in ".*" for row in grid for cell in row)
+    assert summary["calls"] == 1
+    assert set(summary["phases"]) == {"allocate", "sample", "place", "count", "convert"}
+    assert summary["counters"]["cells_touched"] == 81 + 10 + numbers
+    assert summary["counters"]["neighbour_lookups"] >= 10 * 3
+    # Board, sampled index list, counts buffer and the 9 + 1 lists of the returned grid.
+    assert summary["counters"]["allocations"] == 1 + 1 + 1 + 10
+
+# Test allocations are charged where they happen, for fixed and sampled mines
+def test_allocations():
+    counts = []
+    with instrument(callback=lambda probe: counts.append(probe.counters["allocations"])) as stats:
+        minesweeper_with_numbers([6, 4], [[0, 0], [1, 1]])
+        minesweeper_with_numbers([6, 4], [[0, 0], [1, 1]], as_board=True)
+        minesweeper_with_numbers([6, 4], rng=random.Random(1), num_mines=3, as_board=True)
+        minesweeper_basic([6, 4], [[0, 0]])
+        minesweeper_nd((2, 3, 4), rng=random.Random(1), num_mines=2)
+    # Fixed mines: a position set and an index list instead of a sampled list; lists add 6 + 1.
+    # The 3D board returns 1 + 2 + 2 * 3 nested lists.
+    assert counts == [1 + 2 + 1 + 7, 1 + 2 + 1, 1 + 1 + 1, 7, 1 + 1 + 1 + 9]
+    assert stats.summary()["minesweeper_with_numbers"]["counters"]["allocations"] == 11 + 4 + 3
+
+# Test the callback gets a probe per call and totals are kept per function
+def test_callback_and_totals():
+    probes = []
+    with instrument(callback=probes.append) as stats:
+        minesweeper_basic([5, 3], [[0, 0]])
+        minesweeper_with_numbers([6, 6], rng=random.Random(1))
+        minesweeper_with_numbers([6, 6], rng=random.Random(2))
+    assert [probe.function for probe in probes] == [
+        "minesweeper_basic", "minesweeper_with_numbers", "minesweeper_with_numbers",
+    ]
+    summary = stats.summary()
+    assert summary["minesweeper_basic"]["counters"]["cells_touched"] == 16
+    assert summary["minesweeper_with_numbers"]["calls"] == 2
+    assert summary["minesweeper_with_numbers"]["phases"]["count"] == sum(probe.phases["count"] for probe in probes[1:])
+
+# Test allocations come from the objects each phase builds, so they follow the grid shape
+def test_allocations_follow_what_is_built():
+    counts = []
+    with instrument(callback=lambda probe: counts.append(probe.counters["allocations"])):
+        minesweeper_random([4, 5], multiple_mines=True, rng=random.Random(2))
+        minesweeper_random([4, 5], multiple_mines=True, as_board=True, rng=random.Random(2))
+        minesweeper_basic([0, 3])
+    # 4 + 1 grid lists or one Board, plus the sampled position list.
+    assert counts == [5 + 1, 1 + 1, 1]
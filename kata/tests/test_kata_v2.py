@@ -1,10 +1,15 @@
+import random
+
 from src.main_v2 import (
+    generate_positions,
+    sample_positions,
     minesweeper_basic,
     minesweeper_random,
     minesweeper_random_revised,
     minesweeper_with_numbers,
     minesweeper_with_adjacent_mines,
 )
+from src.render import render
 
 # Helper function to count mines or numbers in a grid
 def count_in_grid(grid, char):
@@ -25,8 +30,7 @@ def is_adjacent_to_mine(grid, i, j, include_diagonals=True):
 # Helper function to print the grid
 def print_grid(grid, title="Grid"):
     print(f"\n{title}:")
-    for row in grid:
-        print(" ".join(row))
+    print(render(grid), end="")
 
 # Test empty grid
 def test_empty_grid():
@@ -204,4 +208,12 @@ def test_minesweeper_with_adjacent_mines(grid_size=None):
                 # Ensure the number matches the count of adjacent mines
                 assert result[i][j] == str(adjacent_mines), (
                     f"Position [{i},{j}] shows {result[i][j]} but has {adjacent_mines} adjacent mines."
-                )
\ No newline at end of file
+                )
+
+# Test sampled positions are distinct, inside the grid and match sampling the full position list
+def test_sample_positions():
+    for rows, cols, k in [(12, 6, 3), (12, 6, 60), (1000, 1000, 5)]:
+        positions = sample_positions(rows, cols, k, random.Random(k))
+        assert len(set(positions)) == k
+        assert all(0 <= i < rows and 0 <= j < cols for i, j in positions)
+    assert sample_positions(12, 6, 20, random.Random(1)) == random.Random(1).sample(generate_positions(12, 6), 20)
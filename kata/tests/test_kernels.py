@@ -0,0 +1,109 @@
+import itertools
+import random
+
+import pytest
+
+from src.board import MINE, Board
+from src.kernels import (
+    KNIGHT,
+    MOORE,
+    ORTHOGONAL,
+    Kernel,
+    get_kernel,
+    kernel_counts,
+    kernel_counts_nd,
+    moore_kernel,
+    sparse_kernel_counts,
+)
+from src.main_v2 import minesweeper_nd, minesweeper_with_adjacent_mines, minesweeper_with_kernel, minesweeper_with_numbers
+
+def brute_force_counts(cells, rows, cols, kernel):
+    counts = bytearray(cells)
+    for i in range(rows):
+        for j in range(cols):
+            if cells[i * cols + j] == MINE:
+                continue
+            count = 0
+            for di, dj in kernel:
+                ni, nj = i + di, j + dj
+                if kernel.wrap:
+                    ni, nj = ni % rows, nj % cols
+                elif not (0 <= ni < rows and 0 <= nj < cols):
+                    continue
+                count += cells[ni * cols + nj] == MINE
+            counts[i * cols + j] = count
+    return counts
+
+# Test the one-pass counts match a cell-by-cell count for every kernel, with and without wrap-around
+def test_kernel_counts_match_brute_force():
+    rng = random.Random(0)
+    kernels = [ORTHOGONAL, MOORE, KNIGHT, Kernel([(0, 1)]), Kernel([(3, 0), (-1, -4)])]
+    for _ in range(300):
+        rows, cols = rng.randint(1, 8), rng.randint(1, 8)
+        cells = bytearray(MINE if rng.random() < 0.3 else 0 for _ in range(rows * cols))
+        kernel = get_kernel(rng.choice(kernels), wrap=rng.random() < 0.5)
+        expected = brute_force_counts(cells, rows, cols, kernel)
+        assert kernel_counts(cells, rows, cols, kernel) == expected
+        mines = [index for index, code in enumerate(cells) if code == MINE]
+        numbers = {index: code for index, code in enumerate(expected) if code not in (0, MINE)}
+        assert sparse_kernel_counts(mines, rows, cols, kernel) == numbers
+
+# Test a wrapping kernel numbers the cells across the edges
+def test_wrap_around():
+    grid = minesweeper_with_kernel([3, 4], 8, [[0, 0]], wrap=True)
+    assert grid == [["*", "1", ".", "1"], ["1", "1", ".", "1"], ["1", "1", ".", "1"]]
+    assert minesweeper_with_kernel([3, 4], get_kernel(8, wrap=True), [[0, 0]], sparse=True) == grid
+
+# Test the 4-way generator is the orthogonal kernel, on every output type
+def test_numbers_is_orthogonal_kernel():
+    mines = [[3, 2], [3, 3], [0, 0]]
+    grid = minesweeper_with_numbers([6, 5], mines)
+    assert grid == minesweeper_with_kernel([6, 5], "orthogonal", mines)
+    assert minesweeper_with_numbers([6, 5], mines, as_board=True) == Board.from_lists(grid)
+    assert minesweeper_with_numbers([6, 5], mines, sparse=True) == grid
+
+# Test knight's-move counts and seeded random placement with a custom kernel
+def test_knight_and_custom_kernels():
+    grid = minesweeper_with_kernel([5, 5], "knight", [[2, 2]])
+    assert sum(row.count("1") for row in grid) == 8 and grid[1][2] == "."
+    board = minesweeper_with_kernel([20, 20], [(0, 2), (0, -2)], rng=random.Random(1), num_mines=50, as_board=True)
+    assert board.count("*") == 50 and board.cells.translate(None, bytes([0, 1, 2, MINE])) == b""
+
+# Test N-dimensional counts match a cell-by-cell count, including across layers and wrapped axes
+def test_kernel_counts_nd_match_brute_force():
+    rng = random.Random(1)
+    for _ in range(100):
+        shape = tuple(rng.randint(1, 4) for _ in range(rng.randint(1, 4)))
+        kernel = get_kernel(rng.choice(["moore", "orthogonal"]), wrap=rng.random() < 0.5, ndim=len(shape))
+        positions = list(itertools.product(*map(range, shape)))
+        cells = bytearray(MINE if rng.random() < 0.3 else 0 for _ in positions)
+        expected = bytearray(cells)
+        for flat, position in enumerate(positions):
+            if cells[flat] != MINE:
+                neighbours = [tuple(p + d for p, d in zip(position, offset)) for offset in kernel]
+                if kernel.wrap:
+                    neighbours = [tuple(p % size for p, size in zip(n, shape)) for n in neighbours]
+                expected[flat] = sum(n in positions and cells[positions.index(n)] == MINE for n in neighbours)
+        assert kernel_counts_nd(cells, shape, kernel) == expected
+
+# Test 3D boards count the 26 neighbours across layers, and 2D shapes match the 2D generators
+def test_minesweeper_nd():
+    board = minesweeper_nd((3, 3, 3), mines=[(1, 1, 1)], as_board=True)
+    assert board.count("1") == 26 and board.layer(0).to_lists() == [["1"] * 3] * 3
+    assert minesweeper_nd((3, 3, 3), 6, mines=[(1, 1, 1)])[0][1] == [".", "1", "."]
+    assert get_kernel(26, ndim=3) == moore_kernel(3) and len(get_kernel("orthogonal", ndim=3)) == 6
+    board = minesweeper_nd((10, 8, 6), rng=random.Random(2), num_mines=50, as_board=True)
+    assert board.count("*") == 50
+    assert minesweeper_nd([12, 9], rng=random.Random(5)) == minesweeper_with_adjacent_mines([12, 9], rng=random.Random(5))
+
+# Test invalid kernels are rejected
+def test_invalid_kernels():
+    for offsets in ([], [(0, 0)], [(0, 1), (0, 1)]):
+        with pytest.raises(ValueError):
+            Kernel(offsets)
+    with pytest.raises(ValueError):
+        get_kernel(6)
+    with pytest.raises(ValueError):
+        get_kernel(MOORE, ndim=3)
+    with pytest.raises(ValueError):
+        minesweeper_with_kernel([5, 5], 4, [[0, 0]], with_regions=True)
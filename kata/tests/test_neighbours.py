@@ -0,0 +1,31 @@
+from src.main_v2 import get_adjacent_positions
+from src.neighbours import NeighbourCache, NeighbourTable, neighbour_indices
+
+# Test the CSR table matches get_adjacent_positions for every cell
+def test_table_matches_adjacent_positions():
+    for include_diagonals in (False, True):
+        table = NeighbourTable(5, 7, include_diagonals)
+        assert len(table.offsets) == 36
+        for index in range(35):
+            i, j = divmod(index, 7)
+            expected = {ni * 7 + nj for ni, nj in get_adjacent_positions(i, j, 5, 7, include_diagonals)}
+            assert set(table.neighbours(index)) == expected
+
+# Test the cache is keyed by shape and evicts the least recently used table
+def test_cache_lru():
+    cache = NeighbourCache(maxsize=2)
+    first = cache.get(3, 3)
+    assert cache.get(3, 3) is first
+    cache.get(4, 4)
+    cache.get(3, 3)
+    cache.get(5, 5, include_diagonals=False)
+    assert (4, 4, True) not in cache.tables and (3, 3, True) in cache.tables
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 3 and stats["tables"] == 2
+    assert stats["bytes"] == cache.memory_bytes() > 0
+
+# Test shapes too large to tabulate fall back to computed neighbours
+def test_large_shape_fallback():
+    cache = NeighbourCache()
+    assert cache.get(100000, 100000) is None
+    assert sorted(neighbour_indices(0, 100000, 100000)) == [1, 100000, 100001]
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from src.board import Board
+from src.noguess import NoGuessGenerator, minesweeper_no_guess
+from src.solver import solve
+
+# Test generated boards are solvable from the first click, which is safe
+@pytest.mark.parametrize("grid_size, num_mines", [([9, 9], 10), ([16, 16], 40)])
+def test_no_guess_boards_are_solvable(grid_size, num_mines):
+    for seed in range(3):
+        grid = minesweeper_no_guess(grid_size, num_mines, rng=random.Random(seed))
+        rows, cols = grid_size
+        assert sum(row.count("*") for row in grid) == num_mines
+        centre = (rows // 2, cols // 2)
+        assert grid[centre[0]][centre[1]] == "."
+        assert solve(grid, start=centre).solved
+
+# Test the 4-way neighbourhood and a custom first click
+def test_no_guess_orthogonal():
+    grid = minesweeper_no_guess([9, 9], 8, first_click=(0, 0), neighbourhood=4, rng=random.Random(1))
+    assert grid[0][0] == "." and solve(grid, neighbourhood=4, start=(0, 0)).solved
+
+# Test moving a mine only fixes the counts around it
+def test_move_mine():
+    generator = NoGuessGenerator([3, 3], 1)
+    cells = bytearray(Board.from_lists([["*", "1", "."], ["1", "1", "."], [".", ".", "."]]).cells)
+    generator.move_mine(cells, 0, 8)
+    assert Board(3, 3, cells).to_lists() == [[".", ".", "."], [".", "1", "1"], [".", "1", "*"]]
+
+# Test repairs are used and counted
+def test_generator_counters():
+    generator = NoGuessGenerator([16, 16], 40, rng=random.Random(2))
+    for _ in range(5):
+        generator.generate(as_board=True)
+    assert generator.attempts >= 5
+    assert generator.repairs > 0
+
+# Test too many mines for the safe zone is rejected
+def test_too_many_mines():
+    with pytest.raises(ValueError):
+        NoGuessGenerator([3, 3], 1).generate()
+
+# Test the default mine count fits the safe zone of the click and neighbourhood, and is zero when nothing fits
+def test_default_mine_count_fits_safe_zone():
+    assert minesweeper_no_guess([2, 2], rng=random.Random(1)) == [[".", "."], [".", "."]]
+    assert sum(row.count("*") for row in minesweeper_no_guess([3, 3], rng=random.Random(1))) == 0
+    for seed in range(20):
+        # A corner click leaves 5 of 9 cells outside an 8-way safe zone, and the cap is 9 // 4 = 2.
+        grid = minesweeper_no_guess([3, 3], first_click=(0, 0), rng=random.Random(seed))
+        assert 1 <= sum(row.count("*") for row in grid) <= 2 and grid[0][0] == "."
+        # A 4-way safe zone around the centre of a 3x4 board leaves 7 cells outside it.
+        grid = minesweeper_no_guess([3, 4], neighbourhood=4, rng=random.Random(seed))
+        assert 1 <= sum(row.count("*") for row in grid) <= 3
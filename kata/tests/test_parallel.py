@@ -0,0 +1,30 @@
+import random
+
+from src.board import Board
+from src.main_v2 import minesweeper_with_numbers, minesweeper_with_adjacent_mines
+from src.parallel import board_seed, generate_parallel
+
+# Test seeds depend on both the master seed and the board index
+def test_board_seed():
+    assert board_seed(1, 0) == board_seed(1, 0)
+    assert board_seed(1, 0) != board_seed(1, 1)
+    assert board_seed(1, 0) != board_seed(2, 0)
+
+# Test a board can be regenerated on its own from its seed
+def test_board_matches_its_seed():
+    boards = generate_parallel([12, 6], 5, minesweeper_with_numbers, master_seed=9, workers=1)
+    assert boards[3] == minesweeper_with_numbers([12, 6], rng=random.Random(board_seed(9, 3)))
+
+# Test the output is identical for any worker count and chunk size
+def test_output_independent_of_workers():
+    serial = generate_parallel([12, 6], 40, minesweeper_with_adjacent_mines, master_seed=5, workers=1)
+    pooled = generate_parallel([12, 6], 40, minesweeper_with_adjacent_mines, master_seed=5, workers=3, chunk_size=7)
+    assert len(serial) == 40
+    assert serial == pooled
+    assert len({str(board) for board in serial}) > 1
+
+# Test boards can be returned in the compact Board format
+def test_parallel_as_board():
+    boards = generate_parallel([5, 3], 4, minesweeper_with_numbers, master_seed=1, workers=2, chunk_size=2, as_board=True)
+    assert all(isinstance(board, Board) for board in boards)
+    assert [board.to_lists() for board in boards] == generate_parallel([5, 3], 4, minesweeper_with_numbers, master_seed=1, workers=1)
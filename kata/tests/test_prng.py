@@ -0,0 +1,43 @@
+import random
+
+from src.main_v2 import mines_for_density, minesweeper_from_id
+from src.prng import CounterRNG
+
+# Test the stream matches the SplitMix64 reference outputs for seed 1234567
+def test_splitmix64_reference():
+    rng = CounterRNG(1234567)
+    assert [rng.next64() for _ in range(3)] == [6457827717110365317, 3203168211198807973, 9817491932198370423]
+    assert rng.at(4) == 16408922859458223821
+
+# Test draws stay in range and samples are distinct
+def test_draws():
+    rng = CounterRNG(42)
+    assert all(1 <= rng.randint(1, 6) <= 6 for _ in range(200))
+    assert sorted(rng.sample(range(50), 50)) == list(range(50))
+    picks = rng.sample(range(10 ** 9), 1000)
+    assert len(set(picks)) == 1000
+    assert 0.0 <= rng.random() < 1.0
+
+# Test a board id always regenerates the same pinned board, without touching the global random state
+def test_board_from_id_is_pinned():
+    state = random.getstate()
+    assert minesweeper_from_id([4, 5], 0.25, board_id=7) == [
+        list("1221."), list("2**1."), list("*4321"), list("2*11*"),
+    ]
+    assert minesweeper_from_id([4, 5], 0.25, board_id=7, neighbourhood=4) == [
+        list(".1.1*"), list("1*1.1"), list(".2.11"), list("1*2**"),
+    ]
+    assert random.getstate() == state
+
+# Test the id, density and shape select different boards with the requested mine count
+def test_board_ids_differ():
+    boards = [minesweeper_from_id([16, 30], 0.2, board_id) for board_id in range(5)]
+    assert all(sum(row.count("*") for row in board) == 96 for board in boards)
+    assert len({str(board) for board in boards}) == 5
+    assert minesweeper_from_id([16, 30], 0.2, 3, as_board=True).to_lists() == boards[3]
+
+# Test densities round to the nearest mine count instead of truncating float error
+def test_density_rounds_to_nearest():
+    assert 100 * 0.29 < 29 and mines_for_density(100, 0.29) == 29
+    board = minesweeper_from_id([10, 10], 0.29, board_id=1)
+    assert sum(row.count("*") for row in board) == 29
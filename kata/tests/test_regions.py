@@ -0,0 +1,46 @@
+import random
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.regions import NO_REGION, RegionIndex
+from src.reveal import RevealEngine
+
+# Test two separate empty regions get their own ids and share a border number
+def test_label_regions():
+    grid = [
+        [".", "1", "*", "1", "."],
+        [".", "1", "1", "1", "."],
+        [".", ".", ".", ".", "."],
+    ]
+    index = RegionIndex(grid)
+    assert len(index) == 1
+    grid[2] = ["1", "1", "*", "1", "1"]
+    grid[1] = ["1", "2", "2", "2", "1"]
+    grid[0] = [".", "1", "*", "1", "."]
+    index = RegionIndex(grid)
+    assert len(index) == 2
+    assert index.region(0, 0) != index.region(0, 4)
+    assert index.region(0, 1) == NO_REGION
+    assert index.reveal(0, 0) == {(0, 0), (0, 1), (1, 0), (1, 1)}
+    assert index.reveal(1, 2) == {(1, 2)}
+
+# Test lookups give the same cells as filling on random boards
+def test_regions_match_reveal_engine():
+    for seed in range(10):
+        grid, index = minesweeper_with_adjacent_mines([30, 40], rng=random.Random(seed), num_mines=60, with_regions=True)
+        engine = RevealEngine(grid)
+        for i in range(0, 30, 3):
+            for j in range(0, 40, 3):
+                assert index.reveal(i, j) == engine.reveal(i, j)
+
+# Test the precompute also works on a Board
+def test_regions_on_board():
+    board, index = minesweeper_with_adjacent_mines([12, 6], as_board=True, rng=random.Random(1), with_regions=True)
+    grid = board.to_lists()
+    assert all((index.region(i, j) != NO_REGION) == (grid[i][j] == ".") for i in range(12) for j in range(6))
+
+# Test an empty grid still comes back with its (empty) region index
+def test_regions_on_empty_grid():
+    grid, index = minesweeper_with_adjacent_mines([], with_regions=True)
+    assert grid == [] and len(index) == 0
+    board, index = minesweeper_with_adjacent_mines([], as_board=True, with_regions=True)
+    assert len(board) == 0 and len(index) == 0
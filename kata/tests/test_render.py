@@ -0,0 +1,38 @@
+import io
+import random
+
+from src.board import Board
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.render import render, write_grid
+
+def reference(grid):
+    return "".join(" ".join(row) + "\n" for row in grid)
+
+# Test lists, Boards and SparseBoards render like the per-row print loop
+def test_render_matches_print_loop():
+    grid = minesweeper_with_adjacent_mines([9, 13], rng=random.Random(4))
+    board = Board.from_lists(grid)
+    sparse = minesweeper_with_adjacent_mines([9, 13], rng=random.Random(4), sparse=True)
+    assert render(grid) == render(board) == render(sparse) == reference(grid)
+    assert render([]) == render(Board(0, 0)) == ""
+
+# Test viewports are clipped to the board
+def test_viewport():
+    grid = minesweeper_with_adjacent_mines([9, 13], rng=random.Random(4))
+    window = [row[3:8] for row in grid[2:6]]
+    assert render(grid, (2, 3, 4, 5)) == render(Board.from_lists(grid), (2, 3, 4, 5)) == reference(window)
+    assert render(grid, (7, 10, 50, 50)) == reference([row[10:] for row in grid[7:]])
+    assert render(grid, (20, 0, 5, 5)) == ""
+
+# Test chunked writes produce the same text as one buffer
+def test_write_grid_chunks():
+    board = Board.from_lists(minesweeper_with_adjacent_mines([40, 30], rng=random.Random(6)))
+    out = io.StringIO()
+    assert write_grid(board, out, chunk_cells=100) == len(render(board))
+    assert out.getvalue() == render(board)
+
+# Test multi-digit counts fall back to the general path
+def test_multi_digit_counts():
+    board = Board(1, 3)
+    board[0][1] = "12"
+    assert render(board) == ". 12 .\n"
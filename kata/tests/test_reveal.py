@@ -0,0 +1,57 @@
+import random
+from collections import deque
+
+from src.main_v2 import get_adjacent_positions, minesweeper_with_adjacent_mines
+from src.reveal import RevealEngine, reveal
+
+# Reference breadth-first reveal used to check the scanline fill
+def reveal_reference(grid, i, j):
+    rows, cols = len(grid), len(grid[0])
+    revealed = {(i, j)}
+    queue = deque([(i, j)] if grid[i][j] == "." else [])
+    while queue:
+        ci, cj = queue.popleft()
+        for ni, nj in get_adjacent_positions(ci, cj, rows, cols, include_diagonals=True):
+            if (ni, nj) not in revealed:
+                revealed.add((ni, nj))
+                if grid[ni][nj] == ".":
+                    queue.append((ni, nj))
+    return revealed
+
+# Test clicking a number or a mine only reveals that cell
+def test_reveal_single_cell():
+    grid = [["*", "1", "."], ["1", "1", "."], [".", ".", "."]]
+    assert reveal(grid, 0, 0) == {(0, 0)}
+    assert reveal(grid, 0, 1) == {(0, 1)}
+
+# Test clicking an empty cell opens the region and its border
+def test_reveal_region():
+    grid = [["*", "1", "."], ["1", "1", "."], [".", ".", "."]]
+    assert reveal(grid, 2, 2) == {(0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+
+# Test the scanline fill matches a breadth-first reveal on random boards
+def test_reveal_matches_reference():
+    rng = random.Random(0)
+    for seed in range(20):
+        grid = minesweeper_with_adjacent_mines([30, 40], rng=random.Random(seed), num_mines=rng.randint(10, 120))
+        engine = RevealEngine(grid)
+        empty_cells = [(i, j) for i in range(30) for j in range(40) if grid[i][j] == "."]
+        for i, j in rng.sample(empty_cells, min(5, len(empty_cells))):
+            assert engine.reveal(i, j) == reveal_reference(grid, i, j)
+            spans = engine.reveal_spans(i, j)
+            assert sum(stop - start for start, stop in spans) == len(reveal_reference(grid, i, j))
+
+# Test already revealed cells are skipped and marked in the shared mask
+def test_reveal_with_seen_mask():
+    grid = [[".", ".", "1", "*"], [".", ".", "1", "1"], [".", ".", ".", "."]]
+    engine = RevealEngine(grid)
+    seen = bytearray(12)
+    assert len(engine.reveal(0, 0, seen)) == 11
+    assert engine.reveal(2, 3, seen) == set()
+    assert seen.count(1) == 11
+
+# Test a huge open board is revealed without recursion
+def test_reveal_large_open_board():
+    engine = RevealEngine(minesweeper_with_adjacent_mines([1000, 1000], rng=random.Random(1), num_mines=20))
+    spans = engine.reveal_spans(0, 0) or engine.reveal_spans(999, 999)
+    assert sum(stop - start for start, stop in spans) > 990000
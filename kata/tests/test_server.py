@@ -0,0 +1,119 @@
+import asyncio
+import json
+import random
+import threading
+import time
+
+from src.server import BoardPool, BoardServer, fetch_board
+
+KEY = (9, 9, 0.15, 8)
+
+async def request(host, port, *lines):
+    reader, writer = await asyncio.open_connection(host, port)
+    responses = []
+    for line in lines:
+        writer.write(f"{line}\n".encode())
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+# Test boards are served from a prefilled pool over localhost
+def test_serves_prefilled_boards():
+    async def scenario():
+        server = BoardServer(pool_size=4, seed=1)
+        await server.prefill(KEY)
+        host, port = await server.start()
+        grid = await fetch_board(host, port, "9x9", 0.15)
+        stats, = await request(host, port, "STATS")
+        await server.close()
+        return grid, stats
+    grid, stats = asyncio.run(scenario())
+    assert len(grid) == 9 and sum(row.count("*") for row in grid) == 12
+    assert stats["pools"]["9x9/0.15/8"]["hits"] == 1
+    assert stats["requests"] == 2 and stats["p50_ms"] is not None and stats["p99_ms"] >= stats["p50_ms"]
+
+# Test full pools stop their refill tasks
+def test_full_pool_pauses_refill():
+    async def scenario():
+        server = BoardServer(pool_size=3, workers=1)
+        await server.prefill(KEY)
+        await asyncio.sleep(0.05)
+        generated = server.pools[KEY].generated
+        await server.close()
+        return generated
+    assert asyncio.run(scenario()) == 3
+
+# Test a seeded server hands out the same boards in the same order on every run, with several workers
+def test_seeded_pools_are_reproducible(monkeypatch):
+    # Unseeded delays make the refill threads finish in a different order on every run.
+    jitter = random.Random()
+    generate = BoardPool.generate
+    monkeypatch.setattr(BoardPool, "generate", lambda pool, rng: time.sleep(jitter.random() / 500) or generate(pool, rng))
+
+    async def boards(workers):
+        server = BoardServer(pool_size=6, workers=workers, seed=7, ordered=True)
+        await server.prefill(KEY)
+        # Taking more boards than the pool holds also covers boards generated after the prefill.
+        taken = [str((await server.get_board(KEY)).to_lists()) for _ in range(12)]
+        await server.close()
+        return taken
+    first = asyncio.run(boards(3))
+    assert all(asyncio.run(boards(3)) == first for _ in range(3))
+    assert len(set(first)) == 12 and asyncio.run(boards(1)) == asyncio.run(boards(1))
+
+# Test a slow worker does not hold up requests while another worker has boards ready
+def test_slow_worker_does_not_block(monkeypatch):
+    gate = threading.Event()
+    generate = BoardPool.generate
+    monkeypatch.setattr(BoardPool, "generate", lambda pool, rng: (rng is not pool.rngs[1] or gate.wait()) and generate(pool, rng))
+
+    async def scenario():
+        server = BoardServer(pool_size=4, workers=2)
+        pool = server.pool(KEY)
+        while pool.stats()["ready"] < 2:
+            await asyncio.sleep(0.01)
+        try:
+            boards = [await asyncio.wait_for(server.get_board(KEY), 1) for _ in range(2)]
+        finally:
+            gate.set()
+        stats = pool.stats()
+        await server.close()
+        return boards, stats
+    boards, stats = asyncio.run(scenario())
+    assert len(boards) == 2 and stats["hits"] == 2 and stats["misses"] == 0
+
+# Test requests beyond max_waiting on an empty pool are rejected, and waiting ones are served
+def test_backpressure_rejects_when_too_many_wait(monkeypatch):
+    gate = threading.Event()
+    generate = BoardPool.generate
+    monkeypatch.setattr(BoardPool, "generate", lambda pool, rng: gate.wait() and generate(pool, rng))
+
+    async def scenario():
+        server = BoardServer(pool_size=2, max_waiting=1)
+        host, port = await server.start()
+        waiting = asyncio.create_task(request(host, port, "GET 9x9 0.15 8"))
+        await asyncio.sleep(0.05)
+        rejected, = await request(host, port, "GET 9x9 0.15 8")
+        gate.set()
+        served, = await waiting
+        stats = server.stats()
+        await server.close()
+        return rejected, served, stats
+    rejected, served, stats = asyncio.run(scenario())
+    assert "already waiting" in rejected["error"]
+    assert served["rows"] == 9 and len(served["grid"]) == 9
+    assert stats["rejected"] == 1 and stats["pools"]["9x9/0.15/8"]["misses"] == 1
+
+# Test malformed requests get an error and keep the connection open
+def test_errors():
+    async def scenario():
+        server = BoardServer(pool_size=1, max_pools=1)
+        host, port = await server.start()
+        responses = await request(host, port, "HELLO", "GET 3x3 2 8", "GET 4x4 0.2 4", "GET 5x5 0.2 8")
+        await server.close()
+        return responses
+    bad, density, board, too_many = asyncio.run(scenario())
+    assert "expected GET" in bad["error"] and "density" in density["error"]
+    assert board["rows"] == 4 and "at most 1" in too_many["error"]
@@ -0,0 +1,112 @@
+import random
+
+from src.main_v2 import minesweeper_with_adjacent_mines
+from src.session import FLAG, HIDDEN, LOST, PLAYING, WON, GameSession
+
+GRID = [
+    ["*", "1", ".", "."],
+    ["1", "1", ".", "."],
+    [".", ".", "1", "1"],
+    [".", ".", "1", "*"],
+]
+
+# Test a cascade reveals the region and updates the counter
+def test_reveal_cascade():
+    session = GameSession(GRID)
+    assert session.safe_remaining == 14
+    changes = session.reveal(0, 3)
+    assert sum(stop - start for start, stop in changes) == 14
+    assert session.safe_remaining == 0 and session.status == WON
+    assert session.cell(0, 0) == HIDDEN and session.cell(2, 2) == "1"
+
+# Test revealing a mine loses and undo brings the game back
+def test_reveal_mine_and_undo():
+    session = GameSession(GRID)
+    session.reveal(0, 1)
+    assert session.safe_remaining == 13
+    session.reveal(0, 0)
+    assert session.status == LOST
+    assert session.reveal(0, 3) == []
+    session.undo()
+    assert session.status == PLAYING and session.cell(0, 0) == HIDDEN
+    session.undo()
+    assert session.safe_remaining == 14 and session.cell(0, 1) == HIDDEN
+    assert session.undo() == []
+
+# Test flags block reveals and survive cascades
+def test_flags():
+    session = GameSession(GRID)
+    session.flag(1, 1)
+    assert session.cell(1, 1) == FLAG and session.flag_count == 1
+    assert session.reveal(1, 1) == []
+    session.reveal(0, 3)
+    assert session.is_flagged(1, 1) and not session.is_revealed(1, 1)
+    assert session.safe_remaining == 1 and session.status == PLAYING
+    session.flag(1, 1)
+    session.reveal(1, 1)
+    assert session.status == WON and session.flag_count == 0
+
+# Test a chord with nothing left to reveal is not a move, so undo reverts the move before it
+def test_chord_without_hidden_neighbours_is_not_recorded():
+    grid = [
+        [".", "1", "*", "2", "*", "1"],
+        [".", "1", "1", "2", "2", "2"],
+        [".", ".", ".", ".", "1", "*"],
+    ]
+    session = GameSession(grid)
+    session.reveal(2, 0)
+    session.flag(0, 2)
+    assert session.chord(0, 1) == []
+    assert session.undo() == [(2, 3)]
+    assert not session.is_flagged(0, 2)
+
+# Test chording reveals the unflagged neighbours once the flags match the number
+def test_chord():
+    session = GameSession(GRID)
+    session.reveal(1, 1)
+    assert session.chord(1, 1) == []
+    session.flag(0, 0)
+    session.flag(3, 3)
+    changes = session.chord(1, 1)
+    assert changes and session.is_revealed(0, 1) and session.is_revealed(2, 2)
+    assert session.status == WON
+    session.undo()
+    assert session.cell(0, 1) == HIDDEN and session.is_revealed(1, 1)
+
+# Test a random game played to the end never rescans the board
+def test_random_game_counters():
+    grid = minesweeper_with_adjacent_mines([30, 30], rng=random.Random(3), num_mines=90)
+    session = GameSession(grid)
+    safe = [(i, j) for i in range(30) for j in range(30) if grid[i][j] != "*"]
+    for i, j in random.Random(4).sample(safe, len(safe)):
+        session.reveal(i, j)
+        hidden_safe = sum(1 for a, b in safe if session.cell(a, b) == HIDDEN)
+        assert session.safe_remaining == hidden_safe
+    assert session.status == WON
+    assert len(session.render()) == 30
+
+# Test the counters match a full recount after every flag, unflag, reveal and undo
+def test_random_moves_match_recount():
+    cells = [(i, j) for i in range(9) for j in range(9)]
+    for seed in range(100):
+        rng = random.Random(seed)
+        grid = minesweeper_with_adjacent_mines([9, 9], rng=rng, num_mines=rng.randint(1, 10))
+        session = GameSession(grid)
+        for _ in range(60):
+            flagged = [cell for cell in cells if session.is_flagged(*cell)]
+            move = rng.random()
+            if move < 0.3:
+                session.flag(*rng.choice(cells))
+            elif move < 0.5 and flagged:
+                # Lift a flag and reveal the cell, which a cascade may have opened around.
+                cell = rng.choice(flagged)
+                session.flag(*cell)
+                session.reveal(*cell)
+            elif move < 0.9:
+                session.reveal(*rng.choice(cells))
+            else:
+                session.undo()
+            safe_remaining = sum(1 for i, j in cells if grid[i][j] != "*" and not session.is_revealed(i, j))
+            assert session.safe_remaining == safe_remaining, seed
+            assert session.flag_count == len([cell for cell in cells if session.is_flagged(*cell)]), seed
+            assert (session.status == WON) == (safe_remaining == 0 and session.status != LOST), seed
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from src.main_v2 import minesweeper_with_numbers, minesweeper_with_adjacent_mines
+from src.solver import FLAGGED, SAFE, Solver, solve
+
+# Test a board that opens up completely from one click
+def test_solve_simple_board():
+    grid = [
+        ["*", "1", ".", "."],
+        ["1", "1", ".", "."],
+        [".", ".", "1", "1"],
+        [".", ".", "1", "*"],
+    ]
+    result = solve(grid)
+    assert result.solved and result.mines_found == 2 and result.revealed == 14
+    assert result.steps > 0 and result.seconds >= 0
+
+# Test the subset rule: the 1-2-1 pattern
+def test_subset_rule():
+    grid = [
+        ["1", "*", "2", "*", "1"],
+        ["1", "1", "2", "1", "1"],
+        [".", ".", ".", ".", "."],
+    ]
+    assert solve(grid).solved
+
+# Test a board that needs a guess leaves the solver stuck
+def test_guess_required():
+    grid = [["*", "1"], ["1", "1"]]
+    result = Solver(grid).solve(start=(1, 1))
+    assert not result.solved and result.revealed == 1
+
+# Test every deduction on random boards is correct, in both neighbourhood modes
+@pytest.mark.parametrize("neighbourhood", [4, 8])
+def test_deductions_are_correct(neighbourhood):
+    generate = minesweeper_with_adjacent_mines if neighbourhood == 8 else minesweeper_with_numbers
+    solved = 0
+    for seed in range(30):
+        grid = generate([9, 9], rng=random.Random(seed))
+        solver = Solver(grid, neighbourhood)
+        result = solver.solve()
+        for index, state in enumerate(solver.state):
+            i, j = divmod(index, 9)
+            if state == FLAGGED:
+                assert grid[i][j] == "*"
+            elif state == SAFE:
+                assert grid[i][j] != "*"
+        solved += result.solved
+        if result.solved:
+            assert result.mines_found == sum(row.count("*") for row in grid)
+    assert solved > 0
+
+# Test the neighbourhood is validated
+def test_invalid_neighbourhood():
+    with pytest.raises(ValueError):
+        Solver([["."]], neighbourhood=6)
@@ -0,0 +1,47 @@
+import random
+
+from src.main_v2 import minesweeper_with_numbers, minesweeper_with_adjacent_mines
+from src.sparse import SparseBoard
+
+# Test missing cells read as '.'
+def test_cell_lookup():
+    board = SparseBoard(3, 4, mines={(1, 1)}, numbers={(0, 1): 1})
+    assert board[1, 1] == "*" and board[0][1] == "1" and board[2][3] == "."
+    assert board.to_lists() == [
+        [".", "1", ".", "."],
+        [".", "*", ".", "."],
+        [".", ".", ".", "."],
+    ]
+    assert board.count("*") == 1 and board.count("1") == 1 and board.count(".") == 10
+
+# Test writing cells through row views
+def test_set_cells():
+    board = SparseBoard(2, 2)
+    board[0][0] = "*"
+    board[1][1] = "2"
+    board[1][1] = "."
+    assert board.mines == {(0, 0)} and board.numbers == {}
+    assert " ".join(board[0]) == "* ."
+
+# Test sparse results match the dense grids for the same seed
+def test_sparse_matches_dense():
+    for seed in range(5):
+        dense = minesweeper_with_numbers([12, 6], rng=random.Random(seed))
+        assert minesweeper_with_numbers([12, 6], rng=random.Random(seed), sparse=True) == dense
+        dense = minesweeper_with_adjacent_mines([12, 6], rng=random.Random(seed))
+        assert minesweeper_with_adjacent_mines([12, 6], rng=random.Random(seed), sparse=True) == dense
+
+# Test fixed mines in sparse mode
+def test_sparse_fixed_mines():
+    board = minesweeper_with_numbers([12, 6], [[3, 2], [3, 3]], sparse=True)
+    assert board.mines == {(3, 2), (3, 3)}
+    assert board[3][1] == "1" and board[2][2] == "1" and board[3][4] == "1"
+
+# Test a huge board only stores the mines and their neighbours
+def test_huge_sparse_board():
+    board = minesweeper_with_adjacent_mines([100000, 100000], rng=random.Random(1), sparse=True, num_mines=1000)
+    assert len(board) == 100000 and len(board[0]) == 100000
+    assert board.count("*") == 1000
+    assert len(board.numbers) <= 8 * 1000
+    i, j = next(iter(board.mines))
+    assert board[i][j] == "*"
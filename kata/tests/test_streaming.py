@@ -0,0 +1,60 @@
+import random
+
+from src.board import Board
+from src.main_v2 import minesweeper_with_kernel, minesweeper_with_numbers, minesweeper_with_adjacent_mines
+from src.streaming import (
+    BinaryWriter,
+    JsonlWriter,
+    read_binary,
+    read_jsonl,
+    stream_boards,
+    writer_for,
+)
+
+# Test boards are produced lazily
+def test_stream_boards_is_lazy():
+    calls = []
+    def generator(gridSize, **kwargs):
+        calls.append(gridSize)
+        return minesweeper_with_numbers(gridSize, **kwargs)
+    boards = stream_boards(generator, [5, 3])
+    assert calls == []
+    next(boards)
+    next(boards)
+    assert len(calls) == 2
+
+# Test stream_boards passes keyword arguments through
+def test_stream_boards_kwargs():
+    boards = list(stream_boards(minesweeper_with_adjacent_mines, [4, 4], 3, as_board=True, rng=random.Random(1)))
+    assert len(boards) == 3 and all(isinstance(board, Board) for board in boards)
+
+# Test JSONL round trip with a small buffer so several bulk writes happen
+def test_jsonl_round_trip(tmp_path):
+    path = tmp_path / "boards.jsonl"
+    boards = list(stream_boards(minesweeper_with_adjacent_mines, [12, 6], 20, rng=random.Random(2)))
+    with JsonlWriter(path, buffer_size=256) as writer:
+        assert writer.write_all(iter(boards)) == 20
+    assert list(read_jsonl(path)) == boards
+    box = [(di, dj) for di in range(-2, 3) for dj in range(-2, 3) if di or dj]
+    wide = minesweeper_with_kernel([8, 8], kernel=box, rng=random.Random(0), num_mines=40)
+    assert any(len(cell) > 1 for row in wide for cell in row)
+    with JsonlWriter(path) as writer:
+        writer.write_all([wide, Board.from_lists(wide), boards[0]])
+    assert list(read_jsonl(path)) == [wide, wide, boards[0]]
+
+# Test binary round trip accepts both lists and Boards
+def test_binary_round_trip(tmp_path):
+    path = tmp_path / "boards.bin"
+    boards = list(stream_boards(minesweeper_with_numbers, [9, 7], 10, rng=random.Random(3)))
+    with BinaryWriter(path, buffer_size=100) as writer:
+        writer.write_all(boards[:5])
+        writer.write_all(Board.from_lists(grid) for grid in boards[5:])
+    assert [board.to_lists() for board in read_binary(path)] == boards
+    assert path.stat().st_size == 5 + 10 * (8 + 9 * 7)
+
+# Test the writer is chosen from the extension
+def test_writer_for(tmp_path):
+    with writer_for(tmp_path / "a.jsonl") as writer:
+        assert isinstance(writer, JsonlWriter)
+    with writer_for(tmp_path / "a.bin") as writer:
+        assert isinstance(writer, BinaryWriter)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import main_v2
+from src.kernels import get_kernel, kernel_counts
+from src.vectorized import (
+    MINE,
+    count_adjacent,
+    count_kernel,
+    mines_to_array,
+    minesweeper_with_numbers,
+    minesweeper_with_adjacent_mines,
+    random_mine_array,
+)
+
+# Test the empty grid matches main_v2
+def test_empty_grid():
+    assert minesweeper_with_numbers([]) == []
+    assert minesweeper_with_adjacent_mines([]) == []
+
+# Test counts around a single mine in the middle of the grid
+def test_count_adjacent_single_mine():
+    mine_array = mines_to_array(3, 3, [(1, 1)])
+    assert count_adjacent(mine_array, include_diagonals=False).tolist() == [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+    assert count_adjacent(mine_array, include_diagonals=True).tolist() == [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+
+# Test fixed mines give the same grid as main_v2
+def test_numbers_with_fixed_mines_matches_main_v2():
+    mine_positions = [(3, 2), (3, 3), (3, 4), (0, 0)]
+    assert minesweeper_with_numbers([12, 6], mine_positions) == main_v2.minesweeper_with_numbers([12, 6], mine_positions)
+
+# Test random boards match main_v2 when both use the same seed
+@pytest.mark.parametrize("grid_size", [[2, 2], [5, 3], [12, 6], [40, 25]])
+def test_random_boards_match_main_v2(grid_size):
+    for seed in range(5):
+        random.seed(seed)
+        expected = main_v2.minesweeper_with_numbers(grid_size)
+        random.seed(seed)
+        assert minesweeper_with_numbers(grid_size) == expected
+
+        random.seed(seed)
+        expected = main_v2.minesweeper_with_adjacent_mines(grid_size)
+        random.seed(seed)
+        assert minesweeper_with_adjacent_mines(grid_size) == expected
+
+# Test the uint8 array output
+def test_as_array():
+    random.seed(7)
+    grid = main_v2.minesweeper_with_adjacent_mines([12, 6])
+    random.seed(7)
+    cells = minesweeper_with_adjacent_mines([12, 6], as_array=True)
+    assert cells.dtype == np.uint8 and cells.shape == (12, 6)
+    for i in range(12):
+        for j in range(6):
+            expected = {"*": MINE, ".": 0}.get(grid[i][j])
+            assert cells[i, j] == (int(grid[i][j]) if expected is None else expected)
+
+# Test the NumPy kernel counts match the one-pass kernel engine, including wrap-around
+def test_count_kernel_matches_kernel_counts():
+    mine_array = random_mine_array(7, 9, 15, random.Random(4))
+    cells = bytearray(np.where(mine_array, MINE, 0).astype(np.uint8).tobytes())
+    for kernel in (4, 8, "knight", [(0, 3), (-2, 1)]):
+        for wrap in (False, True):
+            counts = count_kernel(mine_array, get_kernel(kernel, wrap))
+            expected = np.frombuffer(kernel_counts(cells, 7, 9, get_kernel(kernel, wrap)), dtype=np.uint8).reshape(7, 9)
+            assert (counts[~mine_array] == expected[~mine_array]).all()
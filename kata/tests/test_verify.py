@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from src.board import Board
+from src.boardfile import PackedBoardWriter
+from src.main_v2 import minesweeper_with_adjacent_mines, minesweeper_with_kernel, minesweeper_with_numbers
+from src.streaming import writer_for
+from src.verify import VerifyReport, grid_cells, verify_batch, verify_file, verify_stream
+
+def boards(count, seed=0, generator=minesweeper_with_adjacent_mines, **kwargs):
+    rng = random.Random(seed)
+    return [generator([9, 9], rng=rng, num_mines=10, **kwargs) for _ in range(count)]
+
+def break_count(grid):
+    """Changes the first number cell of grid to a wrong count."""
+    for row in grid:
+        for j, cell in enumerate(row):
+            if cell not in ".*":
+                row[j] = str(int(cell) % 8 + 1)
+                return grid
+
+# Test generated boards pass and the report names each offending board and check
+def test_verify_batch_reports_offenders():
+    grids = boards(50)
+    assert verify_batch(grids, num_mines=10, min_density=0.1, max_density=0.2).ok
+    break_count(grids[3])
+    grids[7] = grids[7][:-1] + [grids[7][-1][:-1]]
+    grids[9][0][0] = "x"
+    grids[11] = minesweeper_with_adjacent_mines([9, 9], rng=random.Random(1), num_mines=30)
+    report = verify_batch(grids, num_mines=10, max_density=0.2)
+    assert report.checked == 50 and report.indices == [3, 7, 9, 11]
+    assert report.failures == {3: ["counts"], 7: ["shape"], 9: ["symbols"], 11: ["mines", "density"]}
+    assert report.reasons()["mines"] == 1
+
+# Test the 4-way rule, mixed shapes and input types in one batch
+def test_neighbourhoods_and_inputs():
+    grids = boards(5, generator=minesweeper_with_numbers) + [Board.from_lists(boards(1, generator=minesweeper_with_numbers)[0])]
+    grids.append(["".join(row) for row in minesweeper_with_numbers([16, 30], rng=random.Random(2))])
+    assert verify_batch(grids, neighbourhood=4).ok
+    assert not verify_batch(grids, neighbourhood=8).ok
+    with pytest.raises(ValueError):
+        grid_cells([])
+
+# Test list grids with counts of 10 or more pass, and bad symbols among them still fail
+def test_multi_digit_counts():
+    box = [(di, dj) for di in range(-2, 3) for dj in range(-2, 3) if di or dj]
+    grid = minesweeper_with_kernel([8, 8], kernel=box, rng=random.Random(0), num_mines=40)
+    assert any(len(cell) > 1 for row in grid for cell in row)
+    report = verify_batch([grid, Board.from_lists(grid)], neighbourhood=box, num_mines=40)
+    assert report.ok and report.checked == 2
+    wrong = [row[:] for row in grid]
+    j = next(j for j, cell in enumerate(wrong[3]) if cell != "*")
+    wrong[3][j] = str(int(wrong[3][j]) % 20 + 1) if wrong[3][j] != "." else "1"
+    unknown = [row[:] for row in grid]
+    unknown[4][4] = "x1"
+    assert verify_batch([grid, wrong, unknown], neighbourhood=box).failures == {1: ["counts"], 2: ["symbols"]}
+
+# Test NumPy arrays from generate_batch are checked as a whole
+def test_verify_array():
+    np = pytest.importorskip("numpy")
+    from src.batch import generate_batch
+    cells = generate_batch((16, 16), 20, 0.15, neighbourhood=4, seed=1)
+    assert verify_batch(cells, neighbourhood=4, num_mines=38).ok
+    cells[5, 0, 0] = 7 if cells[5, 0, 0] != 7 else 6
+    assert verify_batch(cells, neighbourhood=4).indices == [5]
+    assert verify_batch(np.stack([cells[5]]), neighbourhood=4, start=100).indices == [100]
+
+# Test streaming over JSONL, binary and packed files reports file-wide indices
+def test_verify_files(tmp_path):
+    grids = boards(30)
+    break_count(grids[17])
+    for name in ("boards.jsonl", "boards.bin"):
+        with writer_for(tmp_path / name) as writer:
+            writer.write_all(grids)
+        report = verify_stream(iter(grids), batch_size=4)
+        assert verify_file(tmp_path / name, batch_size=4).failures == report.failures == {17: ["counts"]}
+    with PackedBoardWriter(tmp_path / "boards.mswp", 9, 9) as writer:
+        writer.write_all(grids)
+    report = verify_file(tmp_path / "boards.mswp", batch_size=8)
+    assert isinstance(report, VerifyReport) and report.checked == 30 and report.indices == [17]